@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+
+import numpy as np
+
+from app.exceptions.ability_exceptions import InvalidDiceExpressionException
+
+MAX_DICE_COUNT = 100
+MAX_DICE_SIDES = 1000
+# Bounds the width of the exact distribution, and with it the cost of computing it
+MAX_DISTRIBUTION_SIZE = 10_000
+MAX_MODIFIER = 1_000_000
+MAX_EXPRESSION_LENGTH = 100
+MAX_ROLL_COUNT = 100_000
+DISTRIBUTION_CACHE_SIZE = 256
+
+TERM_PATTERN = re.compile(r"([+-])(?:(\d*)d(\d+)|(\d+))")
+EXPRESSION_PATTERN = re.compile(r"(?:[+-](?:\d*d\d+|\d+))+")
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """Parsed dice expression: signed dice counts per die size and a flat modifier.
+
+    Added and subtracted dice of the same size are kept as separate terms, since
+    ``1d4-1d4`` is a distribution and not the constant 0.
+    """
+
+    dice: tuple[tuple[int, int], ...]
+    modifier: int
+
+    @property
+    def normalized(self) -> str:
+        """Canonical text form, e.g. ``"2d6+1d4+3"``."""
+        parts = [f"{'-' if count < 0 else '+'}{abs(count)}d{sides}" for sides, count in self.dice]
+        if self.modifier or not parts:
+            parts.append(f"{'-' if self.modifier < 0 else '+'}{abs(self.modifier)}")
+        return "".join(parts).lstrip("+")
+
+
+@dataclass(frozen=True)
+class DiceDistribution:
+    """Exact probability distribution of a dice expression."""
+
+    expression: str
+    min_value: int
+    probabilities: np.ndarray
+
+    @property
+    def max_value(self) -> int:
+        return self.min_value + len(self.probabilities) - 1
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.arange(self.min_value, self.max_value + 1)
+
+    @property
+    def mean(self) -> float:
+        return float(np.dot(self.values, self.probabilities))
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(np.dot((self.values - self.mean) ** 2, self.probabilities)))
+
+    def percentile(self, q: float) -> int:
+        """Smallest value whose cumulative probability reaches ``q`` (0..100)."""
+        cumulative = np.cumsum(self.probabilities)
+        index = int(np.searchsorted(cumulative, q / 100 - 1e-12))
+        return self.min_value + min(index, len(self.probabilities) - 1)
+
+    def probability_at_least(self, value: int) -> float:
+        """Probability that a roll is greater than or equal to ``value``."""
+        offset = value - self.min_value
+        if offset <= 0:
+            return 1.0
+        return float(self.probabilities[offset:].sum())
+
+
+def parse_dice_expression(expression: str) -> DiceExpression:
+    """Parse expressions such as ``"2d6+3"`` or ``"1d8 + 1d6 - 1"``."""
+    compact = re.sub(r"\s+", "", expression or "").lower()
+    if not compact:
+        raise InvalidDiceExpressionException(expression, "Expression is empty")
+    if len(compact) > MAX_EXPRESSION_LENGTH:
+        raise InvalidDiceExpressionException(
+            expression, f"Expression is longer than {MAX_EXPRESSION_LENGTH} characters"
+        )
+
+    if compact[0] not in "+-":
+        compact = f"+{compact}"
+    if not EXPRESSION_PATTERN.fullmatch(compact):
+        raise InvalidDiceExpressionException(expression, "Expected terms like NdM or integers joined by + or -")
+
+    dice: dict[tuple[int, int], int] = {}
+    modifier = 0
+    for sign, count, sides, constant in TERM_PATTERN.findall(compact):
+        factor = -1 if sign == "-" else 1
+        if constant:
+            if len(constant) > len(str(MAX_MODIFIER)) or int(constant) > MAX_MODIFIER:
+                raise InvalidDiceExpressionException(expression, f"Modifiers cannot exceed {MAX_MODIFIER}")
+            modifier += factor * int(constant)
+            continue
+
+        dice_count = int(count) if count else 1
+        dice_sides = int(sides)
+        if dice_count < 1 or dice_sides < 1:
+            raise InvalidDiceExpressionException(expression, "Dice count and sides must be positive")
+        if dice_sides > MAX_DICE_SIDES:
+            raise InvalidDiceExpressionException(expression, f"Dice cannot have more than {MAX_DICE_SIDES} sides")
+        dice[(dice_sides, factor)] = dice.get((dice_sides, factor), 0) + dice_count
+
+    terms = tuple(sorted(((sides, factor * count) for (sides, factor), count in dice.items()), reverse=True))
+    if sum(abs(count) for _, count in terms) > MAX_DICE_COUNT:
+        raise InvalidDiceExpressionException(expression, f"Expression cannot roll more than {MAX_DICE_COUNT} dice")
+    if sum(abs(count) * (sides - 1) for sides, count in terms) + 1 > MAX_DISTRIBUTION_SIZE:
+        raise InvalidDiceExpressionException(
+            expression, f"Expression cannot have more than {MAX_DISTRIBUTION_SIZE} possible results"
+        )
+    if abs(modifier) > MAX_MODIFIER:
+        raise InvalidDiceExpressionException(expression, f"Modifiers cannot exceed {MAX_MODIFIER}")
+
+    return DiceExpression(dice=terms, modifier=modifier)
+
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def _distribution_for(normalized: str) -> DiceDistribution:
+    parsed = parse_dice_expression(normalized)
+    probabilities = np.ones(1)
+    min_value = parsed.modifier
+
+    for sides, count in parsed.dice:
+        die = np.full(sides, 1.0 / sides)
+        term = np.ones(1)
+        for _ in range(abs(count)):
+            term = np.convolve(term, die)
+
+        probabilities = np.convolve(probabilities, term if count > 0 else term[::-1])
+        min_value += count if count > 0 else count * sides
+
+    probabilities = np.ascontiguousarray(probabilities)
+    probabilities.setflags(write=False)
+    return DiceDistribution(expression=normalized, min_value=min_value, probabilities=probabilities)
+
+
+def get_distribution(expression: str) -> DiceDistribution:
+    """Exact distribution of an expression, memoized per normalized form."""
+    return _distribution_for(parse_dice_expression(expression).normalized)
+
+
+def distribution_cache_info():
+    """Hit/miss statistics of the distribution cache."""
+    return _distribution_for.cache_info()
+
+
+def roll_dice(expression: str, count: int, rng: np.random.Generator | None = None) -> np.ndarray:
+    """Roll an expression ``count`` times at once."""
+    if count < 1 or count > MAX_ROLL_COUNT:
+        raise InvalidDiceExpressionException(expression, f"Roll count must be between 1 and {MAX_ROLL_COUNT}")
+
+    parsed = parse_dice_expression(expression)
+    rng = rng or np.random.default_rng()
+    totals = np.full(count, parsed.modifier, dtype=np.int64)
+
+    for sides, dice_count in parsed.dice:
+        rolls = rng.integers(1, sides + 1, size=(count, abs(dice_count)), dtype=np.int64).sum(axis=1)
+        totals += rolls if dice_count > 0 else -rolls
+
+    return totals
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Query
+
+from app.abilities.dice import MAX_EXPRESSION_LENGTH
+from app.abilities.schemas import AbilityDamageStatsResponse, DiceRollRequest, DiceRollResponse, DiceStatsResponse
+from app.core.dependencies import AbilityServiceDep
+
+router = APIRouter()
+
+
+@router.get("/dice/stats", response_model=DiceStatsResponse)
+def get_dice_stats(
+    ability_service: AbilityServiceDep,
+    expression: str = Query(..., max_length=MAX_EXPRESSION_LENGTH, description="Dice expression, e.g. 2d6+3"),
+    include_distribution: bool = Query(False, description="Include the full probability distribution"),
+):
+    """Get exact statistics of a dice expression."""
+    return ability_service.get_dice_stats(expression, include_distribution)
+
+
+@router.post("/dice/roll", response_model=DiceRollResponse)
+def roll_dice(request: DiceRollRequest, ability_service: AbilityServiceDep):
+    """Roll a dice expression many times at once."""
+    return ability_service.roll(request.expression, request.count)
+
+
+@router.get("/{ability_id}/stats", response_model=AbilityDamageStatsResponse)
+def get_ability_damage_stats(
+    ability_id: int,
+    ability_service: AbilityServiceDep,
+    include_distribution: bool = Query(False, description="Include the full probability distribution"),
+):
+    """Get exact damage statistics of an ability."""
+    return ability_service.get_ability_damage_stats(ability_id, include_distribution)
@@ -0,0 +1,30 @@
+from sqlalchemy.orm import Session
+
+from app.core.cache import CachedRepositoryMixin
+from app.core.repository import BaseRepository
+from app.models import Ability, EntityAbility
+
+
+class AbilityRepository(CachedRepositoryMixin, BaseRepository[Ability]):
+    """Repository for working with Ability in the database"""
+
+    def __init__(self, db: Session):
+        super().__init__(Ability, db)
+
+    def get_by_ids(self, ability_ids: list[int]) -> list[Ability]:
+        """Obtaining abilities by a list of IDs."""
+        return self.db.query(Ability).filter(Ability.id.in_(ability_ids)).all()
+
+    def get_damage_abilities_for_characters(self, character_ids: list[int]) -> list[tuple[int, Ability]]:
+        """Obtaining (character_id, ability) pairs for damaging abilities attached to characters."""
+        rows = (
+            self.db.query(EntityAbility.entity_id, Ability)
+            .join(Ability, Ability.id == EntityAbility.ability_id)
+            .filter(
+                EntityAbility.entity_type == "character",
+                EntityAbility.entity_id.in_(character_ids),
+                Ability.damage_dice.isnot(None),
+            )
+            .all()
+        )
+        return [(character_id, ability) for character_id, ability in rows]
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field
+
+from app.abilities.dice import MAX_EXPRESSION_LENGTH, MAX_ROLL_COUNT
+
+
+class DiceProbability(BaseModel):
+    """Probability of a single total"""
+
+    value: int = Field(..., description="Rolled total")
+    probability: float = Field(..., description="Exact probability of the total")
+
+
+class DiceStatsResponse(BaseModel):
+    """Schema for exact statistics of a dice expression"""
+
+    expression: str = Field(..., description="Normalized dice expression", examples=["2d6+3"])
+    min: int = Field(..., description="Minimum possible total")
+    max: int = Field(..., description="Maximum possible total")
+    mean: float = Field(..., description="Expected value")
+    std: float = Field(..., description="Standard deviation")
+    percentiles: dict[str, int] = Field(..., description="Percentiles of the total (p10..p90)")
+    distribution: list[DiceProbability] | None = Field(None, description="Full probability distribution")
+
+
+class AbilityDamageStatsResponse(DiceStatsResponse):
+    """Schema for damage statistics of an ability"""
+
+    ability_id: int = Field(..., description="Ability identifier")
+    damage_type: str | None = Field(None, description="Damage type of the ability")
+
+
+class DiceRollRequest(BaseModel):
+    """Schema for rolling a dice expression many times"""
+
+    expression: str = Field(..., max_length=MAX_EXPRESSION_LENGTH, description="Dice expression", examples=["2d6+3"])
+    count: int = Field(1, ge=1, le=MAX_ROLL_COUNT, description="Number of rolls")
+
+
+class DiceRollResponse(BaseModel):
+    """Schema for batch roll results"""
+
+    expression: str = Field(..., description="Normalized dice expression")
+    rolls: list[int] = Field(..., description="Rolled totals")
+    mean: float = Field(..., description="Mean of the rolled totals")
@@ -0,0 +1,75 @@
+from sqlalchemy.orm import Session
+
+from app.abilities.dice import DiceDistribution, get_distribution, parse_dice_expression, roll_dice
+from app.abilities.repository import AbilityRepository
+from app.abilities.schemas import (
+    AbilityDamageStatsResponse,
+    DiceProbability,
+    DiceRollResponse,
+    DiceStatsResponse,
+)
+from app.exceptions.ability_exceptions import AbilityNotFoundException, AbilityWithoutDamageException
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def build_stats(distribution: DiceDistribution, include_distribution: bool = False) -> dict:
+    """Build a response payload from a dice distribution."""
+    stats = {
+        "expression": distribution.expression,
+        "min": distribution.min_value,
+        "max": distribution.max_value,
+        "mean": round(distribution.mean, 4),
+        "std": round(distribution.std, 4),
+        "percentiles": {f"p{q}": distribution.percentile(q) for q in PERCENTILES},
+    }
+
+    if include_distribution:
+        stats["distribution"] = [
+            DiceProbability(value=value, probability=probability)
+            for value, probability in zip(
+                distribution.values.tolist(), distribution.probabilities.tolist(), strict=True
+            )
+            if probability > 0
+        ]
+
+    return stats
+
+
+class AbilityService:
+    """Service for working with abilities"""
+
+    def __init__(self, db: Session):
+        self.repository = AbilityRepository(db)
+
+    def get_ability_damage_stats(
+        self, ability_id: int, include_distribution: bool = False
+    ) -> AbilityDamageStatsResponse:
+        """Obtaining exact damage statistics of an ability."""
+        ability = self.repository.get_by_id(ability_id)
+        if ability is None:
+            raise AbilityNotFoundException(ability_id)
+        if not ability.damage_dice:
+            raise AbilityWithoutDamageException(ability_id)
+
+        distribution = get_distribution(str(ability.damage_dice))
+        return AbilityDamageStatsResponse(
+            ability_id=ability_id,
+            damage_type=ability.damage_type,
+            **build_stats(distribution, include_distribution),
+        )
+
+    @staticmethod
+    def get_dice_stats(expression: str, include_distribution: bool = False) -> DiceStatsResponse:
+        """Obtaining exact statistics of an arbitrary dice expression."""
+        return DiceStatsResponse(**build_stats(get_distribution(expression), include_distribution))
+
+    @staticmethod
+    def roll(expression: str, count: int) -> DiceRollResponse:
+        """Rolling a dice expression many times at once."""
+        rolls = roll_dice(expression, count)
+        return DiceRollResponse(
+            expression=parse_dice_expression(expression).normalized,
+            rolls=rolls.tolist(),
+            mean=round(float(rolls.mean()), 4),
+        )
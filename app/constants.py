@@ -149,6 +149,11 @@ ABILITY_CATEGORIES = ["racial", "class", "spell", "feat", "item", "condition", "
 
 ENTITY_TYPES = ["character", "race", "class", "faction", "location", "item"]
 
+# Entities linked in the entity_relations adjacency table
+RELATION_ENTITY_TYPES = ["article", "character", "location", "faction", "race", "user"]
+# Served by the public related-entities endpoint; users and who plays which character stay behind /users
+PUBLIC_RELATION_ENTITY_TYPES = [entity_type for entity_type in RELATION_ENTITY_TYPES if entity_type != "user"]
+
 CLASS_TYPES = [
     "боец",
     "маг",
@@ -0,0 +1,291 @@
+"""Two-tier caching of repository reads for rarely changing reference data.
+
+Repositories opt in with ``CachedRepositoryMixin``. Reads go to a bounded
+in-process LRU (L1) first, then to Redis (L2), then to Postgres; misses are
+cached too, for a shorter time. Entries are cached as column values, not ORM
+instances, and merged into the caller's session on a hit, so the returned
+objects behave like freshly loaded ones (including for updates and deletes).
+
+Changes made through the repository delete the row's L2 entries and publish
+an invalidation event that evicts the L1 entries of every worker. Single-row
+entries are evicted per row; query entries (lookups by other columns, lists)
+whenever any row of the table changes. L1 is only used while the worker is
+subscribed to invalidation events.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import date, datetime
+from datetime import time as dt_time
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from redis import Redis
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.db_routing import route_to
+from app.core.metrics import REPOSITORY_CACHE_REQUESTS
+from app.settings import settings
+
+if TYPE_CHECKING:
+    from app.core.repository import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+_NOT_FOUND = object()
+
+Row = tuple[Any, ...]
+
+_caches: dict[str, "RepositoryCache"] = {}
+_caches_lock = threading.Lock()
+_redis: Redis | None = None
+
+
+class LRUCache:
+    """Thread-safe LRU cache with a size bound and per-entry expiry."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """The cached value, or ``_NOT_FOUND`` when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _NOT_FOUND
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return _NOT_FOUND
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RepositoryCache:
+    """L1 and L2 entries of one repository, kept in sync through the invalidation bus."""
+
+    def __init__(self, name: str, model: Any):
+        self.name = name
+        self.table = model.__tablename__
+        self.attributes = [(attribute.key, attribute.columns[0]) for attribute in inspect(model).column_attrs]
+        self.l1 = LRUCache(settings.CACHE_L1_MAX_SIZE, settings.CACHE_L1_TTL)
+        # Entries written by code with other columns must not be read back after a deploy
+        columns = ",".join(f"{column.name}:{column.type}" for _, column in self.attributes)
+        fingerprint = hashlib.blake2b(columns.encode(), digest_size=4).hexdigest()
+        self.l2_prefix = f"cache:{self.table}:{fingerprint}"
+
+    def evict(self, table: str, row_id: int) -> None:
+        if table == self.table:
+            self.l1.discard(lambda key: key == ("row", row_id) or (isinstance(key, tuple) and key[0] == "query"))
+
+    def clear(self) -> None:
+        self.l1.clear()
+
+    def l2_key(self, key: tuple) -> tuple[str, str | None]:
+        """Single rows are plain keys; query entries are fields of one hash per table, deleted together."""
+        if key[0] == "row":
+            return f"{self.l2_prefix}:row:{key[1]}", None
+        return f"{self.l2_prefix}:queries", ":".join(str(part) for part in key[1:])
+
+    def l2_get(self, key: tuple) -> str | None:
+        name, field = self.l2_key(key)
+        try:
+            redis = get_redis()
+            # The blocking client returns values directly; its stubs also cover the asyncio one
+            return cast(str | None, redis.get(name) if field is None else redis.hget(name, field))
+        except Exception as e:
+            logger.warning("Cache read from Redis failed for %s: %s", self.name, e, extra={"repository": self.name})
+            return None
+
+    def l2_set(self, key: tuple, payload: str, ttl: float) -> None:
+        name, field = self.l2_key(key)
+        try:
+            redis = get_redis()
+            if field is None:
+                redis.set(name, payload, ex=max(int(ttl), 1))
+            else:
+                with redis.pipeline(transaction=False) as pipeline:
+                    pipeline.hset(name, field, payload)
+                    pipeline.expire(name, max(int(ttl), 1))
+                    pipeline.execute()
+        except Exception as e:
+            logger.warning("Cache write to Redis failed for %s: %s", self.name, e, extra={"repository": self.name})
+
+    def l2_invalidate(self, row_id: int) -> None:
+        try:
+            get_redis().delete(self.l2_key(("row", row_id))[0], f"{self.l2_prefix}:queries")
+        except Exception as e:
+            logger.warning(
+                "Cache invalidation in Redis failed for %s: %s", self.name, e, extra={"repository": self.name}
+            )
+
+    def dump(self, result: Any, many: bool) -> Row | list[Row] | None:
+        if many:
+            return [self._dump_row(obj) for obj in result]
+        return None if result is None else self._dump_row(result)
+
+    def _dump_row(self, obj: Any) -> Row:
+        return tuple(getattr(obj, key) for key, _ in self.attributes)
+
+    def encode(self, value: Row | list[Row] | None) -> str:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_encode_value)
+
+    def decode(self, payload: str, many: bool) -> Row | list[Row] | None:
+        value = json.loads(payload)
+        if many:
+            return [self._decode_row(row) for row in value]
+        return None if value is None else self._decode_row(value)
+
+    def _decode_row(self, values: list[Any]) -> Row:
+        return tuple(
+            _decode_value(column.type.python_type, value) if isinstance(value, str) else value
+            for (_, column), value in zip(self.attributes, values, strict=True)
+        )
+
+
+def _encode_value(value: Any) -> str:
+    if isinstance(value, date | dt_time):
+        return value.isoformat()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_value(python_type: type, value: str) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is dt_time:
+        return dt_time.fromisoformat(value)
+    return value
+
+
+def get_redis() -> Redis:
+    """Blocking Redis client for L2, as repositories run in threadpool threads."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            settings.REDIS_URL, decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+    return _redis
+
+
+def get_repository_cache(name: str, model: Any) -> RepositoryCache:
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(name)
+            if cache is None:
+                cache = _caches[name] = RepositoryCache(name, model)
+                settings.invalidation_bus.register(cache)
+    return cache
+
+
+if TYPE_CHECKING:
+    # Typed as the repository it is mixed into, so calls through super() resolve
+    _RepositoryBase = BaseRepository[Any]
+else:
+    _RepositoryBase = object
+
+
+class CachedRepositoryMixin(_RepositoryBase):
+    """Caches ``get_by_id`` of a ``BaseRepository``; subclasses cache other reads with ``cached_one``/``cached_all``.
+
+    Only use it for tables changed through the repository: other writes are
+    not seen until the entries expire.
+    """
+
+    @property
+    def cache(self) -> RepositoryCache:
+        return get_repository_cache(type(self).__name__, self.model)
+
+    def get_by_id(self, model_id: int):
+        return self._cached(("row", model_id), model_id, lambda: super(CachedRepositoryMixin, self).get_by_id(model_id))
+
+    def cached_one(self, name: str, *args: Hashable, loader: Callable[[], Any]):
+        """Cache a lookup returning one row or None, invalidated when any row of the table changes."""
+        return self._cached(("query", name, *args), None, loader)
+
+    def cached_all(self, name: str, *args: Hashable, loader: Callable[[], list[Any]]) -> list[Any]:
+        """Cache a query returning a list of rows, invalidated when any row of the table changes."""
+        return self._cached(("query", name, *args), None, loader, many=True)
+
+    def _publish_change(self, model_id: Any) -> None:
+        # Redis first, so workers evicting L1 on the event do not read the old row back from L2, and again after,
+        # as a reader that loaded the old row before the commit may have stored it in between
+        self.cache.l2_invalidate(int(model_id))
+        super()._publish_change(model_id)
+        self.cache.l2_invalidate(int(model_id))
+
+    def _cached(self, key: tuple, row_id: int | None, loader: Callable[[], Any], many: bool = False):
+        cache = self.cache
+        bus = settings.invalidation_bus
+
+        if bus.connected:
+            value = cache.l1.get(key)
+            if value is not _NOT_FOUND:
+                self._record("l1", "hit")
+                return self._rehydrate(value, many)
+        self._record("l1", "miss")
+
+        # Taken before reading, so a change committed meanwhile keeps the old value out of the cache
+        token = bus.token(cache.table, row_id)
+        payload = cache.l2_get(key)
+        if payload is not None:
+            self._record("l2", "hit")
+            value = cache.decode(payload, many)
+            result = self._rehydrate(value, many)
+        else:
+            self._record("l2", "miss")
+            # A lagging replica would serve rows older than the invalidation that emptied the cache
+            with route_to("primary"):
+                result = loader()
+            value = cache.dump(result, many)
+
+        if bus.is_current(cache.table, row_id, token):
+            ttl = settings.CACHE_NEGATIVE_TTL if value is None else settings.CACHE_L2_TTL
+            cache.l1.set(key, value, ttl=min(ttl, settings.CACHE_L1_TTL))
+            if payload is None:
+                cache.l2_set(key, cache.encode(value), ttl)
+        return result
+
+    def _rehydrate(self, value: Row | list[Row] | None, many: bool):
+        if many:
+            return [self._merge(row) for row in value]  # type: ignore[union-attr]
+        return None if value is None else self._merge(value)  # type: ignore[arg-type]
+
+    def _merge(self, row: Row):
+        obj = self.model(
+            **{key: column_value for (key, _), column_value in zip(self.cache.attributes, row, strict=True)}
+        )
+        # Detached with its identity, so merging neither selects the row nor marks it as changed
+        make_transient_to_detached(obj)
+        return self.db.merge(obj, load=False)
+
+    def _record(self, tier: str, result: str) -> None:
+        REPOSITORY_CACHE_REQUESTS.labels(repository=self.cache.name, tier=tier, result=result).inc()
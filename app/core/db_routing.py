@@ -0,0 +1,188 @@
+"""Routing of read-only work to Postgres replicas.
+
+Sessions send statements to the primary unless the current context allows
+replica reads: ``ReplicaRoutingMiddleware`` allows them for GET and HEAD
+requests, and ``read_only`` allows them inside service methods that only read.
+A client that has just written is pinned to the primary for a short window so
+it reads its own writes. Replicas lagging behind (or failing the lag check)
+are skipped, falling back to the primary.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+import logging
+import random
+import re
+import threading
+import time
+from typing import Literal, ParamSpec, TypeVar
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+RoutingTarget = Literal["primary", "replica"]
+
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+# Raw SQL a replica may serve: plain SELECT/SHOW/VALUES, without row locks
+READ_ONLY_SQL = re.compile(r"^\s*(select|show|values)\b", re.IGNORECASE)
+LOCKING_SQL = re.compile(r"\bfor\s+(update|share|no\s+key\s+update|key\s+share)\b", re.IGNORECASE)
+
+
+def is_write(clause) -> bool:
+    """Whether a statement has to run on the primary: DML, or raw SQL that is not a plain read."""
+    if getattr(clause, "is_dml", False):
+        return True
+    if isinstance(clause, TextClause):
+        return not READ_ONLY_SQL.match(clause.text) or bool(LOCKING_SQL.search(clause.text))
+    return False
+
+
+@dataclass
+class WriteTracker:
+    """Whether any session wrote during the current request."""
+
+    wrote: bool = False
+
+
+# None routes to the primary; "primary" additionally overrides read_only for read-your-writes
+_routing_target: ContextVar[RoutingTarget | None] = ContextVar("database_routing_target", default=None)
+_write_tracker: ContextVar[WriteTracker | None] = ContextVar("database_write_tracker", default=None)
+
+
+def get_routing_target() -> RoutingTarget | None:
+    return _routing_target.get()
+
+
+@contextmanager
+def track_writes() -> Iterator[WriteTracker]:
+    """Record whether sessions in this context write, shared with threads started from it."""
+    tracker = WriteTracker()
+    token = _write_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _write_tracker.reset(token)
+
+
+@contextmanager
+def route_to(target: RoutingTarget | None) -> Iterator[None]:
+    """Route sessions used in this context to the primary or a replica."""
+    token = _routing_target.set(target)
+    try:
+        yield
+    finally:
+        _routing_target.reset(token)
+
+
+def read_only(func: Callable[P, R]) -> Callable[P, R]:
+    """Let a service method that only reads use a replica, unless the client is pinned to the primary."""
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if get_routing_target() == "primary":
+            return func(*args, **kwargs)
+        with route_to("replica"):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaSet:
+    """Replica engines with cached replication lag checks."""
+
+    def __init__(self, engines: list[Engine], max_lag: float, check_interval: float):
+        self.engines = engines
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lag: dict[Engine, tuple[float, float | None]] = {}
+        self._checking: set[Engine] = set()
+        self._lock = threading.Lock()
+
+    def choose(self) -> Engine | None:
+        """A random replica within the allowed lag, or None when the primary has to serve the read."""
+        if not self.engines:
+            return None
+        healthy = [engine for engine in self.engines if self.is_healthy(engine)]
+        return random.choice(healthy) if healthy else None  # nosec B311
+
+    def is_healthy(self, engine: Engine) -> bool:
+        lag = self.get_lag(engine)
+        return lag is not None and lag <= self.max_lag
+
+    def get_lag(self, engine: Engine) -> float | None:
+        """Replication lag in seconds, re-checked at most once per ``check_interval``; None if unreachable.
+
+        One thread measures a replica at a time, without holding the lock, while
+        the others keep using the last result.
+        """
+        with self._lock:
+            cached = self._lag.get(engine)
+            if cached is not None and time.monotonic() - cached[0] < self.check_interval:
+                return cached[1]
+            if engine in self._checking:
+                return cached[1] if cached is not None else None
+            self._checking.add(engine)
+
+        lag = None
+        try:
+            lag = self._measure_lag(engine)
+        finally:
+            with self._lock:
+                self._lag[engine] = (time.monotonic(), lag)
+                self._checking.discard(engine)
+        return lag
+
+    @staticmethod
+    def _measure_lag(engine: Engine) -> float | None:
+        try:
+            with engine.connect() as connection:
+                lag = float(connection.execute(REPLICA_LAG_QUERY).scalar_one())
+        except Exception as e:
+            logger.warning("Replica %s is unavailable: %s", engine.url.host, e, extra={"replica": engine.url.host})
+            return None
+
+        if lag > 0:
+            logger.debug("Replica %s lags %.3fs", engine.url.host, lag)
+        return lag
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica when the current context allows it.
+
+    Flushes and DML statements always go to the primary, and once a session has
+    written, its later reads do too.
+    """
+
+    def __init__(self, *args, replicas: ReplicaSet | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or is_write(clause):
+            self.info["wrote"] = True
+            tracker = _write_tracker.get()
+            if tracker is not None:
+                tracker.wrote = True
+            return primary
+
+        if self.replicas is None or self.info.get("wrote") or get_routing_target() != "replica":
+            return primary
+        return self.replicas.choose() or primary
@@ -5,11 +5,20 @@ from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.abilities.services import AbilityService
 from app.auth.services import AuthService
 from app.auth.utils.token_utils import verify_token
+from app.core.structured_logging import update_request_context
+from app.encounters.services import EncounterService
 from app.exceptions.auth_exceptions import AdminAccessException, SuperAdminAccessException
+from app.health.services import HealthService
+from app.profiling.services import ProfilingService
 from app.races.services import RaceService
+from app.relations.services import RelationService
 from app.settings import settings
+from app.stats.services import StatsService
+from app.tags.services import TagService
+from app.timeline.services import TimelineService
 from app.users.schemas import UserResponse
 from app.users.services import UserService
 
@@ -31,9 +40,57 @@ def get_auth_service(db: DatabaseDep) -> AuthService:
     return AuthService(db)
 
 
+def get_stats_service(db: DatabaseDep) -> StatsService:
+    """Get Stats service instance."""
+    return StatsService(db)
+
+
+def get_ability_service(db: DatabaseDep) -> AbilityService:
+    """Get Ability service instance."""
+    return AbilityService(db)
+
+
+def get_encounter_service(db: DatabaseDep) -> EncounterService:
+    """Get Encounter service instance."""
+    return EncounterService(db)
+
+
+def get_tag_service(db: DatabaseDep) -> TagService:
+    """Get Tag service instance."""
+    return TagService(db)
+
+
+def get_timeline_service(db: DatabaseDep) -> TimelineService:
+    """Get Timeline service instance."""
+    return TimelineService(db)
+
+
+def get_relation_service(db: DatabaseDep) -> RelationService:
+    """Get Relation service instance."""
+    return RelationService(db)
+
+
+def get_profiling_service() -> ProfilingService:
+    """Get Profiling service instance."""
+    return ProfilingService()
+
+
+def get_health_service() -> HealthService:
+    """Get Health service instance."""
+    return HealthService()
+
+
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 RaceServiceDep = Annotated[RaceService, Depends(get_race_service)]
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
+StatsServiceDep = Annotated[StatsService, Depends(get_stats_service)]
+AbilityServiceDep = Annotated[AbilityService, Depends(get_ability_service)]
+EncounterServiceDep = Annotated[EncounterService, Depends(get_encounter_service)]
+TagServiceDep = Annotated[TagService, Depends(get_tag_service)]
+TimelineServiceDep = Annotated[TimelineService, Depends(get_timeline_service)]
+RelationServiceDep = Annotated[RelationService, Depends(get_relation_service)]
+ProfilingServiceDep = Annotated[ProfilingService, Depends(get_profiling_service)]
+HealthServiceDep = Annotated[HealthService, Depends(get_health_service)]
 
 security = HTTPBearer(
     scheme_name="JWT Bearer",
@@ -48,7 +105,9 @@ async def get_current_user(
     token: TokenDep,
 ) -> UserResponse:
     email = await verify_token(token, "access")
-    return user_service.get_user_by_email(email)
+    user = user_service.get_user_by_email(email)
+    update_request_context(user_id=user.id)
+    return user
 
 
 def require_keeper_or_founder(
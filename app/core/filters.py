@@ -0,0 +1,195 @@
+"""Filtering and sorting of list endpoints, parsed from query strings.
+
+Filters are ``field:operator:value`` strings, one per ``filter`` query
+parameter, and ``sort`` is a comma-separated list of fields, ``-`` for
+descending: ``?filter=name:prefix:Эль&filter=size:in:Малый,Средний&sort=-name``.
+
+Operators:
+
+- ``eq``: ``size:eq:Малый``
+- ``in``: ``size:in:Малый,Средний``
+- ``range``: ``created_at:range:2024-01-01..2024-06-30``, both bounds inclusive, either may be left out
+- ``prefix``: ``name:prefix:Эль``
+- ``similar``: ``name:similar:Эльфы``, trigram similarity (``pg_trgm``'s ``%``)
+- ``is_null``: ``description:is_null:true``
+
+Each repository whitelists its fields in a ``FilterSet``, together with the
+indexes serving them: a btree index serves ``eq``, ``in``, ``range``,
+``is_null`` and sorting, a ``gin_trgm_ops`` index serves ``prefix`` and
+``similar``. Fields without a matching index may still be listed; on a table
+larger than ``max_unindexed_rows`` (the planner's estimate) they are only
+accepted next to a filter that uses an index, so a request can not make
+Postgres read the whole table.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy.orm import Query
+
+from app.exceptions.filter_exceptions import InvalidFilterException
+
+BTREE_OPERATORS = ("eq", "in", "range", "is_null")
+TRIGRAM_OPERATORS = ("prefix", "similar")
+OPERATORS = BTREE_OPERATORS + TRIGRAM_OPERATORS
+
+MAX_IN_VALUES = 100
+MAX_FILTERS = 10
+
+
+@dataclass(frozen=True)
+class FilterField:
+    """A whitelisted field, the operators it accepts and the indexes serving them."""
+
+    operators: tuple[str, ...]
+    btree: str | None = None
+    trigram: str | None = None
+    sortable: bool = False
+
+    def index_for(self, operator: str) -> str | None:
+        """The index serving ``operator`` on this field, if any."""
+        return self.btree if operator in BTREE_OPERATORS else self.trigram
+
+
+@dataclass(frozen=True)
+class Filter:
+    field: str
+    operator: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class ListQuery:
+    """Parsed filters and sort order of a list request."""
+
+    filters: tuple[Filter, ...] = ()
+    sort: tuple[tuple[str, bool], ...] = ()
+
+
+@dataclass
+class FilterSet:
+    """Fields of a model that list requests may filter and sort by; ``default_sort`` fields are listed too."""
+
+    model: Any
+    fields: dict[str, FilterField]
+    max_unindexed_rows: int = 10_000
+    default_sort: tuple[tuple[str, bool], ...] = (("id", False),)
+
+    def parse(self, filters: list[str] | None = None, sort: str | None = None) -> ListQuery:
+        """Parse ``filter`` and ``sort`` query parameters, rejecting fields and operators not whitelisted."""
+        filters = filters or []
+        if len(filters) > MAX_FILTERS:
+            raise InvalidFilterException(f"At most {MAX_FILTERS} filters are allowed", str(len(filters)))
+
+        return ListQuery(
+            filters=tuple(self._parse_filter(raw) for raw in filters),
+            sort=self._parse_sort(sort) if sort else self.default_sort,
+        )
+
+    def unindexed_fields(self, list_query: ListQuery) -> list[str]:
+        """Fields the query filters or sorts by without an index, unless another filter uses one."""
+        if any(self.fields[f.field].index_for(f.operator) for f in list_query.filters):
+            return []
+
+        unindexed = [f.field for f in list_query.filters]
+        unindexed += [name for name, _ in list_query.sort if not self.fields[name].btree]
+        return sorted(set(unindexed))
+
+    def indexed_fields(self) -> list[str]:
+        return sorted(name for name, spec in self.fields.items() if spec.btree or spec.trigram)
+
+    def apply(self, query: Query, list_query: ListQuery) -> Query:
+        """Add the filters and the sort order, with the primary key as the tie-breaker, to ``query``."""
+        for f in list_query.filters:
+            query = query.filter(self._condition(f))
+
+        order_by = [
+            getattr(self.model, name).desc() if descending else getattr(self.model, name)
+            for name, descending in list_query.sort
+        ]
+        if "id" not in (name for name, _ in list_query.sort):
+            order_by.append(self.model.id)
+        return query.order_by(*order_by)
+
+    def _parse_filter(self, raw: str) -> Filter:
+        name, _, rest = raw.partition(":")
+        operator, separator, value = rest.partition(":")
+        if not separator:
+            raise InvalidFilterException("A filter should look like field:operator:value", raw)
+
+        spec = self.fields.get(name)
+        if spec is None:
+            raise InvalidFilterException("Filtering by this field is not supported", name, sorted(self.fields))
+        if operator not in spec.operators:
+            raise InvalidFilterException(f"Unsupported operator for {name}", operator, list(spec.operators))
+
+        return Filter(name, operator, self._parse_value(name, operator, value, raw))
+
+    def _parse_value(self, name: str, operator: str, value: str, raw: str) -> Any:
+        if operator == "is_null":
+            return self._convert(bool, value, raw)
+        if operator in TRIGRAM_OPERATORS:
+            if not value:
+                raise InvalidFilterException("The value should not be empty", raw)
+            return value
+
+        python_type = self.model.__table__.c[name].type.python_type
+        if operator == "in":
+            values = value.split(",")
+            if len(values) > MAX_IN_VALUES:
+                raise InvalidFilterException(f"At most {MAX_IN_VALUES} values are allowed", raw)
+            return tuple(self._convert(python_type, item, raw) for item in values)
+        if operator == "range":
+            low, separator, high = value.partition("..")
+            if not separator or not (low or high):
+                raise InvalidFilterException("A range should look like low..high, with at least one bound", raw)
+            return (
+                self._convert(python_type, low, raw) if low else None,
+                self._convert(python_type, high, raw) if high else None,
+            )
+        return self._convert(python_type, value, raw)
+
+    @staticmethod
+    def _convert(python_type: type, value: str, raw: str) -> Any:
+        try:
+            if python_type is bool:
+                return {"true": True, "false": False}[value.lower()]
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            if python_type is date:
+                return date.fromisoformat(value)
+            return python_type(value)
+        except (KeyError, ValueError) as exc:
+            raise InvalidFilterException(f"The value should be a {python_type.__name__}", raw) from exc
+
+    def _parse_sort(self, sort: str) -> tuple[tuple[str, bool], ...]:
+        order = []
+        for item in sort.split(","):
+            name = item.removeprefix("-")
+            spec = self.fields.get(name)
+            if spec is None or not spec.sortable:
+                sortable = sorted(n for n, s in self.fields.items() if s.sortable)
+                raise InvalidFilterException("Sorting by this field is not supported", name, sortable)
+            order.append((name, item.startswith("-")))
+        return tuple(order)
+
+    def _condition(self, f: Filter):
+        column = getattr(self.model, f.field)
+        if f.operator == "eq":
+            return column == f.value
+        if f.operator == "in":
+            return column.in_(f.value)
+        if f.operator == "range":
+            low, high = f.value
+            if low is None:
+                return column <= high
+            if high is None:
+                return column >= low
+            return column.between(low, high)
+        if f.operator == "prefix":
+            escaped = f.value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return column.like(f"{escaped}%")
+        if f.operator == "similar":
+            return column.op("%")(f.value)
+        return column.is_(None) if f.value else column.is_not(None)
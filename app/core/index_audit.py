@@ -0,0 +1,431 @@
+"""Audit of duplicate, redundant, unused and missing indexes.
+
+Indexes are read either from the model metadata or from a live database
+(``pg_index`` with the scan counts of ``pg_stat_user_indexes``) and checked for:
+
+- duplicates: same table, method, columns and predicate as another index;
+- redundant: a plain btree index whose columns are a leading prefix of another
+  btree index on the same table;
+- unused: never scanned since the statistics were last reset (database only);
+- foreign keys whose columns are not the leading columns of any btree index.
+
+Indexes that back a primary key or unique constraint are never proposed for
+removal. ``render_migration`` turns the findings into an Alembic revision that
+drops and creates the indexes with ``CONCURRENTLY``, so tables stay writable.
+
+Run ``python -m app.core.index_audit`` to print the report for the database,
+``--metadata`` to audit the models instead, and ``--write-migration MESSAGE``
+to add the revision to ``migrations/versions``.
+"""
+
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import re
+import sys
+import uuid
+
+from sqlalchemy import MetaData, UniqueConstraint, text
+from sqlalchemy.engine import Connection
+
+from app.core.schema_check import MIGRATIONS_DIR
+
+FINDING_KINDS = ("duplicate", "redundant", "unused", "missing")
+# Postgres identifiers are truncated at 63 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+
+@dataclass(frozen=True)
+class IndexInfo:
+    """One index, from the metadata or from the catalog; ``columns`` holds ``None`` for expressions."""
+
+    table: str
+    name: str
+    columns: tuple[str | None, ...]
+    unique: bool = False
+    method: str = "btree"
+    predicate: str | None = None
+    constraint: bool = False
+    scans: int | None = None
+    size: int | None = None
+
+    @property
+    def droppable(self) -> bool:
+        """Whether the index can be dropped without changing constraints or query results."""
+        return not (self.unique or self.constraint)
+
+    @property
+    def plain(self) -> bool:
+        """A btree index on columns only, without predicate."""
+        return self.method == "btree" and self.predicate is None and None not in self.columns
+
+
+@dataclass(frozen=True)
+class ForeignKeyInfo:
+    table: str
+    name: str
+    columns: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class IndexFinding:
+    """A proposed change: ``drop`` an existing index or ``create`` a missing one."""
+
+    kind: str
+    index: IndexInfo
+    reason: str
+
+    @property
+    def action(self) -> str:
+        return "create" if self.kind == "missing" else "drop"
+
+
+CATALOG_INDEXES = text(
+    """
+    SELECT t.relname AS table_name,
+           i.relname AS index_name,
+           ARRAY(
+               SELECT a.attname
+               FROM unnest(x.indkey::int2[]) WITH ORDINALITY AS k(attnum, position)
+               LEFT JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = k.attnum
+               WHERE k.position <= x.indnkeyatts
+               ORDER BY k.position
+           ) AS columns,
+           x.indisunique AS is_unique,
+           am.amname AS method,
+           pg_get_expr(x.indpred, x.indrelid) AS predicate,
+           EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid) AS is_constraint,
+           s.idx_scan AS scans,
+           pg_relation_size(x.indexrelid) AS size
+    FROM pg_index x
+    JOIN pg_class i ON i.oid = x.indexrelid
+    JOIN pg_class t ON t.oid = x.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_am am ON am.oid = i.relam
+    LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = x.indexrelid
+    WHERE n.nspname = current_schema() AND t.relkind = 'r'
+    ORDER BY t.relname, i.relname
+    """
+)
+
+CATALOG_FOREIGN_KEYS = text(
+    """
+    SELECT t.relname AS table_name,
+           c.conname AS name,
+           ARRAY(
+               SELECT a.attname
+               FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, position)
+               JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+               ORDER BY k.position
+           ) AS columns
+    FROM pg_constraint c
+    JOIN pg_class t ON t.oid = c.conrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    WHERE c.contype = 'f' AND n.nspname = current_schema()
+    ORDER BY t.relname, c.conname
+    """
+)
+
+
+def load_database_indexes(connection: Connection) -> list[IndexInfo]:
+    """Indexes of the tables in the current schema, with their scan counts and sizes."""
+    return [
+        IndexInfo(
+            table=row.table_name,
+            name=row.index_name,
+            columns=tuple(row.columns),
+            unique=row.is_unique,
+            method=row.method,
+            predicate=row.predicate,
+            constraint=row.is_constraint,
+            scans=row.scans,
+            size=row.size,
+        )
+        for row in connection.execute(CATALOG_INDEXES)
+    ]
+
+
+def load_database_foreign_keys(connection: Connection) -> list[ForeignKeyInfo]:
+    return [
+        ForeignKeyInfo(table=row.table_name, name=row.name, columns=tuple(row.columns))
+        for row in connection.execute(CATALOG_FOREIGN_KEYS)
+    ]
+
+
+def load_metadata_indexes(metadata: MetaData) -> list[IndexInfo]:
+    """Indexes ``create_all`` builds: declared indexes, ``index=True`` columns and key constraints."""
+    indexes = []
+    for table in metadata.sorted_tables:
+        if table.primary_key.columns:
+            indexes.append(
+                IndexInfo(
+                    table=table.name,
+                    name=str(table.primary_key.name or f"{table.name}_pkey"),
+                    columns=tuple(column.name for column in table.primary_key.columns),
+                    unique=True,
+                    constraint=True,
+                )
+            )
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                indexes.append(
+                    IndexInfo(
+                        table=table.name,
+                        name=str(constraint.name or f"{table.name}_{'_'.join(constraint.columns.keys())}_key"),
+                        columns=tuple(column.name for column in constraint.columns),
+                        unique=True,
+                        constraint=True,
+                    )
+                )
+        for index in table.indexes:
+            where = index.dialect_options["postgresql"].get("where")
+            indexes.append(
+                IndexInfo(
+                    table=table.name,
+                    name=str(index.name),
+                    columns=tuple(getattr(expression, "name", None) for expression in index.expressions),
+                    unique=bool(index.unique),
+                    method=index.dialect_options["postgresql"].get("using") or "btree",
+                    predicate=None if where is None else str(where),
+                )
+            )
+    return indexes
+
+
+def load_metadata_foreign_keys(metadata: MetaData) -> list[ForeignKeyInfo]:
+    return [
+        ForeignKeyInfo(
+            table=table.name,
+            name=str(constraint.name or f"{table.name}_{'_'.join(constraint.column_keys)}_fkey"),
+            columns=tuple(constraint.column_keys),
+        )
+        for table in metadata.sorted_tables
+        for constraint in table.foreign_key_constraints
+    ]
+
+
+def _keep_order(index: IndexInfo) -> tuple:
+    # Constraint and unique indexes are kept first, then the explicitly named ones over ix_* defaults
+    return (not index.constraint, not index.unique, index.name.startswith("ix_"), index.name)
+
+
+def find_duplicate_indexes(indexes: list[IndexInfo]) -> list[IndexFinding]:
+    """Indexes with the same table, method, columns and predicate as an index that is kept."""
+    groups: dict[tuple, list[IndexInfo]] = {}
+    for index in indexes:
+        if None not in index.columns:
+            groups.setdefault((index.table, index.method, index.columns, index.predicate), []).append(index)
+
+    findings: list[IndexFinding] = []
+    for group in groups.values():
+        kept, *others = sorted(group, key=_keep_order)
+        findings.extend(
+            IndexFinding("duplicate", index, f"same definition as {kept.name}") for index in others if index.droppable
+        )
+    return findings
+
+
+def find_redundant_indexes(indexes: list[IndexInfo]) -> list[IndexFinding]:
+    """Plain btree indexes whose columns lead a longer btree index on the same table."""
+    findings = []
+    for index in indexes:
+        if not index.droppable or not index.plain:
+            continue
+        covering = sorted(
+            (
+                other
+                for other in indexes
+                if other.table == index.table
+                and other.plain
+                and len(other.columns) > len(index.columns)
+                and other.columns[: len(index.columns)] == index.columns
+            ),
+            key=lambda other: (-len(other.columns), other.name),
+        )
+        if covering:
+            findings.append(IndexFinding("redundant", index, f"prefix of {covering[0].name}"))
+    return findings
+
+
+def _supports(index: IndexInfo, foreign_key: ForeignKeyInfo) -> bool:
+    width = len(foreign_key.columns)
+    return (
+        index.table == foreign_key.table
+        and index.method == "btree"
+        and index.predicate is None
+        and set(index.columns[:width]) == set(foreign_key.columns)
+    )
+
+
+def find_unused_indexes(indexes: list[IndexInfo], foreign_keys: list[ForeignKeyInfo]) -> list[IndexFinding]:
+    """Droppable indexes never scanned since the statistics were last reset.
+
+    Indexes on foreign key columns are kept: deleting a referenced row needs
+    them even when nothing has been deleted since the reset.
+    """
+    return [
+        IndexFinding("unused", index, "never scanned")
+        for index in indexes
+        if index.scans == 0
+        and index.droppable
+        and not any(_supports(index, foreign_key) for foreign_key in foreign_keys)
+    ]
+
+
+def find_unindexed_foreign_keys(indexes: list[IndexInfo], foreign_keys: list[ForeignKeyInfo]) -> list[IndexFinding]:
+    """Foreign keys that deletes and joins on the referenced table have to check with a sequential scan."""
+    findings = []
+    for foreign_key in foreign_keys:
+        if any(_supports(index, foreign_key) for index in indexes):
+            continue
+        name = f"idx_{foreign_key.table}_{'_'.join(foreign_key.columns)}"[:MAX_IDENTIFIER_LENGTH]
+        findings.append(
+            IndexFinding(
+                "missing", IndexInfo(foreign_key.table, name, foreign_key.columns), f"foreign key {foreign_key.name}"
+            )
+        )
+    return findings
+
+
+def audit_indexes(indexes: list[IndexInfo], foreign_keys: list[ForeignKeyInfo]) -> list[IndexFinding]:
+    """All findings, reporting each index once under its most specific reason."""
+    findings = []
+    reported: set[tuple[str, str]] = set()
+    for finding in [
+        *find_duplicate_indexes(indexes),
+        *find_redundant_indexes(indexes),
+        *find_unused_indexes(indexes, foreign_keys),
+        *find_unindexed_foreign_keys(indexes, foreign_keys),
+    ]:
+        key = (finding.index.table, finding.index.name)
+        if key not in reported:
+            reported.add(key)
+            findings.append(finding)
+    return sorted(
+        findings, key=lambda finding: (FINDING_KINDS.index(finding.kind), finding.index.table, finding.index.name)
+    )
+
+
+def format_report(findings: list[IndexFinding]) -> str:
+    if not findings:
+        return "No index findings."
+    lines = []
+    for finding in findings:
+        index = finding.index
+        size = "" if index.size is None else f", {index.size // 1024} kB"
+        lines.append(
+            f"{finding.kind:<10} {finding.action} {index.table}.{index.name} ({', '.join(map(str, index.columns))})"
+            f": {finding.reason}{size}"
+        )
+    return "\n".join(lines)
+
+
+def _create_index(index: IndexInfo) -> str:
+    options = [f"unique={index.unique}"]
+    if index.method != "btree":
+        options.append(f'postgresql_using="{index.method}"')
+    columns = ", ".join(f'"{column}"' for column in index.columns)
+    return (
+        f'op.create_index("{index.name}", "{index.table}", [{columns}], '
+        f"{', '.join(options)}, postgresql_concurrently=True, if_not_exists=True)"
+    )
+
+
+def _drop_index(index: IndexInfo) -> str:
+    return f'op.drop_index("{index.name}", table_name="{index.table}", postgresql_concurrently=True, if_exists=True)'
+
+
+def render_migration(findings: list[IndexFinding], message: str, revision: str, down_revision: str) -> str:
+    """Alembic revision applying the findings, outside a transaction as ``CONCURRENTLY`` requires.
+
+    Expression and partial indexes are left out, their definitions cannot be
+    recreated from the report.
+    """
+    applicable = [finding for finding in findings if None not in finding.index.columns and not finding.index.predicate]
+    upgrade = [
+        _create_index(finding.index) if finding.action == "create" else _drop_index(finding.index)
+        for finding in applicable
+    ]
+    downgrade = [
+        _drop_index(finding.index) if finding.action == "create" else _create_index(finding.index)
+        for finding in reversed(applicable)
+    ]
+
+    def body(statements: list[str]) -> str:
+        if not statements:
+            return "    pass"
+        lines = ["    with op.get_context().autocommit_block():"]
+        lines.extend(f"        {statement}" for statement in statements)
+        return "\n".join(lines)
+
+    return f'''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision}
+Create Date: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")}
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "{revision}"
+down_revision: Union[str, None] = "{down_revision}"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+{body(upgrade)}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+{body(downgrade)}
+'''
+
+
+def write_migration(findings: list[IndexFinding], message: str) -> str:
+    """Add a revision on top of the current head to ``migrations/versions``; returns its path."""
+    from app.core.schema_check import get_expected_heads
+
+    (down_revision,) = get_expected_heads()
+    revision = uuid.uuid4().hex[:12]
+    slug = re.sub(r"\W+", "_", message.lower()).strip("_")
+    path = MIGRATIONS_DIR / "versions" / f"{revision}_{slug}.py"
+    path.write_text(render_migration(findings, message, revision, down_revision))
+    return str(path)
+
+
+def main(argv: list[str]) -> int:
+    from app import models  # noqa: F401
+    from app.settings import settings
+
+    parser = argparse.ArgumentParser(prog="python -m app.core.index_audit", description=__doc__.splitlines()[0])
+    parser.add_argument("--metadata", action="store_true", help="audit the model metadata instead of the database")
+    parser.add_argument("--skip-unused", action="store_true", help="do not report indexes that were never scanned")
+    parser.add_argument("--write-migration", metavar="MESSAGE", help="write a revision applying the findings")
+    args = parser.parse_args(argv)
+
+    if args.metadata:
+        indexes = load_metadata_indexes(settings.Base.metadata)
+        foreign_keys = load_metadata_foreign_keys(settings.Base.metadata)
+    else:
+        with settings.engine.connect() as connection:
+            indexes = load_database_indexes(connection)
+            foreign_keys = load_database_foreign_keys(connection)
+    findings = audit_indexes(indexes, foreign_keys)
+    if args.skip_unused:
+        findings = [finding for finding in findings if finding.kind != "unused"]
+
+    print(format_report(findings))
+    if args.write_migration and findings:
+        print(f"Wrote {write_migration(findings, args.write_migration)}")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
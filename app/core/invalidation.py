@@ -0,0 +1,222 @@
+"""Cross-worker invalidation of in-process caches over Redis pub/sub.
+
+Repositories publish a compact ``table:id:version`` event after committing a
+change to a row. Every worker subscribes in its lifespan and evicts the row
+from its local caches. Versions come from a per-table Redis hash incremented
+together with the publish, so each row's events are totally ordered; a worker
+ignores events older than the newest version it has seen for that row.
+
+Pub/sub does not redeliver events missed while disconnected, so a worker
+flushes all local caches whenever it (re)subscribes and does not let caches
+store new entries while it is not subscribed.
+"""
+
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+import threading
+from typing import Protocol
+
+from redis import Redis
+from redis.commands.core import Script
+
+from app.core.metrics import InstrumentedRedis
+
+logger = logging.getLogger(__name__)
+
+# Increments the row's version and publishes the event in one round trip, returning the new version
+PUBLISH_SCRIPT = """
+local version = redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+redis.call('PUBLISH', ARGV[3], ARGV[1] .. ':' .. ARGV[2] .. ':' .. version)
+return version
+"""
+VERSIONS_KEY = "cache:versions:{table}"
+
+
+class LocalCache(Protocol):
+    """In-process cache that the bus keeps in sync with changes made by any worker."""
+
+    def evict(self, table: str, row_id: int) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class InvalidationEvent:
+    table: str
+    row_id: int
+    version: int
+
+    def encode(self) -> str:
+        return f"{self.table}:{self.row_id}:{self.version}"
+
+    @classmethod
+    def decode(cls, message: str | bytes) -> "InvalidationEvent":
+        if isinstance(message, bytes):
+            message = message.decode()
+        table, row_id, version = message.rsplit(":", 2)
+        return cls(table, int(row_id), int(version))
+
+
+@dataclass(frozen=True)
+class CacheToken:
+    """Snapshot of a row's invalidation state, taken before reading it from the database."""
+
+    generation: int
+    version: int
+
+
+class InvalidationBus:
+    """Publishes row changes and applies the changes published by every worker to local caches."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        channel: str,
+        *,
+        reconnect_delay: float = 1.0,
+        max_tracked_versions: int = 100_000,
+    ):
+        self.redis_url = redis_url
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_tracked_versions = max_tracked_versions
+        self.connected = False
+        # Incremented on every full flush; tokens from an older generation are stale
+        self.generation = 0
+        self._versions: OrderedDict[tuple[str, int], int] = OrderedDict()
+        # Events applied per table, local to this worker
+        self._table_versions: dict[str, int] = {}
+        self._caches: list[LocalCache] = []
+        self._lock = threading.Lock()
+        self._publisher: Redis | None = None
+        self._publish_script: Script | None = None
+
+    def register(self, cache: LocalCache) -> None:
+        with self._lock:
+            self._caches.append(cache)
+
+    def unregister(self, cache: LocalCache) -> None:
+        with self._lock:
+            if cache in self._caches:
+                self._caches.remove(cache)
+
+    def token(self, table: str, row_id: int | None = None) -> CacheToken:
+        """Invalidation state of a row, or of the whole table (any row changing) when ``row_id`` is None."""
+        with self._lock:
+            if row_id is None:
+                return CacheToken(self.generation, self._table_versions.get(table, 0))
+            return CacheToken(self.generation, self._versions.get((table, row_id), 0))
+
+    def is_current(self, table: str, row_id: int | None, token: CacheToken) -> bool:
+        """Whether a value read after taking ``token`` may still be cached: no change or flush happened since."""
+        return self.connected and self.token(table, row_id) == token
+
+    def publish(self, table: str, row_id: int) -> None:
+        """Announce a committed change of a row, evicting it from this worker's caches right away.
+
+        Failures are logged, not raised: the change is already committed, and
+        other workers' caches expire the row after their TTL. This worker's
+        caches are flushed, as a concurrent read may have stored the old row.
+        """
+        self.evict(table, row_id)
+        try:
+            version = int(
+                self._get_publish_script()(keys=[VERSIONS_KEY.format(table=table)], args=[table, row_id, self.channel])
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to publish invalidation of %s %s: %s",
+                table,
+                row_id,
+                e,
+                extra={"table": table, "row_id": row_id},
+            )
+            self.flush()
+            return
+        if not self.apply(InvalidationEvent(table, row_id, version)):
+            # Redis lost the version counters (flushed or restarted); versions seen so far no longer compare
+            self.flush()
+
+    def apply(self, event: InvalidationEvent) -> bool:
+        """Evict the row unless a newer version of it was already applied. Returns whether it was applied."""
+        key = (event.table, event.row_id)
+        with self._lock:
+            if self._versions.get(key, 0) >= event.version:
+                return False
+            self._versions[key] = event.version
+            self._versions.move_to_end(key)
+            self._table_versions[event.table] = self._table_versions.get(event.table, 0) + 1
+            # Forgetting a version is safe: an older event then only causes an extra eviction
+            while len(self._versions) > self.max_tracked_versions:
+                self._versions.popitem(last=False)
+        self.evict(event.table, event.row_id)
+        return True
+
+    def evict(self, table: str, row_id: int) -> None:
+        for cache in list(self._caches):
+            cache.evict(table, row_id)
+
+    def flush(self) -> None:
+        """Clear every local cache, e.g. after events may have been missed."""
+        with self._lock:
+            self.generation += 1
+            self._versions.clear()
+            self._table_versions.clear()
+        for cache in list(self._caches):
+            cache.clear()
+
+    async def listen(self) -> None:
+        """Apply published events until cancelled, resubscribing (and flushing) after connection errors."""
+        while True:
+            try:
+                redis = InstrumentedRedis.from_url(self.redis_url, decode_responses=True, socket_keepalive=True)
+                try:
+                    async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                        await pubsub.subscribe(self.channel)
+                        self.flush()
+                        self.connected = True
+                        logger.info("Subscribed to cache invalidation channel %s", self.channel)
+                        async for message in pubsub.listen():
+                            self._handle(message)
+                finally:
+                    self.connected = False
+                    await redis.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation subscription lost: %s", e)
+            await asyncio.sleep(self.reconnect_delay)
+
+    def start(self) -> asyncio.Task:
+        """Start listening in the current worker."""
+        return asyncio.create_task(self.listen(), name="cache-invalidation-listener")
+
+    async def stop(self, task: asyncio.Task) -> None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        with self._lock:
+            if self._publisher is not None:
+                self._publisher.close()
+            self._publisher = self._publish_script = None
+
+    def _handle(self, message: dict) -> None:
+        if message.get("type") != "message":
+            return
+        try:
+            event = InvalidationEvent.decode(message["data"])
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation event %r", message["data"])
+            return
+        self.apply(event)
+
+    def _get_publish_script(self) -> Script:
+        # Repositories run in threadpool threads, so publishing uses a (thread-safe) blocking client
+        with self._lock:
+            if self._publish_script is None:
+                self._publisher = Redis.from_url(self.redis_url, socket_timeout=1.0, socket_connect_timeout=1.0)
+                self._publish_script = self._publisher.register_script(PUBLISH_SCRIPT)
+            return self._publish_script
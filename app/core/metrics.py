@@ -0,0 +1,147 @@
+"""Prometheus metrics shared by the middleware, the database pool and Redis.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set (production runs several uvicorn
+workers), every worker writes its samples to memory-mapped files in that
+directory and ``/metrics`` aggregates them, so any worker can serve a scrape.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REDIS_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured size of the database connection pool", multiprocess_mode="livesum")
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Database connections currently checked out", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Connections opened above the pool size", multiprocess_mode="livesum")
+DB_POOL_CHECKOUTS = Counter("db_pool_checkouts_total", "Database connection checkouts")
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency",
+    ["command"],
+    buckets=REDIS_LATENCY_BUCKETS,
+)
+REDIS_COMMAND_ERRORS = Counter("redis_command_errors_total", "Failed Redis commands", ["command"])
+REPOSITORY_CACHE_REQUESTS = Counter(
+    "repository_cache_requests_total", "Repository cache lookups per tier", ["repository", "tier", "result"]
+)
+REDIS_CLIENTS_OPEN = Gauge("redis_clients_open", "Redis clients currently open", multiprocess_mode="livesum")
+
+
+def is_multiprocess() -> bool:
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Serialize current metrics in the Prometheus text format."""
+    registry = REGISTRY
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def shutdown_metrics() -> None:
+    """Drop live gauges of the current worker so they do not outlive it."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Track checkouts and overflow of an engine's connection pool through pool events.
+
+    ``engine.dispose()`` (run after each gunicorn fork) replaces the pool and
+    carries the listeners over, so the pool is looked up when an event fires.
+    """
+    record_pool_size(engine)
+
+    def update_overflow() -> None:
+        pool = engine.pool
+        if hasattr(pool, "overflow"):
+            DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc()
+        DB_POOL_CHECKED_OUT.inc()
+        update_overflow()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.dec()
+        update_overflow()
+
+
+def record_pool_size(engine: Engine) -> None:
+    """Set the pool size gauge of the current process; each worker sets its own after the fork."""
+    pool = engine.pool
+    if hasattr(pool, "size"):
+        DB_POOL_SIZE.set(pool.size())
+
+
+class InstrumentedRedis(Redis):
+    """Redis client that records the latency of every command and counts open clients."""
+
+    open_clients = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._counted_open = True
+        self._change_open_clients(1)
+
+    async def aclose(self, close_connection_pool: bool | None = None) -> None:
+        await super().aclose(close_connection_pool)
+        if self._counted_open:
+            self._counted_open = False
+            self._change_open_clients(-1)
+
+    @classmethod
+    def _change_open_clients(cls, delta: int) -> None:
+        cls.open_clients += delta
+        REDIS_CLIENTS_OPEN.set(cls.open_clients)
+
+    async def execute_command(self, *args, **options):
+        command = str(args[0]).upper() if args else "UNKNOWN"
+        start_time = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        except Exception:
+            REDIS_COMMAND_ERRORS.labels(command=command).inc()
+            raise
+        finally:
+            REDIS_COMMAND_DURATION.labels(command=command).observe(time.perf_counter() - start_time)
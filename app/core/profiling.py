@@ -0,0 +1,89 @@
+"""Sampling profiler for individual requests.
+
+Sync endpoints and dependencies run in threadpool workers, so a profiler bound to the
+event loop thread would only see ``await`` frames. Instead a background thread
+samples the stacks of every busy thread in the worker process while the profiled
+request runs; idle threadpool workers and an idle event loop are skipped. Requests
+served concurrently by the same worker can therefore show up in the profile too.
+"""
+
+from collections import Counter
+import os
+import sys
+import threading
+import time
+
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("selectors.py", "select"),
+}
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _stack(frame) -> tuple[str, ...]:
+    """Stack of a thread from the outermost frame to the innermost one."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return tuple(reversed(labels))
+
+
+def _is_idle(frame) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_FRAMES
+
+
+class SamplingProfiler:
+    """Collects stack samples of busy threads until stopped."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_time = 0.0
+
+    def start(self) -> None:
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._start_time
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id and not _is_idle(frame):
+                    self.samples[_stack(frame)] += 1
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed-stack format read by flamegraph.pl and speedscope."""
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in sorted(self.samples.items()))
+
+    def call_tree(self) -> dict:
+        """Samples merged into a tree of ``{"name", "samples", "children"}`` nodes."""
+        root: dict = {"name": "root", "samples": 0, "children": {}}
+        for stack, count in self.samples.items():
+            root["samples"] += count
+            node = root
+            for label in stack:
+                node = node["children"].setdefault(label, {"name": label, "samples": 0, "children": {}})
+                node["samples"] += count
+
+        def finalize(node: dict) -> dict:
+            children = sorted(node["children"].values(), key=lambda child: child["samples"], reverse=True)
+            return {"name": node["name"], "samples": node["samples"], "children": [finalize(c) for c in children]}
+
+        return finalize(root)
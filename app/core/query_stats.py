@@ -0,0 +1,85 @@
+"""Per-request SQL statistics collected from engine cursor events.
+
+The stats object lives in a context variable set by ``QueryStatsMiddleware``.
+Sync endpoints run in a threadpool that copies the request context, so queries
+issued there are recorded on the same object.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import re
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PARAMETER_PATTERN = re.compile(r"%\(\w+\)s|\$\d+|\?")
+IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Transaction control, like the BEGIN and COMMIT the driver sends without a cursor, is not counted
+SAVEPOINT_PATTERN = re.compile(r"\s*(?:SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b", re.IGNORECASE)
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with parameters and IN-lists collapsed, so N+1 repeats compare equal."""
+    shape = PARAMETER_PATTERN.sub("?", statement)
+    shape = IN_LIST_PATTERN.sub("(?)", shape)
+    return WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Number, total duration and shapes of the SQL statements run by one request."""
+
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statement shapes executed at least ``threshold`` times, a typical sign of N+1 loading."""
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> QueryStats | None:
+    """Stats of the request being processed, if tracking is active."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record SQL statements executed in the current context."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Attach cursor timing hooks to an engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        start_times = conn.info.get("query_start_time")
+        if stats is not None and start_times:
+            duration = time.perf_counter() - start_times.pop()
+            if not SAVEPOINT_PATTERN.match(statement):
+                stats.record(statement, duration)
@@ -1,12 +1,20 @@
 from typing import Any, Generic, Protocol, TypeVar
 
-from sqlalchemy import Column
+from sqlalchemy import Column, cast, column, literal, select, table
+from sqlalchemy.dialects.postgresql import REGCLASS
 from sqlalchemy.orm import Session
 
+from app.core.filters import FilterSet, ListQuery
+from app.exceptions.filter_exceptions import UnindexedFilterException
+from app.settings import settings
+
+PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+
 
 class ModelProtocol(Protocol):
     """Protocol for determining the basic attributes of the model."""
 
+    __tablename__: str
     id: Column[int]
 
 
@@ -16,6 +24,9 @@ ModelType = TypeVar("ModelType", bound=ModelProtocol)
 class BaseRepository(Generic[ModelType]):
     """Base repository providing common CRUD operations for SQLAlchemy models."""
 
+    # Fields ``filter_by_fields`` accepts, see ``app.core.filters``
+    filters: FilterSet | None = None
+
     def __init__(self, model: type[ModelType], db: Session):
         self.model = model
         self.db = db
@@ -39,6 +50,7 @@ class BaseRepository(Generic[ModelType]):
         self.db.add(db_obj)
         self.db.commit()
         self.db.refresh(db_obj)
+        self._publish_change(db_obj.id)
         return db_obj
 
     def update(self, db_obj: ModelType, update_data: dict[str, Any]) -> ModelType:
@@ -49,24 +61,52 @@ class BaseRepository(Generic[ModelType]):
                 setattr(db_obj, field, value)
         self.db.commit()
         self.db.refresh(db_obj)
+        self._publish_change(db_obj.id)
         return db_obj
 
     def delete(self, db_obj: ModelType) -> bool:
         """Delete a record from the database."""
 
+        model_id = db_obj.id
         self.db.delete(db_obj)
         self.db.commit()
+        self._publish_change(model_id)
         return True
 
     def exists_by_id(self, model_id: int) -> bool:
         """Check if a record exists by its primary key ID."""
         return self.db.query(self.model).filter(self.model.id == model_id).first() is not None
 
-    def filter_by_fields(self, **filters) -> list[ModelType]:
-        """Filter records by multiple field values using exact matching."""
-
-        query = self.db.query(self.model)
-        for field, value in filters.items():
-            if hasattr(self.model, field) and value is not None:
-                query = query.filter(getattr(self.model, field) == value)
-        return query.all()
+    def filter_by_fields(self, list_query: ListQuery, *, skip: int = 0, limit: int = 100) -> list[ModelType]:
+        """Retrieve a page of records matching the filters of ``list_query``, in its sort order."""
+        return self._filtered_query(list_query).offset(skip).limit(limit).all()
+
+    def list_by_fields(self, list_query: ListQuery, *, skip: int = 0, limit: int = 100) -> tuple[list[ModelType], int]:
+        """Retrieve a page of records matching ``list_query`` and the count of all of them, checking the filters once."""
+        query = self._filtered_query(list_query)
+        return query.offset(skip).limit(limit).all(), query.order_by(None).count()
+
+    def count_by_fields(self, list_query: ListQuery) -> int:
+        """Count the records matching the filters of ``list_query``."""
+        return self._filtered_query(list_query).order_by(None).count()
+
+    def estimated_count(self) -> int:
+        """The planner's estimate of the table's row count, 0 before its first ANALYZE."""
+        # A plain select, so replica routing does not take it for a write
+        rows = self.db.execute(
+            select(PG_CLASS.c.reltuples).where(PG_CLASS.c.oid == cast(literal(self.model.__tablename__), REGCLASS))
+        ).scalar()
+        return max(int(rows or 0), 0)
+
+    def _filtered_query(self, list_query: ListQuery):
+        if self.filters is None:
+            raise TypeError(f"{type(self).__name__} declares no filters")
+
+        unindexed = self.filters.unindexed_fields(list_query)
+        if unindexed and self.estimated_count() > self.filters.max_unindexed_rows:
+            raise UnindexedFilterException(unindexed, self.filters.indexed_fields())
+        return self.filters.apply(self.db.query(self.model), list_query)
+
+    def _publish_change(self, model_id: Any) -> None:
+        """Tell every worker's in-process caches that a committed row changed."""
+        settings.invalidation_bus.publish(self.model.__tablename__, int(model_id))
@@ -0,0 +1,148 @@
+"""Bootstrap of empty databases from the models instead of the migration chain.
+
+An empty database gets the extensions and ``create_all`` of the model metadata,
+which also runs the trigger DDL registered on it, and is stamped at the current
+migration head in the same transaction. Databases that already have tables are
+upgraded through the migration chain as before, so existing environments keep
+their history.
+
+The baseline is only correct while the chain ends at the same schema as the
+models. ``schema_drift`` and ``database_objects`` compare the two, and the test
+suite checks them against a database migrated through the whole chain.
+
+Run ``python -m app.core.schema_baseline bootstrap`` to bring a database up and
+``python -m app.core.schema_baseline check`` to list differences between a
+migrated database and the models.
+"""
+
+from collections.abc import Callable
+import logging
+import sys
+from typing import Any
+
+from sqlalchemy import MetaData, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.schema_check import MIGRATIONS_DIR, SCHEMA_LOCK_KEY
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_CONFIG = MIGRATIONS_DIR.parent / "alembic.ini"
+BASELINE_EXTENSIONS = ("pg_trgm", "btree_gin")
+
+
+def create_baseline(connection: Connection, metadata: MetaData) -> None:
+    """Create the extensions and the schema of ``metadata`` in one step."""
+    for extension in BASELINE_EXTENSIONS:
+        connection.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+    metadata.create_all(bind=connection)
+
+
+def bootstrap_schema(engine: Engine, metadata: MetaData, seed: Callable[[Connection], None] | None = None) -> bool:
+    """Create the baseline in an empty database and stamp it at head; False when the database already has tables.
+
+    ``seed`` inserts the rows the historical migrations add as data, in the
+    same transaction as the schema.
+    """
+    # Alembic is only needed here, keep it out of the import path of every worker
+    from alembic.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    with engine.begin() as connection:
+        connection.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
+        if inspect(connection).get_table_names():
+            return False
+
+        create_baseline(connection, metadata)
+        if seed is not None:
+            seed(connection)
+        MigrationContext.configure(connection).stamp(ScriptDirectory(str(MIGRATIONS_DIR)), "head")
+
+    logger.info("Created the schema baseline in %s", engine.url.render_as_string(hide_password=True))
+    return True
+
+
+def upgrade_schema() -> None:
+    """Apply the pending migrations with ``alembic upgrade head``."""
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(str(ALEMBIC_CONFIG)), "head")
+
+
+def schema_drift(connection: Connection, metadata: MetaData) -> list[Any]:
+    """Differences between the tables, columns, indexes and constraints of the database and ``metadata``."""
+    from alembic.autogenerate import compare_metadata
+    from alembic.migration import MigrationContext
+
+    return compare_metadata(MigrationContext.configure(connection), metadata)
+
+
+def database_objects(connection: Connection) -> set[tuple[str, str]]:
+    """Extensions, functions and triggers of the database, which ``schema_drift`` does not compare."""
+    rows = connection.execute(
+        text(
+            """
+            SELECT 'extension', extname FROM pg_extension WHERE extname <> 'plpgsql'
+            UNION ALL
+            SELECT 'function', p.proname FROM pg_proc p JOIN pg_namespace n ON n.oid = p.pronamespace
+            WHERE n.nspname = current_schema() AND NOT EXISTS (
+                SELECT 1 FROM pg_depend d WHERE d.objid = p.oid AND d.deptype = 'e'
+            )
+            UNION ALL
+            SELECT 'trigger', t.tgrelid::regclass || '.' || t.tgname FROM pg_trigger t WHERE NOT t.tgisinternal
+            """
+        )
+    )
+    return {(kind, name) for kind, name in rows}
+
+
+def seed_admin(email: str | None, password: str | None) -> Callable[[Connection], None]:
+    """Seed of the founder account that the ``add_admin`` migration creates."""
+
+    def seed(connection: Connection) -> None:
+        if not email or not password:
+            logger.warning("ADMIN_LOGIN or ADMIN_PASSWORD is not set, no admin account was created")
+            return
+
+        from app.auth.utils.pwd_utils import get_password_hash
+        from app.models import User
+
+        connection.execute(
+            User.__table__.insert().values(
+                username="admin",
+                email=email,
+                hashed_password=get_password_hash(password),
+                role="found_father",
+                created_at=func.now(),
+                updated_at=func.now(),
+            )
+        )
+
+    return seed
+
+
+def main(argv: list[str]) -> int:
+    from app import models  # noqa: F401
+    from app.settings import settings
+
+    action = argv[0] if argv else "bootstrap"
+    if action == "bootstrap":
+        seed = seed_admin(settings.ADMIN_LOGIN, settings.ADMIN_PASSWORD)
+        if not bootstrap_schema(settings.engine, settings.Base.metadata, seed):
+            upgrade_schema()
+        return 0
+
+    if action == "check":
+        with settings.engine.connect() as connection:
+            drift = schema_drift(connection, settings.Base.metadata)
+        for difference in drift:
+            print(difference)
+        return 1 if drift else 0
+
+    print(f"Unknown action {action!r}, expected bootstrap or check", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Schema handling at worker startup.
+
+Development and tests create missing tables with ``create_all``, one worker at a
+time. Production databases are migrated by a separate ``alembic upgrade head``
+step, so workers only confirm that the database is at the revision the code
+expects. The check runs once per process and database; later startups in the
+same process skip it.
+"""
+
+from functools import lru_cache
+import logging
+from pathlib import Path
+
+from sqlalchemy import MetaData, func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ProgrammingError
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+SCHEMA_STARTUP_MODES = ("create_all", "verify", "skip")
+# Arbitrary key of the advisory lock serializing create_all across workers starting together
+SCHEMA_LOCK_KEY = 7_215_301
+
+_verified_databases: set[str] = set()
+
+
+class SchemaRevisionMismatchError(RuntimeError):
+    """Raised when the database is not migrated to the revision the code expects."""
+
+    def __init__(self, expected: tuple[str, ...], current: tuple[str, ...]):
+        super().__init__(
+            f"Database is at revision {', '.join(current) or 'none'}, expected {', '.join(expected)}. "
+            "Run `alembic upgrade head` before starting the application."
+        )
+        self.expected = expected
+        self.current = current
+
+
+@lru_cache(maxsize=1)
+def get_expected_heads() -> tuple[str, ...]:
+    """Head revisions of the migration scripts shipped with the code."""
+    # Alembic is only needed for this check, keep it out of the import path of every worker
+    from alembic.script import ScriptDirectory
+
+    return tuple(sorted(ScriptDirectory(str(MIGRATIONS_DIR)).get_heads()))
+
+
+def get_database_heads(engine: Engine) -> tuple[str, ...]:
+    """Revisions recorded in ``alembic_version``; empty when the database was never migrated."""
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(text("SELECT version_num FROM alembic_version")).scalars()
+            return tuple(sorted(rows))
+    except ProgrammingError:
+        return ()
+
+
+def verify_schema_revision(engine: Engine) -> None:
+    """Fail startup when the database revision differs from the migration heads."""
+    database = engine.url.render_as_string(hide_password=True)
+    if database in _verified_databases:
+        return
+
+    expected = get_expected_heads()
+    current = get_database_heads(engine)
+    if current != expected:
+        raise SchemaRevisionMismatchError(expected, current)
+
+    _verified_databases.add(database)
+    logger.info("Database schema is at revision %s", ", ".join(current))
+
+
+def reset_schema_verification() -> None:
+    _verified_databases.clear()
+
+
+def prepare_schema(engine: Engine, metadata: MetaData, mode: str) -> None:
+    """Bring up the schema according to ``SCHEMA_STARTUP_MODE``."""
+    if mode == "create_all":
+        with engine.begin() as connection:
+            connection.execute(select(func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY)))
+            metadata.create_all(bind=connection)
+    elif mode == "verify":
+        verify_schema_revision(engine)
+    elif mode != "skip":
+        raise ValueError(f"Unknown schema startup mode {mode!r}, expected one of {SCHEMA_STARTUP_MODES}")
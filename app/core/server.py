@@ -0,0 +1,52 @@
+"""Sizing of production workers and their database pools."""
+
+import os
+from typing import Any
+
+from sqlalchemy.pool import NullPool, QueuePool
+
+# Share of a worker's connections kept open in the pool; the rest are opened on demand as overflow
+POOL_SIZE_SHARE = 1 / 3
+
+
+def default_workers() -> int:
+    """One event-loop worker per CPU available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def get_pool_limits(max_connections: int, workers: int) -> tuple[int, int]:
+    """Split a per-instance connection budget into ``(pool_size, max_overflow)`` for each worker.
+
+    Every worker gets at least one connection, so a budget smaller than the worker
+    count is exceeded rather than leaving workers without a database.
+    """
+    per_worker = max(max_connections // max(workers, 1), 1)
+    pool_size = max(round(per_worker * POOL_SIZE_SHARE), 1)
+    return pool_size, per_worker - pool_size
+
+
+def get_engine_options(pooler: str, pool_size: int, max_overflow: int, pooler_pool_size: int = 0) -> dict[str, Any]:
+    """Pool options for ``create_engine``, direct to Postgres or through an external pooler.
+
+    PgBouncer in transaction mode hands each transaction whichever server connection is
+    free, so workers keep few or no connections of their own and skip the pre-ping round
+    trip, as PgBouncer checks server connections itself. psycopg2 sends plain statements,
+    so there are no named prepared statements to collide across clients.
+    """
+    if pooler == "pgbouncer":
+        if pooler_pool_size == 0:
+            return {"poolclass": NullPool}
+        return {"poolclass": QueuePool, "pool_size": pooler_pool_size, "max_overflow": 0, "pool_timeout": 30}
+    if pooler != "none":
+        raise ValueError(f"Unknown DATABASE_POOLER {pooler!r}, expected 'none' or 'pgbouncer'")
+
+    return {
+        "poolclass": QueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+        "pool_timeout": 30,
+    }
@@ -0,0 +1,157 @@
+"""Structured logging through a background queue.
+
+Records are put on an in-process queue by a ``QueueHandler`` attached to the root
+logger; a ``QueueListener`` thread turns them into JSON (or text) and writes them
+out, so formatting and I/O never run on the event loop. Request context (request
+id, user id, method, route) lives in a context variable and is copied onto each
+record by a filter on the queue handler, i.e. in the thread that logged it.
+"""
+
+from contextvars import ContextVar, Token
+import copy
+import json
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
+from typing import Any
+
+REDIRECTED_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+CONTEXT_FIELDS = ("request_id", "user_id", "method", "route")
+RESERVED_ATTRIBUTES = set(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "scope", *CONTEXT_FIELDS}
+
+MUTABLE_ARGUMENT_TYPES = (list, dict, set, bytearray)
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-8s [%(name)s] [%(request_id)s] %(message)s"
+
+_request_context: ContextVar[dict[str, Any] | None] = ContextVar("request_context", default=None)
+
+
+def bind_request_context(**fields: Any) -> Token:
+    """Start a request context; returns the token for ``reset_request_context``."""
+    return _request_context.set(dict(fields))
+
+
+def reset_request_context(token: Token) -> None:
+    _request_context.reset(token)
+
+
+def update_request_context(**fields: Any) -> None:
+    """Add fields (e.g. the authenticated user) to the current request context.
+
+    The context dict is shared with the middleware that bound it, so fields set deep
+    inside a request are visible to everything logged afterwards.
+    """
+    context = _request_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def get_request_context() -> dict[str, Any]:
+    context = _request_context.get()
+    if context is None:
+        return {}
+
+    fields = {name: context.get(name) for name in CONTEXT_FIELDS}
+    route = context.get("scope", {}).get("route")
+    if route is not None:
+        fields["route"] = route.path_format
+    return fields
+
+
+class RequestContextFilter(logging.Filter):
+    """Copies the current request context onto log records, keeping fields passed via ``extra``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = get_request_context()
+        for name in CONTEXT_FIELDS:
+            if context.get(name) is not None or not hasattr(record, name):
+                setattr(record, name, context.get(name))
+        return True
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The stdlib implementation formats the record before enqueueing it so it can be
+    pickled; the queue here is in-process, so the message is merged with its
+    arguments by the listener. Built-in containers passed as arguments are copied,
+    since the caller may mutate them after the call; other objects are rendered
+    when the listener formats the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if isinstance(record.args, dict):
+            record.args = {key: _snapshot(value) for key, value in record.args.items()}
+        elif record.args:
+            record.args = tuple(_snapshot(value) for value in record.args)
+        return record
+
+
+def _snapshot(value: Any) -> Any:
+    return copy.copy(value) if isinstance(value, MUTABLE_ARGUMENT_TYPES) else value
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                payload[name] = value
+
+        for name, value in record.__dict__.items():
+            if name not in RESERVED_ATTRIBUTES and not name.startswith("_"):
+                payload[name] = value
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def setup_logging(level: str = "INFO", log_format: str = "text") -> QueueListener:
+    """Route the root logger (and uvicorn's loggers) through a background listener.
+
+    The returned listener is already started and must be stopped on shutdown so
+    queued records are flushed.
+    """
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    _remove_queue_handlers(root)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    for name in REDIRECTED_LOGGERS:
+        redirected = logging.getLogger(name)
+        redirected.handlers.clear()
+        redirected.propagate = True
+
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def shutdown_logging(listener: QueueListener) -> None:
+    """Flush queued records and detach the queue handler."""
+    listener.stop()
+    _remove_queue_handlers(logging.getLogger())
+
+
+def _remove_queue_handlers(logger: logging.Logger) -> None:
+    for handler in [handler for handler in logger.handlers if isinstance(handler, DeferredQueueHandler)]:
+        logger.removeHandler(handler)
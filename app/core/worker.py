@@ -0,0 +1,13 @@
+from uvicorn.workers import UvicornWorker
+
+
+class AppUvicornWorker(UvicornWorker):
+    """Uvicorn worker for gunicorn with the uvloop event loop and the httptools parser."""
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "server_header": False,
+        "proxy_headers": True,
+    }
@@ -0,0 +1,126 @@
+"""Write-behind buffering of hot-row column updates.
+
+Columns that change on almost every request for the same rows (such as
+``users.last_login``) are recorded in memory instead of being written in the
+request. A background task in each worker flushes the pending values
+periodically, one multi-row ``UPDATE ... FROM (VALUES ...)`` per buffer and
+batch, and once more on shutdown. Values recorded since the last flush are lost
+if a worker is killed without a graceful shutdown, so only values that may be
+slightly stale or lost belong here.
+"""
+
+import asyncio
+from contextlib import suppress
+import logging
+import threading
+from typing import Any
+
+from sqlalchemy import Column, ColumnElement, column, func, update, values
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import InstrumentedAttribute
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+_buffers: list["WriteBehindBuffer"] = []
+
+
+class WriteBehindBuffer:
+    """Pending values of one column, keyed by primary key; the latest recorded value wins.
+
+    With ``monotonic`` a flush never moves the stored value backwards, so workers
+    flushing in any order keep the newest value (e.g. timestamps).
+    """
+
+    def __init__(
+        self, attribute: InstrumentedAttribute[Any] | Column[Any], *, monotonic: bool = False, batch_size: int = 500
+    ):
+        self.column: Column[Any] = (
+            attribute.property.columns[0] if isinstance(attribute, InstrumentedAttribute) else attribute
+        )
+        self.table = self.column.table
+        self.monotonic = monotonic
+        self.batch_size = batch_size
+        self._pending: dict[Any, Any] = {}
+        self._lock = threading.Lock()
+        _buffers.append(self)
+
+    @property
+    def name(self) -> str:
+        return f"{self.table.name}.{self.column.name}"
+
+    def record(self, row_id: Any, value: Any) -> None:
+        with self._lock:
+            self._pending[row_id] = value
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def discard(self) -> None:
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self, engine: Engine) -> int:
+        """Write the pending values; on failure they are kept for the next flush. Returns the rows written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        rows = list(pending.items())
+        try:
+            with engine.begin() as connection:
+                for start in range(0, len(rows), self.batch_size):
+                    connection.execute(self._build_update(rows[start : start + self.batch_size]))
+        except Exception:
+            with self._lock:
+                # Values recorded while flushing are newer than the ones that failed
+                self._pending = pending | self._pending
+            raise
+
+        logger.debug("Flushed %d pending %s values", len(rows), self.name)
+        return len(rows)
+
+    def _build_update(self, rows: list[tuple[Any, Any]]):
+        primary_key = self.table.primary_key.columns.values()[0]
+        pending = values(
+            column("row_id", primary_key.type),
+            column("value", self.column.type),
+            name="pending",
+        ).data(rows)
+
+        value: ColumnElement[Any] = pending.c.value
+        if self.monotonic:
+            # GREATEST ignores NULLs, so the first value is written as is
+            value = func.greatest(self.column, value)
+        return update(self.table).where(primary_key == pending.c.row_id).values({self.column.name: value})
+
+
+def flush_all(engine: Engine) -> int:
+    """Flush every buffer, logging (not raising) failures so one buffer cannot block the others."""
+    written = 0
+    for buffer in _buffers:
+        try:
+            written += buffer.flush(engine)
+        except Exception as e:
+            logger.error("Failed to flush pending %s values: %s", buffer.name, e, extra={"buffer": buffer.name})
+    return written
+
+
+async def run_flusher(engine: Engine, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(flush_all, engine)
+
+
+def start_flusher(engine: Engine, interval: float) -> asyncio.Task:
+    """Start the periodic flush task of the current worker."""
+    return asyncio.create_task(run_flusher(engine, interval), name="write-behind-flusher")
+
+
+async def stop_flusher(task: asyncio.Task, engine: Engine) -> None:
+    """Stop the periodic flush and write what is still pending."""
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+    await run_in_threadpool(flush_all, engine)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+
+from app.core.dependencies import CurrentUserDep, EncounterServiceDep
+from app.encounters.schemas import EncounterSimulationRequest, EncounterSimulationResponse
+
+router = APIRouter()
+
+
+@router.post("/simulate", response_model=EncounterSimulationResponse)
+async def simulate_encounter(
+    request: EncounterSimulationRequest,
+    encounter_service: EncounterServiceDep,
+    _: CurrentUserDep,
+):
+    """Run a Monte Carlo simulation of an encounter and return win rates and expected rounds."""
+    return await encounter_service.simulate(request)
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field, model_validator
+
+MAX_ENCOUNTERS = 100_000
+# Encounters times combatants, bounding the CPU time one request can take
+MAX_COMBATANT_ENCOUNTERS = 200_000
+
+
+class CombatantRequest(BaseModel):
+    """Schema for a character taking part in an encounter"""
+
+    character_id: int = Field(..., description="Character with game stats")
+    ability_ids: list[int] | None = Field(
+        None,
+        max_length=20,
+        description="Abilities to use; defaults to the damaging abilities attached to the character",
+    )
+
+
+class EncounterSimulationRequest(BaseModel):
+    """Schema for simulating an encounter"""
+
+    party: list[CombatantRequest] = Field(..., min_length=1, max_length=20, description="Player side")
+    enemies: list[CombatantRequest] = Field(..., min_length=1, max_length=50, description="Opposing side")
+    encounters: int = Field(1000, ge=1, le=MAX_ENCOUNTERS, description="Number of simulated encounters")
+    seed: int | None = Field(None, ge=0, description="Random seed for reproducible results")
+
+    @model_validator(mode="after")
+    def validate_simulation_size(self):
+        """Check that encounters times combatants stays within the simulation budget"""
+        if self.encounters * (len(self.party) + len(self.enemies)) > MAX_COMBATANT_ENCOUNTERS:
+            raise ValueError(
+                f"Encounters times the number of combatants cannot exceed {MAX_COMBATANT_ENCOUNTERS}; "
+                "simulate fewer encounters"
+            )
+        return self
+
+
+class EncounterSimulationResponse(BaseModel):
+    """Schema for aggregated simulation results"""
+
+    encounters: int = Field(..., description="Number of simulated encounters")
+    party_win_rate: float = Field(..., description="Share of encounters won by the party")
+    enemy_win_rate: float = Field(..., description="Share of encounters won by the enemies")
+    draw_rate: float = Field(..., description="Share of encounters with no winner")
+    expected_rounds: float = Field(..., description="Mean number of rounds per encounter")
+    rounds_p90: int = Field(..., description="90th percentile of rounds per encounter")
+    fingerprint: str = Field(..., description="Fingerprint of the simulation input")
+    cached: bool = Field(False, description="Whether the result was served from cache")
@@ -0,0 +1,183 @@
+from dataclasses import asdict
+import hashlib
+import json
+import logging
+
+import numpy as np
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.abilities.dice import parse_dice_expression
+from app.abilities.repository import AbilityRepository
+from app.core.db_routing import read_only
+from app.encounters.schemas import CombatantRequest, EncounterSimulationRequest, EncounterSimulationResponse
+from app.encounters.simulator import Action, Combatant, SimulationResult, run_simulation
+from app.exceptions.ability_exceptions import AbilityNotFoundException, InvalidDiceExpressionException
+from app.exceptions.encounter_exceptions import CombatantNotFoundException
+from app.models import Ability, CharacterGameStats
+from app.settings import settings
+from app.stats.engine import ABILITY_NAMES, resolve_ability_index
+from app.stats.repository import StatsRepository
+from app.stats.schemas import CharacterStatsResponse
+from app.stats.services import StatsService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARMOR_CLASS = 10
+DEFAULT_HIT_POINTS = 10
+UNARMED_DAMAGE_DICE = "1d4"
+SPELLCASTING_ABILITIES = ("intelligence", "wisdom", "charisma")
+
+
+def has_valid_dice(ability: Ability) -> bool:
+    """Whether an ability has damage dice the simulator can roll; free-text values that do not parse are skipped."""
+    if not ability.damage_dice:
+        return False
+    try:
+        parse_dice_expression(str(ability.damage_dice))
+    except InvalidDiceExpressionException:
+        logger.warning(
+            "Skipping ability %s with invalid damage dice %r",
+            ability.id,
+            ability.damage_dice,
+            extra={"ability_id": ability.id},
+        )
+        return False
+    return True
+
+
+def build_action(stats: CharacterStatsResponse, ability: Ability | None = None) -> Action:
+    """Convert an ability (or an unarmed strike) into a simulated action for a character."""
+    if ability is None:
+        return Action(
+            damage_dice=UNARMED_DAMAGE_DICE,
+            attack_bonus=stats.proficiency_bonus + stats.modifiers["strength"],
+        )
+
+    if "spell" in str(ability.attack_type or "").lower():
+        modifier = max(stats.modifiers[name] for name in SPELLCASTING_ABILITIES)
+    else:
+        modifier = max(stats.modifiers["strength"], stats.modifiers["dexterity"])
+
+    save_dc = int(ability.save_dc) if ability.save_dc is not None else None
+    save_ability = resolve_ability_index(str(ability.save_required or "")) if save_dc else None
+    return Action(
+        damage_dice=str(ability.damage_dice),
+        attack_bonus=stats.proficiency_bonus + modifier,
+        save_dc=save_dc if save_ability is not None else None,
+        save_ability=save_ability,
+    )
+
+
+def encounter_fingerprint(party: list[Combatant], enemies: list[Combatant], encounters: int, seed: int | None) -> str:
+    """Stable hash of everything that influences a simulation result."""
+    payload = {
+        "party": [asdict(combatant) for combatant in party],
+        "enemies": [asdict(combatant) for combatant in enemies],
+        "encounters": encounters,
+        "seed": seed,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class EncounterService:
+    """Service for simulating encounters between characters"""
+
+    def __init__(self, db: Session):
+        self.stats_service = StatsService(db)
+        self.stats_repository = StatsRepository(db)
+        self.ability_repository = AbilityRepository(db)
+
+    async def simulate(self, request: EncounterSimulationRequest) -> EncounterSimulationResponse:
+        """Simulate an encounter, serving repeated inputs from cache."""
+        party, enemies = await run_in_threadpool(self._load_sides, request)
+        fingerprint = encounter_fingerprint(party, enemies, request.encounters, request.seed)
+        cache_key = f"encounter:{fingerprint}"
+
+        async with settings.get_redis() as redis:
+            cached = await redis.get(cache_key)
+            if cached:
+                return EncounterSimulationResponse(**json.loads(cached), cached=True)
+
+            result = await run_in_threadpool(
+                run_simulation,
+                party,
+                enemies,
+                request.encounters,
+                request.seed,
+                settings.ENCOUNTER_SIMULATION_WORKERS,
+            )
+            response = self._build_response(result, fingerprint)
+            await redis.setex(cache_key, settings.ENCOUNTER_CACHE_TTL, response.model_dump_json(exclude={"cached"}))
+
+        return response
+
+    @read_only
+    def _load_sides(self, request: EncounterSimulationRequest) -> tuple[list[Combatant], list[Combatant]]:
+        """Loading stats and abilities of both sides in bulk."""
+        requested = request.party + request.enemies
+        character_ids = list(dict.fromkeys(combatant.character_id for combatant in requested))
+
+        batch = self.stats_service.get_batch_stats(character_ids)
+        if batch.missing_ids:
+            raise CombatantNotFoundException(batch.missing_ids)
+
+        derived = {stats.character_id: stats for stats in batch.characters}
+        game_stats: dict[int, CharacterGameStats] = {
+            int(stats.character_id): stats for stats in self.stats_repository.get_by_character_ids(character_ids)
+        }
+        explicit, attached = self._load_abilities(requested, character_ids)
+
+        def build_combatant(combatant: CombatantRequest) -> Combatant:
+            stats = derived[combatant.character_id]
+            row = game_stats[combatant.character_id]
+            if combatant.ability_ids:
+                abilities = [explicit[ability_id] for ability_id in combatant.ability_ids]
+            else:
+                abilities = attached.get(combatant.character_id, [])
+
+            actions = tuple(build_action(stats, ability) for ability in abilities if has_valid_dice(ability))
+            # A combatant at 0 current hit points starts down, it does not fall back to its maximum
+            hit_points = next(
+                (int(value) for value in (row.hit_points_current, row.hit_points_max) if value is not None),
+                DEFAULT_HIT_POINTS,
+            )
+            return Combatant(
+                armor_class=int(row.armor_class or DEFAULT_ARMOR_CLASS),
+                hit_points=hit_points,
+                save_bonuses=tuple(stats.saving_throws[name] for name in ABILITY_NAMES),
+                actions=actions or (build_action(stats),),
+            )
+
+        return [build_combatant(c) for c in request.party], [build_combatant(c) for c in request.enemies]
+
+    def _load_abilities(
+        self, requested: list[CombatantRequest], character_ids: list[int]
+    ) -> tuple[dict[int, Ability], dict[int, list[Ability]]]:
+        """Loading explicitly requested abilities and damaging abilities attached to characters."""
+        ability_ids = {ability_id for combatant in requested for ability_id in combatant.ability_ids or []}
+        explicit: dict[int, Ability] = {
+            int(ability.id): ability for ability in self.ability_repository.get_by_ids(list(ability_ids))
+        }
+        for ability_id in ability_ids:
+            if ability_id not in explicit:
+                raise AbilityNotFoundException(ability_id)
+
+        attached: dict[int, list[Ability]] = {}
+        for character_id, ability in self.ability_repository.get_damage_abilities_for_characters(character_ids):
+            attached.setdefault(character_id, []).append(ability)
+
+        return explicit, attached
+
+    @staticmethod
+    def _build_response(result: SimulationResult, fingerprint: str) -> EncounterSimulationResponse:
+        return EncounterSimulationResponse(
+            encounters=result.encounters,
+            party_win_rate=round(result.party_wins / result.encounters, 4),
+            enemy_win_rate=round(result.enemy_wins / result.encounters, 4),
+            draw_rate=round(result.draws / result.encounters, 4),
+            expected_rounds=round(float(result.rounds.mean()), 4),
+            rounds_p90=int(np.percentile(result.rounds, 90)),
+            fingerprint=fingerprint,
+            cached=False,
+        )
@@ -0,0 +1,183 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.abilities.dice import get_distribution
+
+MAX_ROUNDS = 100
+MIN_ENCOUNTERS_PER_WORKER = 2000
+
+_executor: Executor | None = None
+_executor_workers = 0
+
+
+@dataclass(frozen=True)
+class Action:
+    """A damaging action: an attack roll against AC or a saving throw against a DC."""
+
+    damage_dice: str
+    attack_bonus: int = 0
+    save_dc: int | None = None
+    save_ability: int | None = None
+
+    @property
+    def is_save(self) -> bool:
+        return self.save_dc is not None and self.save_ability is not None
+
+
+@dataclass(frozen=True)
+class Combatant:
+    """Combat-relevant snapshot of a character."""
+
+    armor_class: int
+    hit_points: int
+    save_bonuses: tuple[int, ...]
+    actions: tuple[Action, ...] = field(default_factory=tuple)
+
+    def best_action(self) -> Action:
+        """Action with the highest expected damage."""
+        return max(self.actions, key=lambda action: get_distribution(action.damage_dice).mean)
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outcome of many simulated encounters."""
+
+    encounters: int
+    party_wins: int
+    enemy_wins: int
+    draws: int
+    rounds: np.ndarray
+
+    @classmethod
+    def merge(cls, results: list["SimulationResult"]) -> "SimulationResult":
+        return cls(
+            encounters=sum(result.encounters for result in results),
+            party_wins=sum(result.party_wins for result in results),
+            enemy_wins=sum(result.enemy_wins for result in results),
+            draws=sum(result.draws for result in results),
+            rounds=np.concatenate([result.rounds for result in results]),
+        )
+
+
+class _Side:
+    """Vectorized state of one side across all simulated encounters."""
+
+    def __init__(self, combatants: list[Combatant], encounters: int):
+        self.armor_class = np.array([combatant.armor_class for combatant in combatants], dtype=np.int64)
+        self.save_bonuses = np.array([combatant.save_bonuses for combatant in combatants], dtype=np.int64)
+        self.hit_points = np.tile(
+            np.array([combatant.hit_points for combatant in combatants], dtype=np.int64), (encounters, 1)
+        )
+        self.actions = [combatant.best_action() for combatant in combatants]
+        self.distributions = [get_distribution(action.damage_dice) for action in self.actions]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.hit_points > 0
+
+
+def _attack(attackers: _Side, defenders: _Side, rng: np.random.Generator) -> np.ndarray:
+    """Damage dealt to each defender in every encounter during one round."""
+    encounters, defender_count = defenders.hit_points.shape
+    rows = np.arange(encounters)
+    attacker_alive = attackers.alive
+    defender_alive = defenders.alive
+    damage = np.zeros((encounters, defender_count), dtype=np.int64)
+
+    for index, (action, distribution) in enumerate(zip(attackers.actions, attackers.distributions, strict=True)):
+        targets = np.argmax(np.where(defender_alive, rng.random((encounters, defender_count)), -1.0), axis=1)
+        rolled = rng.choice(distribution.values, size=encounters, p=distribution.probabilities).clip(min=0)
+        d20 = rng.integers(1, 21, size=encounters)
+
+        if action.is_save:
+            saved = d20 + defenders.save_bonuses[targets, action.save_ability] >= action.save_dc
+            dealt = np.where(saved, rolled // 2, rolled)
+        else:
+            hit = (d20 == 20) | ((d20 != 1) & (d20 + action.attack_bonus >= defenders.armor_class[targets]))
+            dealt = np.where(hit, rolled, 0)
+
+        np.add.at(damage, (rows, targets), dealt * attacker_alive[:, index])
+
+    return damage
+
+
+def simulate_encounters(
+    party: list[Combatant],
+    enemies: list[Combatant],
+    encounters: int,
+    seed: int | np.random.SeedSequence | None = None,
+    max_rounds: int = MAX_ROUNDS,
+) -> SimulationResult:
+    """Simulate ``encounters`` fights at once; both sides act simultaneously each round."""
+    rng = np.random.default_rng(seed)
+    party_side = _Side(party, encounters)
+    enemy_side = _Side(enemies, encounters)
+
+    ongoing = np.ones(encounters, dtype=bool)
+    rounds = np.full(encounters, max_rounds, dtype=np.int64)
+    for round_number in range(1, max_rounds + 1):
+        party_damage = _attack(enemy_side, party_side, rng)
+        enemy_damage = _attack(party_side, enemy_side, rng)
+        party_side.hit_points -= party_damage * ongoing[:, None]
+        enemy_side.hit_points -= enemy_damage * ongoing[:, None]
+
+        finished = ongoing & (~party_side.alive.any(axis=1) | ~enemy_side.alive.any(axis=1))
+        rounds[finished] = round_number
+        ongoing &= ~finished
+        if not ongoing.any():
+            break
+
+    party_standing = party_side.alive.any(axis=1)
+    enemies_standing = enemy_side.alive.any(axis=1)
+    return SimulationResult(
+        encounters=encounters,
+        party_wins=int((party_standing & ~enemies_standing).sum()),
+        enemy_wins=int((enemies_standing & ~party_standing).sum()),
+        draws=int((party_standing == enemies_standing).sum()),
+        rounds=rounds,
+    )
+
+
+def _get_executor(workers: int) -> Executor:
+    global _executor, _executor_workers
+
+    # multiprocessing is only needed for large simulations, keep it out of worker startup
+    from concurrent.futures import ProcessPoolExecutor
+
+    if _executor is None or _executor_workers != workers:
+        shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the simulation process pool, if it was started."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def run_simulation(
+    party: list[Combatant],
+    enemies: list[Combatant],
+    encounters: int,
+    seed: int | None = None,
+    workers: int = 1,
+) -> SimulationResult:
+    """Simulate encounters, spreading large batches across a process pool."""
+    workers = max(1, min(workers, encounters // MIN_ENCOUNTERS_PER_WORKER))
+    if workers == 1:
+        return simulate_encounters(party, enemies, encounters, seed)
+
+    chunks = np.array_split(np.arange(encounters), workers)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    futures = [
+        _get_executor(workers).submit(simulate_encounters, party, enemies, len(chunk), chunk_seed)
+        for chunk, chunk_seed in zip(chunks, seeds, strict=True)
+    ]
+    return SimulationResult.merge([future.result() for future in futures])
@@ -0,0 +1,36 @@
+from fastapi import HTTPException, status
+
+
+class AbilityNotFoundException(HTTPException):
+    """Exception raised when an ability is not found."""
+
+    def __init__(self, ability_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ability with id {ability_id} not found",
+        )
+
+
+class AbilityWithoutDamageException(HTTPException):
+    """Exception raised when an ability has no damage dice."""
+
+    def __init__(self, ability_id: int):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Ability with id {ability_id} has no damage dice",
+        )
+
+
+class InvalidDiceExpressionException(HTTPException):
+    """Exception raised when a dice expression cannot be parsed."""
+
+    def __init__(self, expression: str, reason: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "Invalid dice expression",
+                "received": expression,
+                "reason": reason,
+                "examples": ["2d6+3", "1d8 + 1d6", "d20-1"],
+            },
+        )
@@ -0,0 +1,11 @@
+from fastapi import HTTPException, status
+
+
+class CombatantNotFoundException(HTTPException):
+    """Exception raised when combatants have no game stats."""
+
+    def __init__(self, character_ids: list[int]):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Game stats for characters {character_ids} not found",
+        )
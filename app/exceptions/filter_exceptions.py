@@ -0,0 +1,27 @@
+from typing import Any
+
+from fastapi import HTTPException, status
+
+
+class InvalidFilterException(HTTPException):
+    """Exception raised when a list filter or sort names an unknown field or operator, or has a malformed value."""
+
+    def __init__(self, message: str, received: str, allowed_values: list[str] | None = None):
+        detail: dict[str, Any] = {"message": message, "received": received}
+        if allowed_values is not None:
+            detail["allowed_values"] = allowed_values
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class UnindexedFilterException(HTTPException):
+    """Exception raised when a list query on a large table is not narrowed by any indexed filter."""
+
+    def __init__(self, fields: list[str], indexed_fields: list[str]):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "Filtering or sorting by these fields needs a filter on an indexed field as well",
+                "received": fields,
+                "allowed_values": indexed_fields,
+            },
+        )
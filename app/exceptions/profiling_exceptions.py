@@ -0,0 +1,11 @@
+from fastapi import HTTPException, status
+
+
+class ProfileNotFoundException(HTTPException):
+    """Exception raised when a stored profile does not exist or has expired."""
+
+    def __init__(self, profile_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found",
+        )
@@ -0,0 +1,15 @@
+from fastapi import HTTPException, status
+
+
+class InvalidRelationQueryException(HTTPException):
+    """Exception raised when a relations query names an unknown entity type."""
+
+    def __init__(self, field: str, value: str, allowed_values: list[str]):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": f"The unacceptable value of {field}",
+                "received": value,
+                "allowed_values": allowed_values,
+            },
+        )
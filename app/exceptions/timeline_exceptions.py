@@ -0,0 +1,15 @@
+from fastapi import HTTPException, status
+
+
+class InvalidTimelineQueryException(HTTPException):
+    """Exception raised when a timeline query has invalid bounds or filters."""
+
+    def __init__(self, message: str):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
+
+
+class InvalidTimelineCursorException(HTTPException):
+    """Exception raised when a timeline cursor cannot be decoded."""
+
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid timeline cursor")
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Response, status
+
+from app.core.dependencies import HealthServiceDep
+from app.health.schemas import LivenessResponse, ReadinessResponse
+
+router = APIRouter()
+
+
+@router.get("/live", response_model=LivenessResponse)
+async def liveness(health_service: HealthServiceDep):
+    """Liveness probe: the worker is running and its event loop responds."""
+    return await health_service.get_liveness()
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def readiness(health_service: HealthServiceDep, response: Response):
+    """Readiness probe: the database and Redis answer; responds with 503 otherwise."""
+    readiness = await health_service.get_readiness()
+    if readiness.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return readiness
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolStats(BaseModel):
+    """Schema for the state of the database connection pool"""
+
+    size: int = Field(..., description="Configured pool size")
+    checked_out: int = Field(..., description="Connections currently in use")
+    checked_in: int = Field(..., description="Idle connections kept by the pool")
+    overflow: int = Field(..., description="Connections opened above the pool size")
+    max_overflow: int = Field(..., description="Maximum connections allowed above the pool size")
+
+
+class RedisPoolStats(BaseModel):
+    """Schema for Redis connection usage"""
+
+    open_clients: int = Field(..., description="Redis clients currently open in this worker")
+    connected_clients: int | None = Field(None, description="Clients connected to the Redis server")
+    max_clients: int | None = Field(None, description="Maximum clients accepted by the Redis server")
+
+
+class DependencyCheck(BaseModel):
+    """Schema for the result of a single dependency check"""
+
+    status: Literal["ok", "fail"] = Field(..., description="Check outcome")
+    latency_ms: float = Field(..., description="Time the check took in milliseconds")
+    error: str | None = Field(None, description="Why the check failed")
+
+
+class LivenessResponse(BaseModel):
+    """Schema for the liveness probe"""
+
+    status: Literal["alive"] = Field("alive", description="The worker is running")
+    database_pool: DatabasePoolStats = Field(..., description="Database pool usage")
+    redis_pool: RedisPoolStats = Field(..., description="Redis connection usage")
+
+
+class ReadinessResponse(BaseModel):
+    """Schema for the readiness probe"""
+
+    status: Literal["ready", "not_ready"] = Field(..., description="Whether the worker can serve traffic")
+    checks: dict[str, DependencyCheck] = Field(..., description="Dependency checks by name")
+    database_pool: DatabasePoolStats = Field(..., description="Database pool usage")
+    redis_pool: RedisPoolStats = Field(..., description="Redis connection usage")
+    checked_at: datetime = Field(..., description="When the checks were run")
+    cached: bool = Field(False, description="Whether the result was served from cache")
@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.metrics import InstrumentedRedis
+from app.health.schemas import (
+    DatabasePoolStats,
+    DependencyCheck,
+    LivenessResponse,
+    ReadinessResponse,
+    RedisPoolStats,
+)
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_readiness_cache: tuple[float, ReadinessResponse] | None = None
+
+
+class PoolExhaustedError(RuntimeError):
+    """The database pool has no connection left for the health check."""
+
+
+def get_pool_stats(engine: Engine) -> DatabasePoolStats:
+    """Read pool usage without touching the database; pools without a fixed size report zeros."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return DatabasePoolStats(size=0, checked_out=0, checked_in=0, overflow=0, max_overflow=0)
+
+    return DatabasePoolStats(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        checked_in=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        max_overflow=pool._max_overflow,
+    )
+
+
+def is_pool_exhausted(stats: DatabasePoolStats) -> bool:
+    """A negative ``max_overflow`` means the pool may grow without limit."""
+    return stats.size > 0 and stats.max_overflow >= 0 and stats.checked_out >= stats.size + stats.max_overflow
+
+
+def reset_readiness_cache() -> None:
+    global _readiness_cache
+    _readiness_cache = None
+
+
+class HealthService:
+    """Service for liveness and readiness probes"""
+
+    async def get_liveness(self) -> LivenessResponse:
+        """Report that the worker runs, with pool usage but without contacting dependencies."""
+        return LivenessResponse(
+            status="alive",
+            database_pool=get_pool_stats(settings.engine),
+            redis_pool=RedisPoolStats(
+                open_clients=InstrumentedRedis.open_clients, connected_clients=None, max_clients=None
+            ),
+        )
+
+    async def get_readiness(self) -> ReadinessResponse:
+        """Check the database and Redis, reusing a recent result so frequent probes stay cheap."""
+        global _readiness_cache
+
+        now = time.monotonic()
+        if _readiness_cache is not None and now - _readiness_cache[0] < settings.HEALTH_CACHE_TTL:
+            return _readiness_cache[1].model_copy(update={"cached": True})
+
+        redis_stats: dict[str, int | None] = {"connected_clients": None, "max_clients": None}
+        database_check, redis_check = await asyncio.gather(
+            self._run_check("database", self._check_database),
+            self._run_check("redis", lambda: self._check_redis(redis_stats)),
+        )
+
+        checks = {"database": database_check, "redis": redis_check}
+        readiness = ReadinessResponse(
+            status="ready" if all(check.status == "ok" for check in checks.values()) else "not_ready",
+            checks=checks,
+            database_pool=get_pool_stats(settings.engine),
+            redis_pool=RedisPoolStats(
+                open_clients=InstrumentedRedis.open_clients,
+                connected_clients=redis_stats["connected_clients"],
+                max_clients=redis_stats["max_clients"],
+            ),
+            checked_at=datetime.now(timezone.utc),
+            cached=False,
+        )
+        _readiness_cache = (time.monotonic(), readiness)
+        return readiness
+
+    @staticmethod
+    async def _run_check(name: str, check: Callable[[], Awaitable[None]]) -> DependencyCheck:
+        start_time = time.perf_counter()
+        # The response is public: it names the failure only, hosts and driver messages go to the log
+        error: str | None
+        details: str
+        try:
+            await asyncio.wait_for(check(), timeout=settings.HEALTH_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            error = details = f"Timed out after {settings.HEALTH_CHECK_TIMEOUT}s"
+        except Exception as e:
+            error = type(e).__name__
+            details = f"{error}: {e}"
+        else:
+            error = None
+        latency_ms = round((time.perf_counter() - start_time) * 1000, 3)
+
+        if error is not None:
+            logger.warning("Health check %s failed: %s", name, details, extra={"check": name, "latency_ms": latency_ms})
+            return DependencyCheck(status="fail", latency_ms=latency_ms, error=error)
+        return DependencyCheck(status="ok", latency_ms=latency_ms, error=None)
+
+    async def _check_database(self) -> None:
+        # An exhausted pool would block the check for the whole pool timeout
+        if is_pool_exhausted(get_pool_stats(settings.engine)):
+            raise PoolExhaustedError("Connection pool exhausted")
+        await run_in_threadpool(self._select_one)
+
+    @staticmethod
+    def _select_one() -> None:
+        timeout_ms = int(settings.HEALTH_CHECK_TIMEOUT * 1000)
+        with settings.engine.connect() as connection:
+            connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+            connection.execute(text("SELECT 1"))
+
+    @staticmethod
+    async def _check_redis(redis_stats: dict[str, int | None]) -> None:
+        async with settings.get_redis() as redis:
+            await redis.ping()
+            clients = await redis.info("clients")
+
+        redis_stats["connected_clients"] = clients.get("connected_clients")
+        redis_stats["max_clients"] = clients.get("maxclients")
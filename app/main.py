@@ -5,22 +5,40 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-import uvicorn
 
+from app.abilities.endpoints import router as ability_router
 from app.auth.endpoints import router as auth_router
+from app.core.metrics import instrument_engine, shutdown_metrics
+from app.core.query_stats import instrument_queries
+from app.core.schema_check import prepare_schema
+from app.core.structured_logging import setup_logging, shutdown_logging
+from app.core.write_behind import start_flusher, stop_flusher
+from app.encounters.endpoints import router as encounter_router
+from app.encounters.simulator import shutdown_executor
+from app.health.endpoints import router as health_router
+from app.metrics.endpoints import router as metrics_router
 from app.middleware import (
     AutoTokenRefreshMiddleware,
     LoggingMiddleware,
+    MetricsMiddleware,
     MiddlewareConfig,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
     RateLimitMiddleware,
+    ReplicaRoutingMiddleware,
     RequestIDMiddleware,
     SecurityHeadersMiddleware,
     TimingMiddleware,
 )
 from app.middleware.error_handler import setup_error_handlers
 from app.ping.endpoints import router as ping_router
+from app.profiling.endpoints import router as profiling_router
 from app.races.endpoints import router as race_router
+from app.relations.endpoints import router as relation_router
 from app.settings import settings
+from app.stats.endpoints import router as stats_router
+from app.tags.endpoints import router as tag_router
+from app.timeline.endpoints import router as timeline_router
 from app.users.endpoints import router as user_router
 
 logger = logging.getLogger(__name__)
@@ -29,10 +47,18 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
+    log_listener = setup_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
     logger.info("Starting up Slavbor World Backend API...")
-    settings.Base.metadata.create_all(bind=settings.engine)
+    prepare_schema(settings.engine, settings.Base.metadata, settings.SCHEMA_STARTUP_MODE)
+    write_behind_flusher = start_flusher(settings.engine, settings.WRITE_BEHIND_FLUSH_INTERVAL)
+    invalidation_listener = settings.invalidation_bus.start()
     yield
     logger.info("Shutting down Slavbor World Backend API...")
+    await settings.invalidation_bus.stop(invalidation_listener)
+    await stop_flusher(write_behind_flusher, settings.engine)
+    shutdown_executor()
+    shutdown_metrics()
+    shutdown_logging(log_listener)
 
 
 def setup_middleware(app: FastAPI) -> None:
@@ -59,26 +85,52 @@ def setup_middleware(app: FastAPI) -> None:
         rate_limit_config = MiddlewareConfig.get_rate_limit_config()
         app.add_middleware(RateLimitMiddleware, **rate_limit_config)
 
-    if MiddlewareConfig.should_enable_middleware("request_id"):
-        app.add_middleware(RequestIDMiddleware)
-
     if MiddlewareConfig.should_enable_middleware("logging"):
         logging_config = MiddlewareConfig.get_logging_config()
         app.add_middleware(LoggingMiddleware, **logging_config)
 
+    if MiddlewareConfig.should_enable_middleware("query_stats"):
+        query_stats_config = MiddlewareConfig.get_query_stats_config()
+        app.add_middleware(QueryStatsMiddleware, **query_stats_config)
+
     if MiddlewareConfig.should_enable_middleware("timing"):
         timing_config = MiddlewareConfig.get_timing_config()
         app.add_middleware(TimingMiddleware, **timing_config)
 
+    if MiddlewareConfig.should_enable_middleware("metrics"):
+        metrics_config = MiddlewareConfig.get_metrics_config()
+        app.add_middleware(MetricsMiddleware, **metrics_config)
+
+    if MiddlewareConfig.should_enable_middleware("profiling"):
+        profiling_config = MiddlewareConfig.get_profiling_config()
+        app.add_middleware(ProfilingMiddleware, **profiling_config)
+
+    if MiddlewareConfig.should_enable_middleware("replica_routing"):
+        replica_routing_config = MiddlewareConfig.get_replica_routing_config()
+        app.add_middleware(ReplicaRoutingMiddleware, **replica_routing_config)
+
+    # Outermost, so the request id and logging context are bound for every other middleware
+    if MiddlewareConfig.should_enable_middleware("request_id"):
+        app.add_middleware(RequestIDMiddleware)
+
 
 def setup_routers(app: FastAPI) -> None:
     """Setup API routes with proper versioning."""
     api_prefix = "/api"
 
+    app.include_router(metrics_router, tags=["Metrics"])
     app.include_router(ping_router, prefix=f"{api_prefix}/ping", tags=["Health Check"])
+    app.include_router(health_router, prefix=f"{api_prefix}/health", tags=["Health Check"])
     app.include_router(auth_router, prefix=f"{api_prefix}/auth", tags=["Auth"])
     app.include_router(race_router, prefix=f"{api_prefix}/races", tags=["Races"])
     app.include_router(user_router, prefix=f"{api_prefix}/users", tags=["Users"])
+    app.include_router(stats_router, prefix=f"{api_prefix}/stats", tags=["Stats"])
+    app.include_router(ability_router, prefix=f"{api_prefix}/abilities", tags=["Abilities"])
+    app.include_router(encounter_router, prefix=f"{api_prefix}/encounters", tags=["Encounters"])
+    app.include_router(tag_router, prefix=f"{api_prefix}/tags", tags=["Tags"])
+    app.include_router(profiling_router, prefix=f"{api_prefix}/profiles", tags=["Profiling"])
+    app.include_router(timeline_router, prefix=f"{api_prefix}/timeline", tags=["Timeline"])
+    app.include_router(relation_router, prefix=f"{api_prefix}/relations", tags=["Relations"])
 
 
 app = FastAPI(
@@ -95,15 +147,21 @@ app = FastAPI(
 setup_middleware(app)
 setup_error_handlers(app)
 setup_routers(app)
+instrument_engine(settings.engine)
+instrument_queries(settings.engine)
+for replica_engine in settings.replica_engines:
+    instrument_queries(replica_engine)
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
-        port=8000,
+        port=settings.PORT,
         reload=settings.STAGE == "local",
-        workers=1 if settings.STAGE == "local" else 4,
+        workers=1 if settings.STAGE == "local" else settings.WEB_CONCURRENCY,
         access_log=settings.STAGE != "prod",
         log_level="info" if settings.STAGE != "prod" else "warning",
     )
@@ -1,7 +1,11 @@
 from .config import MiddlewareConfig
 from .error_handler import ErrorResponse, setup_error_handlers
 from .logging import LoggingMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .query_stats import QueryStatsMiddleware
 from .rate_limit import RateLimitMiddleware
+from .replica_routing import ReplicaRoutingMiddleware
 from .request_id import RequestIDMiddleware
 from .security import SecurityHeadersMiddleware
 from .timing import TimingMiddleware
@@ -15,7 +19,11 @@ __all__ = [
     "setup_error_handlers",
     # Middleware classes
     "LoggingMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "QueryStatsMiddleware",
     "RateLimitMiddleware",
+    "ReplicaRoutingMiddleware",
     "RequestIDMiddleware",
     "SecurityHeadersMiddleware",
     "TimingMiddleware",
@@ -14,13 +14,47 @@ class MiddlewareConfig:
             "slow_threshold": 1.0 if settings.STAGE == "prod" else 0.5,
         }
 
+    @staticmethod
+    def get_metrics_config() -> dict[str, Any]:
+        """Get configuration for MetricsMiddleware."""
+        return {
+            "skip_paths": ["/metrics", "/api/health/live", "/api/health/ready"],
+        }
+
+    @staticmethod
+    def get_query_stats_config() -> dict[str, Any]:
+        """Get configuration for QueryStatsMiddleware."""
+        return {
+            "repeated_query_threshold": settings.SQL_REPEATED_QUERY_THRESHOLD,
+            "query_count_threshold": settings.SQL_SLOW_REQUEST_QUERY_COUNT,
+            "skip_paths": ["/metrics", "/api/health/live", "/api/health/ready"],
+        }
+
+    @staticmethod
+    def get_profiling_config() -> dict[str, Any]:
+        """Get configuration for ProfilingMiddleware."""
+        return {
+            "header_name": settings.PROFILING_HEADER,
+            "sample_rate": settings.PROFILING_SAMPLE_RATE,
+            "interval": settings.PROFILING_INTERVAL,
+            "skip_paths": ["/api/profiles", "/metrics", "/docs", "/openapi.json", "/redoc"],
+        }
+
+    @staticmethod
+    def get_replica_routing_config() -> dict[str, Any]:
+        """Get configuration for ReplicaRoutingMiddleware."""
+        return {
+            "cookie_name": settings.REPLICA_STICKY_COOKIE,
+            "sticky_seconds": settings.REPLICA_STICKY_SECONDS,
+        }
+
     @staticmethod
     def get_logging_config() -> dict[str, Any]:
         """Get configuration for LoggingMiddleware."""
         return {
             "log_requests": settings.STAGE != "prod",
             "log_responses": settings.STAGE != "prod",
-            "skip_paths": ["/ping", "/health", "/docs", "/openapi.json", "/redoc"],
+            "skip_paths": ["/ping", "/health", "/metrics", "/docs", "/openapi.json", "/redoc"],
         }
 
     @staticmethod
@@ -45,6 +79,7 @@ class MiddlewareConfig:
                 "/api/auth/refresh",
                 "/api/ping",
                 "/api/health",
+                "/metrics",
                 "/docs",
                 "/openapi.json",
                 "/redoc",
@@ -61,6 +96,8 @@ class MiddlewareConfig:
             "allow_headers": ["*"],
             "expose_headers": [
                 "X-Process-Time",
+                "Server-Timing",
+                "X-Profile-ID",
                 "X-Request-ID",
                 "X-New-Access-Token",
                 "X-Token-Refreshed",
@@ -98,6 +135,10 @@ class MiddlewareConfig:
         """Determine if a middleware should be enabled based on environment."""
         middleware_settings = {
             "timing": True,
+            "metrics": True,
+            "query_stats": True,
+            "profiling": True,
+            "replica_routing": True,
             "logging": settings.STAGE != "prod",
             "rate_limit": settings.STAGE == "prod",
             "security": settings.STAGE == "prod",
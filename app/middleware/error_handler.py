@@ -61,9 +61,7 @@ def setup_error_handlers(app):
         """Handle HTTP exceptions."""
         request_id = getattr(request.state, "request_id", None)
 
-        logger.warning(
-            f"HTTP Exception: {exc.status_code} - {exc.detail} - Path: {request.url.path} - Request ID: {request_id}"
-        )
+        logger.warning("HTTP Exception: %s - %s", exc.status_code, exc.detail, extra={"path": request.url.path})
 
         error_response = ErrorResponse(
             error_type="HTTPException",
@@ -97,7 +95,7 @@ def setup_error_handlers(app):
         """Handle Pydantic validation errors."""
         request_id = getattr(request.state, "request_id", None)
 
-        logger.warning(f"Validation Error: {exc.errors()} - Path: {request.url.path} - Request ID: {request_id}")
+        logger.warning("Validation Error: %s", exc, extra={"path": request.url.path})
 
         validation_errors = [
             {
@@ -127,7 +125,7 @@ def setup_error_handlers(app):
         """Handle SQLAlchemy database errors."""
         request_id = getattr(request.state, "request_id", None)
 
-        logger.error(f"Database Error: {str(exc)} - Path: {request.url.path} - Request ID: {request_id}")
+        logger.error("Database Error: %s", exc, extra={"path": request.url.path})
 
         if isinstance(exc, IntegrityError):
             error_detail = "Database integrity constraint violation"
@@ -162,8 +160,10 @@ def setup_error_handlers(app):
         request_id = getattr(request.state, "request_id", None)
 
         logger.error(
-            f"Unhandled Exception: {type(exc).__name__} - {str(exc)} - "
-            f"Path: {request.url.path} - Request ID: {request_id}",
+            "Unhandled Exception: %s - %s",
+            type(exc).__name__,
+            exc,
+            extra={"path": request.url.path, "request_id": request_id},
             exc_info=True,
         )
 
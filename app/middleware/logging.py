@@ -30,42 +30,46 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         if request.url.path in self.skip_paths:
             return await call_next(request)
 
-        start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
+        start_time = time.perf_counter()
 
-        if self.log_requests:
+        if self.log_requests and logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Incoming request: {request.method} {request.url.path} - "
-                f"Request ID: {request_id} - "
-                f"User-Agent: {request.headers.get('user-agent', 'Unknown')} - "
-                f"Client IP: {get_client_ip(request)} - "
-                f"Query params: {dict(request.query_params)}"
+                "Incoming request: %s %s",
+                request.method,
+                request.url.path,
+                extra={
+                    "user_agent": request.headers.get("user-agent", "Unknown"),
+                    "client_ip": get_client_ip(request),
+                    "query_params": dict(request.query_params),
+                },
             )
 
         try:
             response = await call_next(request)
 
-            if self.log_responses:
-                process_time = time.time() - start_time
+            if self.log_responses and logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"Outgoing response: {response.status_code} - "
-                    f"Request ID: {request_id} - "
-                    f"Processing time: {process_time:.4f}s - "
-                    f"Content-Length: {response.headers.get('content-length', 'Unknown')} - "
-                    f"Content-Type: {response.headers.get('content-type', 'Unknown')}"
+                    "Outgoing response: %s",
+                    response.status_code,
+                    extra={
+                        "status_code": response.status_code,
+                        "process_time": round(time.perf_counter() - start_time, 4),
+                        "content_length": response.headers.get("content-length"),
+                        "content_type": response.headers.get("content-type"),
+                    },
                 )
 
             return response
 
         except Exception as e:
-            process_time = time.time() - start_time
             logger.error(
-                f"Request failed: {str(e)} - "
-                f"Request ID: {request_id} - "
-                f"Processing time: {process_time:.4f}s - "
-                f"Path: {request.url.path} - "
-                f"Method: {request.method} - "
-                f"Client IP: {get_client_ip(request)}",
+                "Request failed: %s",
+                e,
+                extra={
+                    "path": request.url.path,
+                    "process_time": round(time.perf_counter() - start_time, 4),
+                    "client_ip": get_client_ip(request),
+                },
                 exc_info=True,
             )
             raise
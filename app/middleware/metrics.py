@@ -0,0 +1,43 @@
+from collections.abc import Callable
+import time
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS, HTTP_REQUESTS_IN_PROGRESS
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware for collecting per-route request metrics."""
+
+    def __init__(self, app, skip_paths: list[str] | None = None):
+        super().__init__(app)
+        self.skip_paths = skip_paths or []
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if request.url.path in self.skip_paths:
+            return await call_next(request)
+
+        method = request.method
+        start_time = time.perf_counter()
+        status_code = 500
+        # The route template is only known once routing has happened, so in-flight requests are tracked per method
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            in_progress.dec()
+            route = self._route_template(request)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(time.perf_counter() - start_time)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+
+    @staticmethod
+    def _route_template(request: Request) -> str:
+        """Templated path such as ``/api/races/{race_id}``, keeping label cardinality bounded."""
+        route = request.scope.get("route")
+        return getattr(route, "path_format", None) or UNMATCHED_ROUTE
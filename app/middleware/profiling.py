@@ -0,0 +1,106 @@
+import logging
+import random
+import uuid
+
+from fastapi import HTTPException
+from fastapi.security import HTTPBearer
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.auth.utils.token_utils import verify_token
+from app.core.profiling import SamplingProfiler
+from app.profiling.services import ProfilingService
+from app.settings import settings
+from app.users.repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """Middleware for profiling requests on demand.
+
+    A request is profiled when a founder sends the profiling header, or when it falls
+    into the configured sample rate. It is written as plain ASGI so requests that are
+    not profiled only pay for a header lookup.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Profile",
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        skip_paths: list[str] | None = None,
+    ):
+        self.app = app
+        self.header_key = header_name.lower().encode()
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.skip_paths = tuple(skip_paths or [])
+        self.security = HTTPBearer(auto_error=False)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_paths):
+            await self.app(scope, receive, send)
+            return
+
+        trigger = None
+        if any(key == self.header_key for key, _ in scope["headers"]) and await self._is_founder(scope):
+            trigger = "header"
+        elif self.sample_rate and random.random() < self.sample_rate:  # nosec B311
+            trigger = "sampled"
+
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self._profile(scope, receive, send, trigger)
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send, trigger: str) -> None:
+        profile_id = uuid.uuid4().hex
+        status_code = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        profiler = SamplingProfiler(self.interval)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            try:
+                await ProfilingService().save_profile(
+                    profile_id, profiler, scope["method"], scope["path"], status_code, trigger
+                )
+            except Exception:
+                logger.exception("Failed to store profile %s for %s %s", profile_id, scope["method"], scope["path"])
+
+    async def _is_founder(self, scope: Scope) -> bool:
+        """Whether the request carries a valid access token of a founder."""
+        credentials = await self.security(Request(scope))
+        try:
+            email = await verify_token(credentials, "access")
+            return await run_in_threadpool(self._has_founder_role, email)
+        except HTTPException:
+            return False
+        except Exception:
+            # The header must not turn a failing token blacklist or user lookup into an error of the request itself
+            logger.warning(
+                "Could not check the profiling header of %s %s", scope["method"], scope["path"], exc_info=True
+            )
+            return False
+
+    @staticmethod
+    def _has_founder_role(email: str) -> bool:
+        db = settings.SessionLocal()
+        try:
+            user = UserRepository(db).get_by_email(email)
+            return user is not None and str(user.role) == "found_father"
+        finally:
+            db.close()
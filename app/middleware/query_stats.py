@@ -0,0 +1,58 @@
+from collections.abc import Callable
+import logging
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Middleware for counting SQL queries per request and flagging N+1 patterns."""
+
+    def __init__(
+        self,
+        app,
+        repeated_query_threshold: int = 5,
+        query_count_threshold: int = 20,
+        skip_paths: list[str] | None = None,
+    ):
+        super().__init__(app)
+        self.repeated_query_threshold = repeated_query_threshold
+        self.query_count_threshold = query_count_threshold
+        self.skip_paths = skip_paths or []
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if request.url.path in self.skip_paths:
+            return await call_next(request)
+
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        duration_ms = stats.duration * 1000
+        response.headers.append("Server-Timing", f'db;dur={duration_ms:.2f};desc="{stats.count} queries"')
+
+        for shape, count in stats.repeated(self.repeated_query_threshold).items():
+            logger.warning(
+                "Possible N+1 query: %s %s - Executed %d times: %s",
+                request.method,
+                request.url.path,
+                count,
+                shape,
+                extra={"query_shape": shape, "query_repeats": count},
+            )
+
+        level = logging.WARNING if stats.count > self.query_count_threshold else logging.DEBUG
+        logger.log(
+            level,
+            "SQL stats: %s %s - Queries: %d - DB time: %.2fms",
+            request.method,
+            request.url.path,
+            stats.count,
+            duration_ms,
+            extra={"query_count": stats.count, "db_time_ms": round(duration_ms, 2)},
+        )
+
+        return response
@@ -0,0 +1,58 @@
+import math
+import time
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.db_routing import RoutingTarget, route_to, track_writes
+
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class ReplicaRoutingMiddleware:
+    """Middleware choosing which database serves a request.
+
+    GET and HEAD requests may read from a replica. A request that wrote to the
+    primary sets a short-lived cookie, and the client's requests carrying it are
+    served by the primary so they see their own writes. Written as plain ASGI
+    since it runs on every request.
+    """
+
+    def __init__(self, app: ASGIApp, cookie_name: str = "db_primary_until", sticky_seconds: float = 5.0):
+        self.app = app
+        self.cookie_name = cookie_name
+        self.sticky_seconds = sticky_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        target: RoutingTarget | None
+        if self._is_pinned(scope):
+            target = "primary"
+        elif scope["method"] in SAFE_METHODS:
+            target = "replica"
+        else:
+            target = None
+
+        with route_to(target), track_writes() as writes:
+
+            async def send_with_pin(message: Message) -> None:
+                if message["type"] == "http.response.start" and writes.wrote and message["status"] < 400:
+                    message["headers"] = [*message.get("headers", []), (b"set-cookie", self._pin_cookie())]
+                await send(message)
+
+            await self.app(scope, receive, send_with_pin)
+
+    def _is_pinned(self, scope: Scope) -> bool:
+        pinned_until = Request(scope).cookies.get(self.cookie_name)
+        try:
+            return pinned_until is not None and float(pinned_until) > time.time()
+        except ValueError:
+            return False
+
+    def _pin_cookie(self) -> bytes:
+        until = time.time() + self.sticky_seconds
+        max_age = math.ceil(self.sticky_seconds)
+        return f"{self.cookie_name}={until:.3f}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=lax".encode()
@@ -4,9 +4,11 @@ import uuid
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.structured_logging import bind_request_context, reset_request_context
+
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding unique request IDs."""
+    """Middleware for adding unique request IDs and binding the logging context."""
 
     def __init__(self, app, header_name: str = "X-Request-ID"):
         super().__init__(app)
@@ -18,7 +20,11 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         request_id = request.headers.get(self.header_name, str(uuid.uuid4()))
         request.state.request_id = request_id
 
-        response = await call_next(request)
+        token = bind_request_context(request_id=request_id, method=request.method, scope=request.scope)
+        try:
+            response = await call_next(request)
+        finally:
+            reset_request_context(token)
         response.headers[self.header_name] = request_id
 
         return response
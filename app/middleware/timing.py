@@ -25,9 +25,11 @@ class TimingMiddleware(BaseHTTPMiddleware):
         response.headers["X-Process-Time"] = str(round(process_time, 4))
         if self.log_slow_requests and process_time > self.slow_threshold:
             logger.warning(
-                f"Slow request detected: {request.method} {request.url.path} - "
-                f"Processing time: {process_time:.4f}s - "
-                f"Response status: {response.status_code}"
+                "Slow request detected: %s %s - Processing time: %.4fs - Response status: %s",
+                request.method,
+                request.url.path,
+                process_time,
+                response.status_code,
             )
 
         return response
@@ -50,12 +50,12 @@ class AutoTokenRefreshMiddleware(BaseHTTPMiddleware):
                     if new_access_token:
                         response.headers["X-New-Access-Token"] = new_access_token
                         response.headers["X-Token-Refreshed"] = "true"
-                        logger.info(f"Token auto-refreshed for {request.url.path}")
+                        logger.info("Token auto-refreshed for %s", request.url.path)
 
                 finally:
                     db.close()
 
         except Exception as e:
-            logger.warning(f"Token refresh failed: {e}")
+            logger.warning("Token refresh failed: %s", e)
 
         return response
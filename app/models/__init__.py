@@ -5,8 +5,10 @@ from app.models.character_model import Character  # noqa: F401
 from app.models.charcter_game_stats_model import CharacterGameStats  # noqa: F401
 from app.models.class_model import Class  # noqa: F401
 from app.models.entity_ability import EntityAbility  # noqa: F401
+from app.models.entity_relation_model import EntityRelation  # noqa: F401
 from app.models.faction_model import Faction  # noqa: F401
 from app.models.location_model import Location  # noqa: F401
 from app.models.race_model import Race  # noqa: F401
+from app.models.tag_facet_model import TagFacet  # noqa: F401
 from app.models.user_model import User  # noqa: F401
 from app.settings import settings  # noqa: F401
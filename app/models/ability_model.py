@@ -13,9 +13,9 @@ class Ability(settings.Base):  # type: ignore
 
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text)
-    category = Column(String(30), nullable=False, index=True)
+    category = Column(String(30), nullable=False)
 
-    usage_type = Column(String(20), default="passive", index=True)
+    usage_type = Column(String(20), default="passive")
     resource_cost = Column(Integer, default=0)
     resource_type = Column(String(20))
     duration = Column(String(50))
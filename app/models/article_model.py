@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy import Boolean, CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import INT4RANGE
 
 from app.constants import (
     ARTICLE_CATEGORIES,
@@ -19,21 +20,22 @@ class Article(settings.Base):  # type: ignore
     # Required basic information
     title = Column(String(300), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    article_type = Column(String(50), nullable=False, index=True)
+    article_type = Column(String(50), nullable=False)
     status = Column(String(20), nullable=False, default="draft", index=True)
 
     # Authorship and timestamps
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     last_modified_by_user_id = Column(Integer, ForeignKey("users.id"), index=True)
-    created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Content structure
     summary = Column(Text)
 
     # Categorization
-    category = Column(String(50), index=True)
+    category = Column(String(50))
     historical_period = Column(String(100), index=True)
+    period_years = Column(INT4RANGE)
 
     # Primary entity relationships
     primary_character_id = Column(Integer, ForeignKey("characters.id", ondelete=ON_DELETE_SET_NULL), index=True)
@@ -68,6 +70,7 @@ class Article(settings.Base):  # type: ignore
             postgresql_ops={"title": "gin_trgm_ops"},
         ),
         Index("idx_article_content_fts", "content", postgresql_using="gin"),
+        Index("idx_article_period_years", "period_years", postgresql_using="gist"),
     )
 
     def __repr__(self):
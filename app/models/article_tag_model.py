@@ -11,7 +11,6 @@ class ArticleTag(settings.Base):  # type: ignore
     tag = Column(String(50), nullable=False)
 
     __table_args__ = (
-        Index("idx_article_tags_article", "article_id"),
         Index("idx_article_tags_tag", "tag"),
         UniqueConstraint("article_id", "tag", name="uq_article_tag"),
     )
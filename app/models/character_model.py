@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import CheckConstraint, Column, Computed, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import INT4RANGE
 
 from app.constants import CHARACTER_STATUSES, CHARACTER_TYPES, SOCIAL_RANKS, create_enum_constraint
 from app.settings import settings
@@ -12,13 +13,13 @@ class Character(settings.Base):  # type: ignore
 
     # Required basic information
     name = Column(String(200), nullable=False, index=True)
-    type = Column(String(20), nullable=False, default="npc", index=True)
+    type = Column(String(20), nullable=False, default="npc")
     status = Column(String(20), nullable=False, default="alive", index=True)
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
 
-    player_user_id = Column(Integer, ForeignKey("users.id"), index=True)
-    created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    player_user_id = Column(Integer, ForeignKey("users.id"))
+    created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Optional name information
     full_name = Column(String(400), index=True)
@@ -29,6 +30,10 @@ class Character(settings.Base):  # type: ignore
     biography = Column(Text)
     birth_year = Column(Integer, index=True)
     death_year = Column(Integer, index=True)
+    lifespan = Column(
+        INT4RANGE,
+        Computed("CASE WHEN birth_year IS NOT NULL THEN int4range(birth_year, death_year, '[]') END", persisted=True),
+    )
 
     # Social status information
     social_rank = Column(String(50), index=True)
@@ -59,6 +64,7 @@ class Character(settings.Base):  # type: ignore
         Index("idx_character_type_status", "type", "status"),
         Index("idx_character_player_user", "player_user_id", "type"),
         Index("idx_character_created_by", "created_by_user_id", "created_at"),
+        Index("idx_character_lifespan", "lifespan", postgresql_using="gist"),
         Index(
             "idx_character_name_trgm",
             "name",
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Integer
 
 from app.constants import create_range_constraint
 from app.settings import settings
@@ -78,6 +78,8 @@ class CharacterGameStats(settings.Base):  # type: ignore
             "hit_points_current IS NULL OR hit_points_current >= 0",
             name="check_hp_current_nonnegative",
         ),
+        Index("idx_character_game_stats_class_id", "class_id"),
+        Index("idx_character_game_stats_subclass_id", "subclass_id"),
     )
 
     def __repr__(self):
@@ -10,9 +10,9 @@ class EntityAbility(settings.Base):  # type: ignore
     __tablename__ = "entity_abilities"
 
     id = Column(Integer, primary_key=True)
-    entity_type = Column(String(20), nullable=False, index=True)
+    entity_type = Column(String(20), nullable=False)
     entity_id = Column(Integer, nullable=False, index=True)
-    ability_id = Column(Integer, nullable=False, index=True)
+    ability_id = Column(Integer, nullable=False)
 
     created_at = Column(DateTime, default=datetime.now, nullable=False)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
@@ -23,9 +23,7 @@ class EntityAbility(settings.Base):  # type: ignore
             name="check_entity_type",
         ),
         UniqueConstraint("entity_type", "entity_id", "ability_id", name="uq_entity_ability"),
-        Index("idx_entity_ability_entity", "entity_type", "entity_id"),
         Index("idx_entity_ability_ability", "ability_id"),
-        Index("idx_entity_ability_type", "entity_type"),
     )
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import CheckConstraint, Column, Computed, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import INT4RANGE
 
 from app.constants import FACTION_STATUSES, FACTION_TYPES, LEADERSHIP_TYPES, create_enum_constraint
 from app.settings import settings
@@ -12,20 +13,26 @@ class Faction(settings.Base):  # type: ignore
 
     # Basic info
     name = Column(String(100), nullable=False, index=True)
-    type = Column(String(50), nullable=False, index=True)
+    type = Column(String(50), nullable=False)
     description = Column(Text)
 
     # Status
     status = Column(String(30), default="активная", index=True)
     founded_year = Column(Integer, index=True)
     fallen_year = Column(Integer)
+    active_years = Column(
+        INT4RANGE,
+        Computed(
+            "CASE WHEN founded_year IS NOT NULL THEN int4range(founded_year, fallen_year, '[]') END", persisted=True
+        ),
+    )
 
     # Leadership
     leadership_type = Column(String(30), index=True)
     current_leader_name = Column(String(200), index=True)
 
     # Culture
-    dominant_culture = Column(String(50), index=True)
+    dominant_culture = Column(String(50))
     primary_religion = Column(String(50), index=True)
     current_goals = Column(Text)
 
@@ -58,6 +65,7 @@ class Faction(settings.Base):  # type: ignore
         ),
         # Basic indexes
         Index("idx_faction_type_status", "type", "status"),
+        Index("idx_faction_active_years", "active_years", postgresql_using="gist"),
         Index(
             "idx_faction_name_trgm",
             "name",
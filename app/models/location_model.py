@@ -19,7 +19,7 @@ class Location(settings.Base):  # type: ignore
     climate = Column(String(30))
 
     # Current status
-    current_status = Column(String(20), default="активная", index=True)
+    current_status = Column(String(20), default="активная")
     danger_level = Column(String(20), default="безопасная", index=True)
 
     # Coordinates (basic positioning)
@@ -0,0 +1,109 @@
+from sqlalchemy import DDL, Column, Index, Integer, String, UniqueConstraint, event
+
+from app.settings import settings
+
+
+class TagFacet(settings.Base):  # type: ignore
+    """Article counts per (tag, status, category), maintained by database triggers."""
+
+    __tablename__ = "tag_facets"
+    id = Column(Integer, primary_key=True)
+
+    tag = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    category = Column(String(50))
+    article_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tag",
+            "status",
+            "category",
+            name="uq_tag_facet",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("idx_tag_facet_status_category", "status", "category", "article_count"),
+    )
+
+    def __repr__(self):
+        return f"<TagFacet(tag='{self.tag}', status='{self.status}', count={self.article_count})>"
+
+
+TAG_FACET_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION tag_facets_apply(p_tag VARCHAR, p_status VARCHAR, p_category VARCHAR, p_delta INTEGER)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO tag_facets (tag, status, category, article_count)
+    VALUES (p_tag, p_status, p_category, p_delta)
+    ON CONFLICT (tag, status, category) DO UPDATE
+        SET article_count = tag_facets.article_count + EXCLUDED.article_count;
+
+    IF p_delta < 0 THEN
+        DELETE FROM tag_facets
+        WHERE tag = p_tag AND status = p_status
+          AND category IS NOT DISTINCT FROM p_category AND article_count <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION article_tags_facets_trigger() RETURNS trigger AS $$
+DECLARE
+    article_status VARCHAR;
+    article_category VARCHAR;
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        SELECT status, category INTO article_status, article_category FROM articles WHERE id = OLD.article_id;
+        IF FOUND THEN
+            PERFORM tag_facets_apply(OLD.tag, article_status, article_category, -1);
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT status, category INTO article_status, article_category FROM articles WHERE id = NEW.article_id;
+        IF FOUND THEN
+            PERFORM tag_facets_apply(NEW.tag, article_status, article_category, 1);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION articles_facets_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM tag_facets_apply(tag, OLD.status, OLD.category, -1) FROM article_tags WHERE article_id = OLD.id;
+        RETURN OLD;
+    END IF;
+
+    IF NEW.status IS DISTINCT FROM OLD.status OR NEW.category IS DISTINCT FROM OLD.category THEN
+        PERFORM tag_facets_apply(tag, OLD.status, OLD.category, -1) FROM article_tags WHERE article_id = OLD.id;
+        PERFORM tag_facets_apply(tag, NEW.status, NEW.category, 1) FROM article_tags WHERE article_id = NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TAG_FACET_TRIGGERS = """
+CREATE OR REPLACE TRIGGER trg_article_tags_facets
+    AFTER INSERT OR DELETE OR UPDATE OF tag, article_id ON article_tags
+    FOR EACH ROW EXECUTE FUNCTION article_tags_facets_trigger();
+
+CREATE OR REPLACE TRIGGER trg_articles_facets_delete
+    BEFORE DELETE ON articles
+    FOR EACH ROW EXECUTE FUNCTION articles_facets_trigger();
+
+CREATE OR REPLACE TRIGGER trg_articles_facets_update
+    AFTER UPDATE OF status, category ON articles
+    FOR EACH ROW EXECUTE FUNCTION articles_facets_trigger();
+"""
+
+DROP_TAG_FACET_FUNCTIONS = """
+DROP FUNCTION IF EXISTS articles_facets_trigger() CASCADE;
+DROP FUNCTION IF EXISTS article_tags_facets_trigger() CASCADE;
+DROP FUNCTION IF EXISTS tag_facets_apply(VARCHAR, VARCHAR, VARCHAR, INTEGER);
+"""
+
+event.listen(settings.Base.metadata, "after_create", DDL(TAG_FACET_FUNCTIONS + TAG_FACET_TRIGGERS))
+event.listen(settings.Base.metadata, "after_drop", DDL(DROP_TAG_FACET_FUNCTIONS))
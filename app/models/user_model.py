@@ -9,7 +9,7 @@ from app.settings import settings
 class User(settings.Base):  # type: ignore
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     phone = Column(String(20), nullable=True)
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.dependencies import FounderUserDep, ProfilingServiceDep
+from app.profiling.schemas import ProfileListResponse, ProfileResponse
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ProfileListResponse)
+async def list_profiles(
+    profiling_service: ProfilingServiceDep,
+    _: FounderUserDep,
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of profiles"),
+):
+    """List stored request profiles, newest first."""
+    return await profiling_service.list_profiles(limit=limit)
+
+
+@router.get("/{profile_id}", response_model=ProfileResponse)
+async def get_profile(profile_id: str, profiling_service: ProfilingServiceDep, _: FounderUserDep):
+    """Get a stored profile with its call tree."""
+    return await profiling_service.get_profile(profile_id)
+
+
+@router.get("/{profile_id}/flamegraph", response_class=PlainTextResponse)
+async def download_flamegraph(profile_id: str, profiling_service: ProfilingServiceDep, _: FounderUserDep):
+    """Download a profile in the collapsed-stack format for flamegraph.pl or speedscope."""
+    collapsed = await profiling_service.get_collapsed_stacks(profile_id)
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'},
+    )
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileSummary(BaseModel):
+    """Schema for a stored request profile without its samples"""
+
+    id: str = Field(..., description="Profile ID")
+    method: str = Field(..., description="HTTP method")
+    path: str = Field(..., description="Request path")
+    status_code: int = Field(..., description="Response status code")
+    duration_ms: float = Field(..., description="Profiled time in milliseconds")
+    samples: int = Field(..., description="Number of stack samples")
+    trigger: str = Field(..., description="What started profiling: header or sampled")
+    created_at: datetime = Field(..., description="When the request was profiled")
+
+
+class ProfileResponse(ProfileSummary):
+    """Schema for a stored request profile with its call tree"""
+
+    call_tree: dict = Field(..., description="Samples merged into a call tree")
+
+
+class ProfileListResponse(BaseModel):
+    """Schema for the list of stored profiles"""
+
+    profiles: list[ProfileSummary] = Field(..., description="Profiles, newest first")
@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+import json
+
+from app.core.profiling import SamplingProfiler
+from app.exceptions.profiling_exceptions import ProfileNotFoundException
+from app.profiling.schemas import ProfileListResponse, ProfileResponse, ProfileSummary
+from app.settings import settings
+
+PROFILE_INDEX_KEY = "profiles"
+
+
+def profile_key(profile_id: str) -> str:
+    return f"profile:{profile_id}"
+
+
+class ProfilingService:
+    """Service for storing and reading request profiles in Redis"""
+
+    async def save_profile(
+        self, profile_id: str, profiler: SamplingProfiler, method: str, path: str, status_code: int, trigger: str
+    ) -> None:
+        """Storing a finished profile and trimming the oldest ones."""
+        created_at = datetime.now(timezone.utc)
+        summary = ProfileSummary(
+            id=profile_id,
+            method=method,
+            path=path,
+            status_code=status_code,
+            duration_ms=round(profiler.duration * 1000, 3),
+            samples=sum(profiler.samples.values()),
+            trigger=trigger,
+            created_at=created_at,
+        )
+
+        async with settings.get_redis() as redis:
+            await redis.hset(
+                profile_key(profile_id),
+                mapping={
+                    "summary": summary.model_dump_json(),
+                    "call_tree": json.dumps(profiler.call_tree()),
+                    "collapsed": profiler.collapsed(),
+                },
+            )
+            await redis.expire(profile_key(profile_id), settings.PROFILING_TTL)
+            await redis.zadd(PROFILE_INDEX_KEY, {profile_id: created_at.timestamp()})
+            await redis.zremrangebyrank(PROFILE_INDEX_KEY, 0, -settings.PROFILING_MAX_STORED - 1)
+
+    async def list_profiles(self, limit: int = 50) -> ProfileListResponse:
+        """Obtaining the newest stored profiles."""
+        async with settings.get_redis() as redis:
+            profile_ids = await redis.zrevrange(PROFILE_INDEX_KEY, 0, limit - 1)
+            async with redis.pipeline(transaction=False) as pipe:
+                for profile_id in profile_ids:
+                    pipe.hget(profile_key(profile_id), "summary")
+                summaries = await pipe.execute()
+
+            expired = [profile_id for profile_id, summary in zip(profile_ids, summaries, strict=True) if not summary]
+            if expired:
+                await redis.zrem(PROFILE_INDEX_KEY, *expired)
+
+        return ProfileListResponse(
+            profiles=[ProfileSummary.model_validate_json(summary) for summary in summaries if summary]
+        )
+
+    async def get_profile(self, profile_id: str) -> ProfileResponse:
+        """Obtaining a profile with its call tree."""
+        async with settings.get_redis() as redis:
+            summary, call_tree = await redis.hmget(profile_key(profile_id), ["summary", "call_tree"])
+        if summary is None:
+            raise ProfileNotFoundException(profile_id)
+
+        return ProfileResponse(**json.loads(summary), call_tree=json.loads(call_tree))
+
+    async def get_collapsed_stacks(self, profile_id: str) -> str:
+        """Obtaining a profile in the collapsed-stack (flamegraph) format."""
+        async with settings.get_redis() as redis:
+            collapsed = await redis.hget(profile_key(profile_id), "collapsed")
+        if collapsed is None:
+            raise ProfileNotFoundException(profile_id)
+
+        return collapsed
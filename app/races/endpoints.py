@@ -12,9 +12,13 @@ def get_all_races(
     race_service: RaceServiceDep,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    filters: list[str] | None = Query(
+        None, alias="filter", description="Filters as field:operator:value, e.g. name:prefix:Эль"
+    ),
+    sort: str | None = Query(None, description="Comma-separated fields to sort by, - for descending, e.g. -name"),
 ):
-    """Get all races with pagination."""
-    return race_service.get_races_with_pagination(page=page, size=size)
+    """Get races matching the filters with pagination."""
+    return race_service.get_races_with_pagination(page=page, size=size, filters=filters, sort=sort)
 
 
 @router.get("/playable", response_model=list[RaceResponse])
@@ -1,18 +1,35 @@
 from sqlalchemy.orm import Session
 
+from app.core.cache import CachedRepositoryMixin
+from app.core.filters import FilterField, FilterSet
 from app.core.repository import BaseRepository
 from app.models import Race
 
 
-class RaceRepository(BaseRepository[Race]):
-    """Repository for working with Race in the database"""
+class RaceRepository(CachedRepositoryMixin, BaseRepository[Race]):
+    """Repository for working with Race in the database, with cached reads of this reference data"""
+
+    filters = FilterSet(
+        Race,
+        {
+            "id": FilterField(("eq", "in", "range"), btree="races_pkey", sortable=True),
+            "name": FilterField(
+                ("eq", "in", "prefix", "similar"), btree="ix_races_name", trigram="idx_race_name_trgm", sortable=True
+            ),
+            "size": FilterField(("eq", "in"), btree="ix_races_size", sortable=True),
+            "is_playable": FilterField(("eq",), btree="ix_races_is_playable"),
+            "description": FilterField(("is_null",)),
+            "created_at": FilterField(("range",), sortable=True),
+            "updated_at": FilterField(("range",), sortable=True),
+        },
+    )
 
     def __init__(self, db: Session):
         super().__init__(Race, db)
 
     def get_by_name(self, name: str) -> Race | None:
         """Obtaining a race by name."""
-        return self.db.query(Race).filter(Race.name == name).first()
+        return self.cached_one("name", name, loader=lambda: self.db.query(Race).filter(Race.name == name).first())
 
     def exists_by_name(self, name: str, exclude_id: int | None = None) -> bool:
         """Checking the existence of a race by name."""
@@ -23,4 +40,4 @@ class RaceRepository(BaseRepository[Race]):
 
     def get_playable_races(self) -> list[Race]:
         """Obtaining only playable races."""
-        return self.db.query(Race).filter(Race.is_playable).all()
+        return self.cached_all("playable", loader=lambda: self.db.query(Race).filter(Race.is_playable).all())
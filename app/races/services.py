@@ -32,11 +32,13 @@ class RaceService:
         races = self.repository.get_all(skip=skip, limit=limit)
         return [RaceResponse.model_validate(race) for race in races]
 
-    def get_races_with_pagination(self, page: int = 1, size: int = 10) -> RaceListResponse:
-        """Obtaining races with pagination and metadata."""
+    def get_races_with_pagination(
+        self, page: int = 1, size: int = 10, filters: list[str] | None = None, sort: str | None = None
+    ) -> RaceListResponse:
+        """Obtaining races matching the filters, with pagination and metadata."""
         skip = (page - 1) * size
-        races = self.repository.get_all(skip=skip, limit=size)
-        total = self.repository.count_all()
+        list_query = self.repository.filters.parse(filters, sort)
+        races, total = self.repository.list_by_fields(list_query, skip=skip, limit=size)
 
         race_responses = [RaceResponse.model_validate(race) for race in races]
 
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Query
+
+from app.core.dependencies import RelationServiceDep
+from app.relations.schemas import RelatedEntitiesResponse
+
+router = APIRouter()
+
+
+@router.get("/{entity_type}/{entity_id}", response_model=RelatedEntitiesResponse)
+def get_related_entities(
+    entity_type: str,
+    entity_id: int,
+    relation_service: RelationServiceDep,
+    depth: int = Query(2, ge=1, le=2, description="Maximum number of hops"),
+    types: list[str] | None = Query(None, description="Entity types to return"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of related entities"),
+):
+    """Get entities linked to an entity directly or through one other entity, most relevant first."""
+    return relation_service.get_related(entity_type, entity_id, depth=depth, entity_types=types, limit=limit)
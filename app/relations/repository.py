@@ -0,0 +1,103 @@
+from typing import Any
+
+from sqlalchemy import Float, and_, cast, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from app.core.repository import BaseRepository
+from app.models import Article, Character, EntityRelation, Faction, Location, Race, User
+
+# A two-hop path counts a quarter of a direct link of the same weight
+TWO_HOP_DECAY = 0.25
+
+
+class RelationRepository(BaseRepository[EntityRelation]):
+    """Repository for neighbourhood queries over the trigger-maintained entity_relations adjacency table."""
+
+    def __init__(self, db: Session):
+        super().__init__(EntityRelation, db)
+
+    def get_neighbourhood(
+        self,
+        entity_type: str,
+        entity_id: int,
+        depth: int = 2,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+        hidden_types: list[str] | None = None,
+    ) -> list:
+        """Obtaining entities within ``depth`` hops, ranked by the summed weight of the paths reaching them.
+
+        Both hops are lookups on the ``(source_type, source_id)`` prefix of the
+        unique index; names are joined only for the returned page. Unpublished
+        articles are traversed but not returned; ``hidden_types`` are neither.
+        """
+        first = aliased(EntityRelation)
+        second = aliased(EntityRelation)
+        start = and_(first.source_type == entity_type, first.source_id == entity_id)
+
+        paths = [
+            select(
+                first.target_type.label("entity_type"),
+                first.target_id.label("id"),
+                literal(1).label("depth"),
+                first.relation.label("relation"),
+                cast(first.weight, Float).label("score"),
+            ).where(start)
+        ]
+        if depth >= 2:
+            paths.append(
+                select(
+                    second.target_type,
+                    second.target_id,
+                    literal(2),
+                    second.relation,
+                    cast(first.weight * second.weight, Float) * TWO_HOP_DECAY,
+                )
+                .join(second, and_(second.source_type == first.target_type, second.source_id == first.target_id))
+                .where(start, or_(second.target_type != entity_type, second.target_id != entity_id))
+            )
+            if hidden_types:
+                paths[1] = paths[1].where(first.target_type.not_in(hidden_types))
+        path = union_all(*paths).subquery("path")
+
+        grouped = select(
+            path.c.entity_type,
+            path.c.id,
+            func.min(path.c.depth).label("depth"),
+            func.sum(path.c.score).label("score"),
+            func.array_agg(path.c.relation.distinct()).label("relations"),
+        ).group_by(path.c.entity_type, path.c.id)
+        if entity_types is not None:
+            grouped = grouped.where(path.c.entity_type.in_(entity_types))
+        if hidden_types:
+            grouped = grouped.where(path.c.entity_type.not_in(hidden_types))
+        ranked = grouped.subquery("ranked")
+
+        # Unpublished articles are dropped before the page is cut, the other names are joined to the page only
+        order = (ranked.c.score.desc(), ranked.c.depth, ranked.c.entity_type, ranked.c.id)
+        page = (
+            select(ranked, Article.title.label("article_title"))
+            .outerjoin(Article, and_(ranked.c.entity_type == "article", Article.id == ranked.c.id))
+            .where(or_(ranked.c.entity_type != "article", Article.status == "published"))
+            .order_by(*order)
+            .limit(limit)
+            .subquery("page")
+        )
+
+        names: dict[str, tuple[type[Any], Any]] = {
+            "character": (Character, Character.name),
+            "location": (Location, Location.name),
+            "faction": (Faction, Faction.name),
+            "race": (Race, Race.name),
+            "user": (User, User.username),
+        }
+        query = select(page.c.entity_type, page.c.id, page.c.depth, page.c.score, page.c.relations)
+        name_columns = [page.c.article_title]
+        for name_type, (model, name) in names.items():
+            query = query.outerjoin(model, and_(page.c.entity_type == name_type, model.id == page.c.id))
+            name_columns.append(name)
+
+        query = query.add_columns(func.coalesce(*name_columns).label("name")).order_by(
+            page.c.score.desc(), page.c.depth, page.c.entity_type, page.c.id
+        )
+        return list(self.db.execute(query).all())
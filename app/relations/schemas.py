@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+
+class RelatedEntity(BaseModel):
+    """Schema for an entity in the neighbourhood of another one"""
+
+    entity_type: str = Field(..., description="Entity type: article, character, location, faction or race")
+    id: int = Field(..., description="Entity ID")
+    name: str | None = Field(None, description="Name or article title")
+    depth: int = Field(..., ge=1, le=2, description="Hops on the shortest path from the requested entity")
+    score: float = Field(..., description="Relevance: sum of path weights, two-hop paths weighted down")
+    relations: list[str] = Field(..., description="Kinds of links leading to the entity")
+
+
+class RelatedEntitiesResponse(BaseModel):
+    """Schema for the ranked neighbourhood of an entity"""
+
+    entity_type: str = Field(..., description="Type of the requested entity")
+    id: int = Field(..., description="ID of the requested entity")
+    items: list[RelatedEntity] = Field(..., description="Related entities, most relevant first")
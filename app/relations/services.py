@@ -0,0 +1,47 @@
+from sqlalchemy.orm import Session
+
+from app.constants import PUBLIC_RELATION_ENTITY_TYPES, RELATION_ENTITY_TYPES
+from app.exceptions.relation_exceptions import InvalidRelationQueryException
+from app.relations.repository import RelationRepository
+from app.relations.schemas import RelatedEntitiesResponse, RelatedEntity
+
+
+class RelationService:
+    """Service for related content of articles, characters and other entities"""
+
+    def __init__(self, db: Session):
+        self.repository = RelationRepository(db)
+
+    def get_related(
+        self,
+        entity_type: str,
+        entity_id: int,
+        depth: int = 2,
+        entity_types: list[str] | None = None,
+        limit: int = 20,
+    ) -> RelatedEntitiesResponse:
+        """Obtaining entities related to an entity directly or through one other entity, most relevant first."""
+        for value in [entity_type, *(entity_types or [])]:
+            if value not in PUBLIC_RELATION_ENTITY_TYPES:
+                raise InvalidRelationQueryException("entity type", value, PUBLIC_RELATION_ENTITY_TYPES)
+
+        hidden_types = [value for value in RELATION_ENTITY_TYPES if value not in PUBLIC_RELATION_ENTITY_TYPES]
+        rows = self.repository.get_neighbourhood(
+            entity_type, entity_id, depth=depth, entity_types=entity_types, limit=limit, hidden_types=hidden_types
+        )
+
+        return RelatedEntitiesResponse(
+            entity_type=entity_type,
+            id=entity_id,
+            items=[
+                RelatedEntity(
+                    entity_type=row.entity_type,
+                    id=row.id,
+                    name=row.name,
+                    depth=row.depth,
+                    score=row.score,
+                    relations=sorted(row.relations),
+                )
+                for row in rows
+            ],
+        )
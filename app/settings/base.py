@@ -3,6 +3,8 @@ import os
 from dotenv import load_dotenv
 from sqlalchemy.orm import declarative_base
 
+from app.core.server import default_workers
+
 load_dotenv()
 ALLOWED_HOSTS = ["*"]
 Base = declarative_base()
@@ -13,6 +15,7 @@ APP_VERSION = "1.0.0"
 # STAGE
 STAGE = os.getenv("STAGE")
 HOST = "0.0.0.0"  # nosec B104
+PORT = int(os.getenv("PORT", 8000))
 
 # JWT settings
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "secret")
@@ -21,3 +24,64 @@ JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 # Admin credentials
 ADMIN_LOGIN = os.getenv("ADMIN_LOGIN")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
+
+# Encounter simulation
+ENCOUNTER_SIMULATION_WORKERS = int(os.getenv("ENCOUNTER_SIMULATION_WORKERS", 1))
+ENCOUNTER_CACHE_TTL = int(os.getenv("ENCOUNTER_CACHE_TTL", 3600))
+
+# SQL instrumentation
+SQL_REPEATED_QUERY_THRESHOLD = int(os.getenv("SQL_REPEATED_QUERY_THRESHOLD", 5))
+SQL_SLOW_REQUEST_QUERY_COUNT = int(os.getenv("SQL_SLOW_REQUEST_QUERY_COUNT", 20))
+
+# Request profiling
+PROFILING_HEADER = "X-Profile"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", 0.0))
+PROFILING_INTERVAL = float(os.getenv("PROFILING_INTERVAL", 0.005))
+PROFILING_TTL = int(os.getenv("PROFILING_TTL", 7 * 24 * 3600))
+PROFILING_MAX_STORED = int(os.getenv("PROFILING_MAX_STORED", 200))
+
+# Logging
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+
+# Health checks
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2.0))
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", 5.0))
+
+# Write-behind of hot-row updates such as users.last_login, flushed by each worker in the background
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", 5.0))
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", 500))
+
+# Redis pub/sub channel on which workers announce changed rows to evict them from in-process caches
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+
+# Repository read caches: in-process LRU (L1) per repository in front of Redis (L2)
+CACHE_L1_MAX_SIZE = int(os.getenv("CACHE_L1_MAX_SIZE", 1024))
+CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", 60))
+CACHE_L2_TTL = float(os.getenv("CACHE_L2_TTL", 300))
+CACHE_NEGATIVE_TTL = float(os.getenv("CACHE_NEGATIVE_TTL", 30))
+
+# Startup: "create_all" creates missing tables, "verify" only checks the Alembic revision, "skip" does neither
+SCHEMA_STARTUP_MODE = os.getenv("SCHEMA_STARTUP_MODE", "create_all")
+
+# Production server (gunicorn.conf.py)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 0)) or default_workers()
+WORKER_MAX_REQUESTS = int(os.getenv("WORKER_MAX_REQUESTS", 10000))
+WORKER_MAX_REQUESTS_JITTER = int(os.getenv("WORKER_MAX_REQUESTS_JITTER", 1000))
+WORKER_TIMEOUT = int(os.getenv("WORKER_TIMEOUT", 30))
+
+# Database connections all workers of one instance may hold together, kept below Postgres max_connections
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 90))
+
+# External connection pooler in front of Postgres: "none" or "pgbouncer" (transaction pooling mode)
+DATABASE_POOLER = os.getenv("DATABASE_POOLER", "none")
+# Connections each worker keeps open to the pooler; 0 opens one per checkout (NullPool)
+POOLER_POOL_SIZE = int(os.getenv("POOLER_POOL_SIZE", 0))
+
+# Read replicas
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 5.0))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", 2.0))
+# Seconds to wait for a replica connection, so an unreachable replica fails the lag check quickly
+REPLICA_CONNECT_TIMEOUT = int(os.getenv("REPLICA_CONNECT_TIMEOUT", 2))
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", 5.0))
+REPLICA_STICKY_COOKIE = "db_primary_until"
@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 
-from redis.asyncio import Redis
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
 
+from app.core.db_routing import ReplicaSet, RoutingSession
+from app.core.invalidation import InvalidationBus
+from app.core.metrics import InstrumentedRedis
+from app.core.server import get_engine_options, get_pool_limits
 from app.settings.base import *
 
 # Main PG DB
@@ -16,19 +18,25 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "slavbor_db")
 
 DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
-engine = create_engine(
-    DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_recycle=3600,
-    pool_pre_ping=True,
-    pool_timeout=30,
-    echo=False,
-    future=True,
-)
+DB_POOL_SIZE, DB_MAX_OVERFLOW = get_pool_limits(DB_MAX_CONNECTIONS, WEB_CONCURRENCY)
+ENGINE_OPTIONS = get_engine_options(DATABASE_POOLER, DB_POOL_SIZE, DB_MAX_OVERFLOW, POOLER_POOL_SIZE)
+
+engine = create_engine(DATABASE_URL, echo=False, future=True, **ENGINE_OPTIONS)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Read replicas, comma-separated URLs
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+replica_engines = [
+    create_engine(
+        url, echo=False, future=True, connect_args={"connect_timeout": REPLICA_CONNECT_TIMEOUT}, **ENGINE_OPTIONS
+    )
+    for url in DATABASE_REPLICA_URLS
+]
+replica_set = ReplicaSet(replica_engines, REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL)
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, replicas=replica_set, autocommit=False, autoflush=False, bind=engine
+)
 
 
 def get_db():
@@ -43,11 +51,14 @@ def get_db():
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_DB = int(os.getenv("REDIS_DB", 0))
+REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+
+invalidation_bus = InvalidationBus(REDIS_URL, CACHE_INVALIDATION_CHANNEL)
 
 
 @asynccontextmanager
 async def get_redis():
-    redis_client = Redis(
+    redis_client = InstrumentedRedis(
         host=REDIS_HOST,
         port=REDIS_PORT,
         db=REDIS_DB,
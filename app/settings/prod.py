@@ -1,3 +1,8 @@
 from app.settings.local import *  # noqa: F403
 
 ALLOWED_HOSTS = [""]
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+
+SCHEMA_STARTUP_MODE = os.getenv("SCHEMA_STARTUP_MODE", "verify")
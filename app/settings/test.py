@@ -1,24 +1,48 @@
 from contextlib import asynccontextmanager
 
-from redis.asyncio import Redis
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.core.db_routing import ReplicaSet, RoutingSession
+from app.core.invalidation import InvalidationBus
+from app.core.metrics import InstrumentedRedis
 from app.settings.base import *  # noqa: F403
 
+# pytest-xdist workers (gw0, gw1, ...) each get their own database, Redis DB and invalidation channel
+TEST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "")
+TEST_WORKER_INDEX = int(TEST_WORKER.removeprefix("gw") or 0)
+
 # Test Database settings
 TEST_DATABASE_USER = "slavbor_user"
 TEST_DATABASE_PASSWORD = "test_secret"  # nosec B105
 TEST_DATABASE_HOST = os.getenv("TEST_DATABASE_HOST", "localhost")
 TEST_DATABASE_PORT = 5432
-TEST_DATABASE_NAME = "slavbor_test_db"
-DATABASE_URL = (
-    f"postgresql://{TEST_DATABASE_USER}:{TEST_DATABASE_PASSWORD}@{TEST_DATABASE_HOST}:{TEST_DATABASE_PORT}/"
-    f"{TEST_DATABASE_NAME}"
-)
+# Built once per run with the schema and extensions, and cloned into each worker's database
+TEST_DATABASE_TEMPLATE = "slavbor_test_template"
+TEST_DATABASE_NAME = f"slavbor_test_db_{TEST_WORKER}" if TEST_WORKER else "slavbor_test_db"
+
+
+def get_test_database_url(database: str) -> str:
+    return (
+        f"postgresql://{TEST_DATABASE_USER}:{TEST_DATABASE_PASSWORD}@{TEST_DATABASE_HOST}:{TEST_DATABASE_PORT}/"
+        f"{database}"
+    )
+
+
+DATABASE_URL = get_test_database_url(TEST_DATABASE_NAME)
+# Databases are created and dropped from here
+TEST_MAINTENANCE_DATABASE_URL = get_test_database_url("postgres")
+
+# The test harness creates the schema once per session
+SCHEMA_STARTUP_MODE = os.getenv("SCHEMA_STARTUP_MODE", "skip")
 
 engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Tests add replica engines to replica_set where they need them
+replica_engines = []
+replica_set = ReplicaSet(replica_engines, REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL)
+SessionLocal = sessionmaker(
+    class_=RoutingSession, replicas=replica_set, autocommit=False, autoflush=False, bind=engine
+)
 
 
 def get_db():
@@ -32,12 +56,20 @@ def get_db():
 # Test Redis settings
 TEST_REDIS_HOST = os.getenv("TEST_REDIS_HOST", "localhost")
 TEST_REDIS_PORT = 6379
-TEST_REDIS_DB = 0
+# Redis has 16 databases by default, which caps the number of xdist workers
+TEST_REDIS_DB = TEST_WORKER_INDEX
+REDIS_URL = f"redis://{TEST_REDIS_HOST}:{TEST_REDIS_PORT}/{TEST_REDIS_DB}"
+
+# Pub/sub channels are shared by all Redis databases
+if TEST_WORKER:
+    CACHE_INVALIDATION_CHANNEL = f"{CACHE_INVALIDATION_CHANNEL}:{TEST_WORKER}"
+
+invalidation_bus = InvalidationBus(REDIS_URL, CACHE_INVALIDATION_CHANNEL)
 
 
 @asynccontextmanager
 async def get_redis():
-    redis_client = Redis(
+    redis_client = InstrumentedRedis(
         host=TEST_REDIS_HOST,
         port=TEST_REDIS_PORT,
         db=TEST_REDIS_DB,
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+
+from app.core.dependencies import CurrentUserDep, StatsServiceDep
+from app.stats.schemas import StatsBatchRequest, StatsBatchResponse
+
+router = APIRouter()
+
+
+@router.post("/batch", response_model=StatsBatchResponse)
+def get_batch_stats(request: StatsBatchRequest, stats_service: StatsServiceDep, _: CurrentUserDep):
+    """Compute effective stats, modifiers and saves for a batch of characters."""
+    return stats_service.get_batch_stats(request.character_ids)
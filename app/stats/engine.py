@@ -0,0 +1,101 @@
+import numpy as np
+
+ABILITY_NAMES = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+MODIFIER_COLUMNS = tuple(f"{name}_modifier" for name in ABILITY_NAMES)
+
+MIN_SCORE = 1
+MAX_SCORE = 30
+MIN_LEVEL = 1
+MAX_LEVEL = 20
+
+SAVE_ABILITY_ALIASES = {
+    "str": "strength",
+    "dex": "dexterity",
+    "con": "constitution",
+    "int": "intelligence",
+    "wis": "wisdom",
+    "cha": "charisma",
+    "сила": "strength",
+    "ловкость": "dexterity",
+    "телосложение": "constitution",
+    "интеллект": "intelligence",
+    "мудрость": "wisdom",
+    "харизма": "charisma",
+}
+
+
+def resolve_ability_index(name: str | None) -> int | None:
+    """Map an ability name or alias (e.g. class primary ability) to its column index."""
+    if not name:
+        return None
+
+    normalized = name.strip().lower()
+    normalized = SAVE_ABILITY_ALIASES.get(normalized, normalized)
+    if normalized in ABILITY_NAMES:
+        return ABILITY_NAMES.index(normalized)
+    return None
+
+
+def compute_party_stats(
+    base_scores: np.ndarray,
+    bonuses: np.ndarray,
+    levels: np.ndarray,
+    save_proficiencies: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Compute derived D&D values for N characters in one vectorized pass.
+
+    ``base_scores`` and ``bonuses`` are (N, 6) integer arrays ordered as ``ABILITY_NAMES``,
+    ``levels`` is (N,) and ``save_proficiencies`` is a (N, 6) boolean mask.
+    """
+    scores = np.clip(base_scores + bonuses, MIN_SCORE, MAX_SCORE)
+    modifiers = np.floor_divide(scores - 10, 2)
+    proficiency = 2 + (np.clip(levels, MIN_LEVEL, MAX_LEVEL) - 1) // 4
+    saving_throws = modifiers + proficiency[:, None] * save_proficiencies
+
+    return {
+        "scores": scores,
+        "modifiers": modifiers,
+        "proficiency_bonus": proficiency,
+        "saving_throws": saving_throws,
+        "initiative": modifiers[:, ABILITY_NAMES.index("dexterity")],
+        "passive_perception": 10 + modifiers[:, ABILITY_NAMES.index("wisdom")],
+    }
+
+
+def compute_character_stats(
+    base_scores: list[int],
+    bonuses: list[int],
+    level: int,
+    save_proficiencies: list[bool],
+) -> dict:
+    """Compute derived values for a single character (reference implementation)."""
+    scores = [min(max(base + bonus, MIN_SCORE), MAX_SCORE) for base, bonus in zip(base_scores, bonuses, strict=True)]
+    modifiers = [(score - 10) // 2 for score in scores]
+    proficiency = 2 + (min(max(level, MIN_LEVEL), MAX_LEVEL) - 1) // 4
+    saving_throws = [
+        modifier + (proficiency if proficient else 0)
+        for modifier, proficient in zip(modifiers, save_proficiencies, strict=True)
+    ]
+
+    return {
+        "scores": scores,
+        "modifiers": modifiers,
+        "proficiency_bonus": proficiency,
+        "saving_throws": saving_throws,
+        "initiative": modifiers[ABILITY_NAMES.index("dexterity")],
+        "passive_perception": 10 + modifiers[ABILITY_NAMES.index("wisdom")],
+    }
+
+
+def gather_by_id(owner_ids: np.ndarray, source_ids: np.ndarray, source_values: np.ndarray) -> np.ndarray:
+    """Align per-entity rows from ``source_values`` onto ``owner_ids`` (zeros where absent)."""
+    result = np.zeros((len(owner_ids), source_values.shape[1]), dtype=np.int64)
+    if len(source_ids) == 0 or len(owner_ids) == 0:
+        return result
+
+    order = np.argsort(source_ids)
+    sorted_ids = source_ids[order]
+    positions = np.clip(np.searchsorted(sorted_ids, owner_ids), 0, len(sorted_ids) - 1)
+    matched = sorted_ids[positions] == owner_ids
+    result[matched] = source_values[order][positions[matched]]
+    return result
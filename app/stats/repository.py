@@ -0,0 +1,56 @@
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.core.repository import BaseRepository
+from app.models import Ability, Character, CharacterGameStats, Class, EntityAbility
+from app.stats.engine import ABILITY_NAMES, MODIFIER_COLUMNS
+
+
+class StatsRepository(BaseRepository[CharacterGameStats]):
+    """Repository for loading character game stats in bulk."""
+
+    def __init__(self, db: Session):
+        super().__init__(CharacterGameStats, db)
+
+    def get_stats_rows(self, character_ids: list[int]) -> list:
+        """Obtaining base stats, race, class and primary ability for many characters at once."""
+        return (
+            self.db.query(
+                CharacterGameStats.character_id,
+                Character.race_id,
+                CharacterGameStats.class_id,
+                CharacterGameStats.level,
+                *(getattr(CharacterGameStats, name) for name in ABILITY_NAMES),
+                Class.primary_ability,
+            )
+            .join(Character, Character.id == CharacterGameStats.character_id)
+            .outerjoin(Class, Class.id == CharacterGameStats.class_id)
+            .filter(CharacterGameStats.character_id.in_(character_ids))
+            .all()
+        )
+
+    def get_modifier_totals(self, entity_ids: dict[str, list[int]]) -> list:
+        """Summing ability score modifiers of all abilities attached to the given entities."""
+        conditions = [
+            and_(EntityAbility.entity_type == entity_type, EntityAbility.entity_id.in_(ids))
+            for entity_type, ids in entity_ids.items()
+            if ids
+        ]
+        if not conditions:
+            return []
+
+        return (
+            self.db.query(
+                EntityAbility.entity_type,
+                EntityAbility.entity_id,
+                *(func.coalesce(func.sum(getattr(Ability, column)), 0) for column in MODIFIER_COLUMNS),
+            )
+            .join(Ability, Ability.id == EntityAbility.ability_id)
+            .filter(or_(*conditions))
+            .group_by(EntityAbility.entity_type, EntityAbility.entity_id)
+            .all()
+        )
+
+    def get_by_character_ids(self, character_ids: list[int]) -> list[CharacterGameStats]:
+        """Obtaining game stats of many characters."""
+        return self.db.query(CharacterGameStats).filter(CharacterGameStats.character_id.in_(character_ids)).all()
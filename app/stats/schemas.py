@@ -0,0 +1,39 @@
+from pydantic import BaseModel, Field, field_validator
+
+MAX_BATCH_SIZE = 10000
+
+
+class StatsBatchRequest(BaseModel):
+    """Schema for requesting derived stats of many characters"""
+
+    character_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Character IDs to compute stats for",
+    )
+
+    @field_validator("character_ids")
+    def validate_character_ids(cls, v: list[int]) -> list[int]:
+        """Drop duplicate IDs while keeping the request order"""
+        return list(dict.fromkeys(v))
+
+
+class CharacterStatsResponse(BaseModel):
+    """Schema for derived stats of a single character"""
+
+    character_id: int = Field(..., description="Character identifier")
+    level: int = Field(..., description="Character level")
+    scores: dict[str, int] = Field(..., description="Effective ability scores after ability modifiers")
+    modifiers: dict[str, int] = Field(..., description="Ability modifiers derived from effective scores")
+    proficiency_bonus: int = Field(..., description="Proficiency bonus for the character level")
+    saving_throws: dict[str, int] = Field(..., description="Saving throw bonuses")
+    initiative: int = Field(..., description="Initiative bonus")
+    passive_perception: int = Field(..., description="Passive Wisdom (Perception)")
+
+
+class StatsBatchResponse(BaseModel):
+    """Schema for batch stats response"""
+
+    characters: list[CharacterStatsResponse] = Field(..., description="Derived stats per character")
+    missing_ids: list[int] = Field(..., description="Requested IDs without game stats")
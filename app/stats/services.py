@@ -0,0 +1,103 @@
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.db_routing import read_only
+from app.stats.engine import ABILITY_NAMES, compute_party_stats, gather_by_id, resolve_ability_index
+from app.stats.repository import StatsRepository
+from app.stats.schemas import CharacterStatsResponse, StatsBatchResponse
+
+DEFAULT_SCORE = 10
+DEFAULT_LEVEL = 1
+NO_ENTITY = -1
+
+
+class StatsService:
+    """Service for computing derived character stats"""
+
+    def __init__(self, db: Session):
+        self.repository = StatsRepository(db)
+
+    @read_only
+    def get_batch_stats(self, character_ids: list[int]) -> StatsBatchResponse:
+        """Computing effective scores, modifiers and saves for many characters in one pass."""
+        rows = self.repository.get_stats_rows(character_ids)
+        found_ids = {row.character_id for row in rows}
+        missing_ids = [character_id for character_id in character_ids if character_id not in found_ids]
+
+        if not rows:
+            return StatsBatchResponse(characters=[], missing_ids=missing_ids)
+
+        owner_ids = np.array([row.character_id for row in rows], dtype=np.int64)
+        race_ids = np.array([NO_ENTITY if row.race_id is None else row.race_id for row in rows], dtype=np.int64)
+        class_ids = np.array([NO_ENTITY if row.class_id is None else row.class_id for row in rows], dtype=np.int64)
+        levels = np.array([DEFAULT_LEVEL if row.level is None else row.level for row in rows], dtype=np.int64)
+        base_scores = np.array(
+            [
+                [DEFAULT_SCORE if getattr(row, name) is None else getattr(row, name) for name in ABILITY_NAMES]
+                for row in rows
+            ],
+            dtype=np.int64,
+        )
+
+        save_proficiencies = np.zeros(base_scores.shape, dtype=bool)
+        for position, row in enumerate(rows):
+            ability_index = resolve_ability_index(row.primary_ability)
+            if ability_index is not None:
+                save_proficiencies[position, ability_index] = True
+
+        bonuses = self._collect_bonuses(owner_ids, race_ids, class_ids)
+        derived = compute_party_stats(base_scores, bonuses, levels, save_proficiencies)
+
+        return StatsBatchResponse(
+            characters=self._build_responses(owner_ids, levels, derived),
+            missing_ids=missing_ids,
+        )
+
+    def _collect_bonuses(self, owner_ids: np.ndarray, race_ids: np.ndarray, class_ids: np.ndarray) -> np.ndarray:
+        """Summing character, race and class ability modifiers aligned to ``owner_ids``."""
+        owners_by_type = {"character": owner_ids, "race": race_ids, "class": class_ids}
+        totals = self.repository.get_modifier_totals(
+            {entity_type: np.unique(ids[ids != NO_ENTITY]).tolist() for entity_type, ids in owners_by_type.items()}
+        )
+
+        bonuses = np.zeros((len(owner_ids), len(ABILITY_NAMES)), dtype=np.int64)
+        for entity_type, ids in owners_by_type.items():
+            typed = [row for row in totals if row[0] == entity_type]
+            if not typed:
+                continue
+            source_ids = np.array([row[1] for row in typed], dtype=np.int64)
+            source_values = np.array([row[2:] for row in typed], dtype=np.int64)
+            bonuses += gather_by_id(ids, source_ids, source_values)
+
+        return bonuses
+
+    @staticmethod
+    def _build_responses(
+        owner_ids: np.ndarray, levels: np.ndarray, derived: dict[str, np.ndarray]
+    ) -> list[CharacterStatsResponse]:
+        """Converting derived arrays into response schemas."""
+        columns = zip(
+            owner_ids.tolist(),
+            levels.tolist(),
+            derived["scores"].tolist(),
+            derived["modifiers"].tolist(),
+            derived["proficiency_bonus"].tolist(),
+            derived["saving_throws"].tolist(),
+            derived["initiative"].tolist(),
+            derived["passive_perception"].tolist(),
+            strict=True,
+        )
+
+        return [
+            CharacterStatsResponse(
+                character_id=character_id,
+                level=level,
+                scores=dict(zip(ABILITY_NAMES, scores, strict=True)),
+                modifiers=dict(zip(ABILITY_NAMES, modifiers, strict=True)),
+                proficiency_bonus=proficiency,
+                saving_throws=dict(zip(ABILITY_NAMES, saves, strict=True)),
+                initiative=initiative,
+                passive_perception=perception,
+            )
+            for character_id, level, scores, modifiers, proficiency, saves, initiative, perception in columns
+        ]
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Query
+
+from app.core.dependencies import TagServiceDep
+from app.tags.schemas import TagCloudResponse, TagFacetResponse
+
+router = APIRouter()
+
+
+@router.get("/facets", response_model=TagFacetResponse)
+def get_tag_facets(
+    tag_service: TagServiceDep,
+    status: str | None = Query(None, description="Article status"),
+    category: str | None = Query(None, description="Article category"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of tags"),
+):
+    """Get article counts per tag."""
+    return tag_service.get_facets(status=status, category=category, limit=limit)
+
+
+@router.get("/cloud", response_model=TagCloudResponse)
+def get_tag_cloud(
+    tag_service: TagServiceDep,
+    category: str | None = Query(None, description="Article category"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of tags"),
+):
+    """Get a weighted tag cloud of published articles."""
+    return tag_service.get_tag_cloud(category=category, limit=limit)
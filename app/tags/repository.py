@@ -0,0 +1,23 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.repository import BaseRepository
+from app.models import TagFacet
+
+
+class TagFacetRepository(BaseRepository[TagFacet]):
+    """Repository for reading the trigger-maintained tag facet aggregate"""
+
+    def __init__(self, db: Session):
+        super().__init__(TagFacet, db)
+
+    def get_tag_counts(self, status: str | None = None, category: str | None = None, limit: int = 50) -> list:
+        """Obtaining article counts per tag, optionally filtered by article status and category."""
+        article_count = func.sum(TagFacet.article_count).label("article_count")
+        query = self.db.query(TagFacet.tag, article_count)
+        if status is not None:
+            query = query.filter(TagFacet.status == status)
+        if category is not None:
+            query = query.filter(TagFacet.category == category)
+
+        return query.group_by(TagFacet.tag).order_by(article_count.desc(), TagFacet.tag).limit(limit).all()
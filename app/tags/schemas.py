@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+
+class TagCount(BaseModel):
+    """Schema for the number of articles with a tag"""
+
+    tag: str = Field(..., description="Tag")
+    count: int = Field(..., description="Number of articles with the tag")
+
+
+class TagFacetResponse(BaseModel):
+    """Schema for tag facet counts"""
+
+    facets: list[TagCount] = Field(..., description="Article counts per tag")
+    status: str | None = Field(None, description="Article status filter")
+    category: str | None = Field(None, description="Article category filter")
+
+
+class TagCloudItem(TagCount):
+    """Schema for a weighted tag in a tag cloud"""
+
+    weight: int = Field(..., ge=1, le=5, description="Relative weight from 1 (rare) to 5 (frequent)")
+
+
+class TagCloudResponse(BaseModel):
+    """Schema for a tag cloud of published articles"""
+
+    tags: list[TagCloudItem] = Field(..., description="Weighted tags, most frequent first")
@@ -0,0 +1,57 @@
+import math
+
+from sqlalchemy.orm import Session
+
+from app.constants import ARTICLE_CATEGORIES, ARTICLE_STATUSES
+from app.exceptions.tag_exceptions import InvalidFacetFilterException
+from app.tags.repository import TagFacetRepository
+from app.tags.schemas import TagCloudItem, TagCloudResponse, TagCount, TagFacetResponse
+
+CLOUD_WEIGHTS = 5
+
+
+class TagService:
+    """Service for tag facets and tag clouds"""
+
+    def __init__(self, db: Session):
+        self.repository = TagFacetRepository(db)
+
+    @staticmethod
+    def _validate_filters(status: str | None, category: str | None) -> None:
+        if status is not None and status not in ARTICLE_STATUSES:
+            raise InvalidFacetFilterException("status", status, ARTICLE_STATUSES)
+        if category is not None and category not in ARTICLE_CATEGORIES:
+            raise InvalidFacetFilterException("category", category, ARTICLE_CATEGORIES)
+
+    def get_facets(self, status: str | None = None, category: str | None = None, limit: int = 50) -> TagFacetResponse:
+        """Obtaining article counts per tag."""
+        self._validate_filters(status, category)
+        rows = self.repository.get_tag_counts(status=status, category=category, limit=limit)
+
+        return TagFacetResponse(
+            facets=[TagCount(tag=row.tag, count=row.article_count) for row in rows],
+            status=status,
+            category=category,
+        )
+
+    def get_tag_cloud(self, category: str | None = None, limit: int = 100) -> TagCloudResponse:
+        """Obtaining published tags weighted on a logarithmic scale."""
+        self._validate_filters(None, category)
+        rows = self.repository.get_tag_counts(status="published", category=category, limit=limit)
+        if not rows:
+            return TagCloudResponse(tags=[])
+
+        low = math.log(min(row.article_count for row in rows))
+        high = math.log(max(row.article_count for row in rows))
+        spread = (high - low) or 1.0
+
+        return TagCloudResponse(
+            tags=[
+                TagCloudItem(
+                    tag=row.tag,
+                    count=row.article_count,
+                    weight=1 + round((math.log(row.article_count) - low) / spread * (CLOUD_WEIGHTS - 1)),
+                )
+                for row in rows
+            ]
+        )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Query
+
+from app.core.dependencies import TimelineServiceDep
+from app.timeline.schemas import TimelineResponse
+
+router = APIRouter()
+
+
+@router.get("/at", response_model=TimelineResponse)
+def get_timeline_at(
+    timeline_service: TimelineServiceDep,
+    year: int = Query(..., ge=1, description="Year"),
+    types: list[str] | None = Query(None, description="Entity types: article, character, faction"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+):
+    """Get characters, factions and articles that existed in a given year."""
+    return timeline_service.get_existing_at(year, entity_types=types, limit=limit, cursor=cursor)
+
+
+@router.get("/overlapping", response_model=TimelineResponse)
+def get_timeline_overlapping(
+    timeline_service: TimelineServiceDep,
+    start_year: int = Query(..., ge=1, description="First year of the interval"),
+    end_year: int = Query(..., ge=1, description="Last year of the interval"),
+    types: list[str] | None = Query(None, description="Entity types: article, character, faction"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+):
+    """Get characters, factions and articles whose lifespan overlaps an interval."""
+    return timeline_service.get_overlapping(start_year, end_year, entity_types=types, limit=limit, cursor=cursor)
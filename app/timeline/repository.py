@@ -0,0 +1,61 @@
+from typing import Any
+
+from sqlalchemy import func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.orm import Session
+
+from app.core.repository import BaseRepository
+from app.models import Article, Character, Faction
+
+UNBOUNDED_START = -(2**31)
+
+
+class TimelineRepository(BaseRepository[Character]):
+    """Repository for range queries over character, faction and article lifespans."""
+
+    def __init__(self, db: Session):
+        super().__init__(Character, db)
+
+    def get_entries(
+        self,
+        period: int | Range,
+        entity_types: list[str],
+        after: tuple[int, str, int] | None = None,
+        limit: int = 50,
+    ) -> list:
+        """Obtaining entities whose range contains a year or overlaps an interval, in keyset order.
+
+        Every branch filters on its GiST-indexed range column; ``after`` is the
+        ``(sort_year, entity_type, id)`` key of the last row of the previous page.
+        """
+        branches: dict[str, tuple[type[Any], Any, Any, Any]] = {
+            "article": (Article, Article.title, Article.period_years, Article.status == "published"),
+            "character": (Character, Character.name, Character.lifespan, None),
+            "faction": (Faction, Faction.name, Faction.active_years, None),
+        }
+
+        selects = []
+        for entity_type in entity_types:
+            model, name, years, condition = branches[entity_type]
+            query = select(
+                literal(entity_type).label("entity_type"),
+                model.id.label("id"),
+                name.label("name"),
+                func.lower(years).label("start_year"),
+                (func.upper(years) - 1).label("end_year"),
+                func.coalesce(func.lower(years), UNBOUNDED_START).label("sort_year"),
+            ).where(years.overlaps(period) if isinstance(period, Range) else years.contains(period))
+            if condition is not None:
+                query = query.where(condition)
+            selects.append(query)
+
+        entries = union_all(*selects).subquery()
+        query = select(entries)
+        if after is not None:
+            query = query.where(
+                tuple_(entries.c.sort_year, entries.c.entity_type, entries.c.id)
+                > tuple_(*(literal(value) for value in after))
+            )
+
+        query = query.order_by(entries.c.sort_year, entries.c.entity_type, entries.c.id).limit(limit)
+        return list(self.db.execute(query).all())
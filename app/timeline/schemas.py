@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class TimelineEntry(BaseModel):
+    """Schema for an entity placed on the timeline"""
+
+    entity_type: str = Field(..., description="Entity type: article, character or faction")
+    id: int = Field(..., description="Entity ID")
+    name: str = Field(..., description="Character or faction name, article title")
+    start_year: int | None = Field(None, description="First year, null if unbounded")
+    end_year: int | None = Field(None, description="Last year, null if still ongoing")
+
+
+class TimelineResponse(BaseModel):
+    """Schema for a page of timeline entries"""
+
+    items: list[TimelineEntry] = Field(..., description="Entries ordered by start year")
+    next_cursor: str | None = Field(None, description="Cursor of the next page, null on the last page")
@@ -0,0 +1,90 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.orm import Session
+
+from app.exceptions.timeline_exceptions import InvalidTimelineCursorException, InvalidTimelineQueryException
+from app.timeline.repository import TimelineRepository
+from app.timeline.schemas import TimelineEntry, TimelineResponse
+
+TIMELINE_ENTITY_TYPES = ["article", "character", "faction"]
+
+
+def encode_cursor(sort_year: int, entity_type: str, entity_id: int) -> str:
+    """Opaque cursor pointing after the given keyset position."""
+    payload = json.dumps([sort_year, entity_type, entity_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str, int]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_year, entity_type, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise InvalidTimelineCursorException() from exc
+
+    if not isinstance(sort_year, int) or not isinstance(entity_id, int) or entity_type not in TIMELINE_ENTITY_TYPES:
+        raise InvalidTimelineCursorException()
+    return sort_year, entity_type, entity_id
+
+
+class TimelineService:
+    """Service for querying the world chronology"""
+
+    def __init__(self, db: Session):
+        self.repository = TimelineRepository(db)
+
+    def get_existing_at(
+        self, year: int, entity_types: list[str] | None = None, limit: int = 50, cursor: str | None = None
+    ) -> TimelineResponse:
+        """Obtaining entities that were alive or active in a given year."""
+        return self._get_page(year, entity_types, limit, cursor)
+
+    def get_overlapping(
+        self,
+        start_year: int,
+        end_year: int,
+        entity_types: list[str] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> TimelineResponse:
+        """Obtaining entities whose lifespan overlaps the interval, both years inclusive."""
+        if start_year > end_year:
+            raise InvalidTimelineQueryException("start_year must not be greater than end_year")
+        return self._get_page(Range(start_year, end_year, bounds="[]"), entity_types, limit, cursor)
+
+    def _get_page(
+        self, period: int | Range, entity_types: list[str] | None, limit: int, cursor: str | None
+    ) -> TimelineResponse:
+        entity_types = sorted(set(entity_types or TIMELINE_ENTITY_TYPES))
+        unknown = [entity_type for entity_type in entity_types if entity_type not in TIMELINE_ENTITY_TYPES]
+        if unknown:
+            raise InvalidTimelineQueryException(
+                f"Unknown entity types {unknown}, allowed: {', '.join(TIMELINE_ENTITY_TYPES)}"
+            )
+
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.repository.get_entries(period, entity_types, after=after, limit=limit + 1)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.sort_year, last.entity_type, last.id)
+
+        return TimelineResponse(
+            items=[
+                TimelineEntry(
+                    entity_type=row.entity_type,
+                    id=row.id,
+                    name=row.name,
+                    start_year=row.start_year,
+                    end_year=row.end_year,
+                )
+                for row in rows
+            ],
+            next_cursor=next_cursor,
+        )
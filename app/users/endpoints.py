@@ -12,9 +12,13 @@ def get_all_users(
     _: FounderUserDep,
     page: int = Query(0, ge=0, description="Page number (0-indexed)"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    filters: list[str] | None = Query(
+        None, alias="filter", description="Filters as field:operator:value, e.g. role:in:admin,player"
+    ),
+    sort: str | None = Query(None, description="Comma-separated fields to sort by, - for descending, e.g. -created_at"),
 ):
-    """Get all users with pagination."""
-    return user_service.get_all_users(page=page, size=size)
+    """Get users matching the filters with pagination."""
+    return user_service.get_all_users(page=page, size=size, filters=filters, sort=sort)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -1,14 +1,34 @@
 from datetime import datetime
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.filters import FilterField, FilterSet
 from app.core.repository import BaseRepository
+from app.core.write_behind import WriteBehindBuffer
 from app.models import User
+from app.settings import settings
+
+# Written by the write-behind flusher instead of on every login
+last_login_buffer = WriteBehindBuffer(User.last_login, monotonic=True, batch_size=settings.WRITE_BEHIND_BATCH_SIZE)
 
 
 class UserRepository(BaseRepository[User]):
     """Repository for the essence of User."""
 
+    filters = FilterSet(
+        User,
+        {
+            "id": FilterField(("eq", "in", "range"), btree="users_pkey", sortable=True),
+            "username": FilterField(("eq", "in"), btree="users_username_key", sortable=True),
+            "email": FilterField(("eq", "in"), btree="ix_users_email", sortable=True),
+            "role": FilterField(("eq", "in")),
+            "is_2fa_enabled": FilterField(("eq",)),
+            "created_at": FilterField(("range",), sortable=True),
+            "last_login": FilterField(("range", "is_null"), sortable=True),
+        },
+    )
+
     def __init__(self, db: Session):
         super().__init__(User, db)
 
@@ -25,6 +45,7 @@ class UserRepository(BaseRepository[User]):
         user.otp_secret = otp_secret  # type: ignore
         self.db.commit()
         self.db.refresh(user)
+        self._publish_change(user.id)
         return user
 
     def enable_2fa(self, user: User) -> User:
@@ -32,13 +53,15 @@ class UserRepository(BaseRepository[User]):
         user.is_2fa_enabled = True  # type: ignore
         self.db.commit()
         self.db.refresh(user)
+        self._publish_change(user.id)
         return user
 
     def update_last_login(self, user: User) -> User:
-        """Update user's last login timestamp."""
-        user.last_login = datetime.now()  # type: ignore
-        self.db.commit()
-        self.db.refresh(user)
+        """Record user's last login timestamp, written to the database by the next write-behind flush."""
+        last_login = datetime.now()
+        # Not marked as changed, so a later commit of this session does not write it on the hot path either
+        set_committed_value(user, "last_login", last_login)
+        last_login_buffer.record(user.id, last_login)
         return user
 
     def setup_2fa(self, user: User, otp_secret: str) -> User:
@@ -46,9 +69,9 @@ class UserRepository(BaseRepository[User]):
         user.otp_secret = otp_secret  # type: ignore
         self.db.commit()
         self.db.refresh(user)
+        self._publish_change(user.id)
         return user
 
     def complete_2fa_setup(self, user: User) -> User:
         """Complete 2FA setup (enable 2FA and update last login)."""
-        user.is_2fa_enabled = True  # type: ignore
-        return self.update_last_login(user)
+        return self.update_last_login(self.enable_2fa(user))
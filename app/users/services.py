@@ -44,10 +44,13 @@ class UserService:
             raise UserNotFoundException(email=email)
         return UserResponse.model_validate(user)
 
-    def get_all_users(self, *, page: int = 0, size: int = 50) -> list[UserResponse]:
-        """Get all users with pagination."""
+    def get_all_users(
+        self, *, page: int = 0, size: int = 50, filters: list[str] | None = None, sort: str | None = None
+    ) -> list[UserResponse]:
+        """Get users matching the filters with pagination."""
         skip = page * size
-        users = self.repository.get_all(skip=skip, limit=size)
+        list_query = self.repository.filters.parse(filters, sort)
+        users = self.repository.filter_by_fields(list_query, skip=skip, limit=size)
         return [UserResponse.model_validate(user) for user in users]
 
     def create_user(self, data: UserCreate) -> UserResponse:
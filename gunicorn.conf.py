@@ -0,0 +1,43 @@
+"""Gunicorn configuration for production: ``gunicorn app.main:app``.
+
+The application is imported once in the master and forked into the workers,
+which share its code pages and start faster. Workers are recycled after
+``WORKER_MAX_REQUESTS`` requests (with jitter so they do not restart together).
+"""
+
+from prometheus_client import multiprocess
+
+from app.core.metrics import is_multiprocess, record_pool_size, shutdown_metrics
+from app.settings import settings
+
+bind = f"{settings.HOST}:{settings.PORT}"
+workers = settings.WEB_CONCURRENCY
+worker_class = "app.core.worker.AppUvicornWorker"
+preload_app = True
+
+max_requests = settings.WORKER_MAX_REQUESTS
+max_requests_jitter = settings.WORKER_MAX_REQUESTS_JITTER
+timeout = settings.WORKER_TIMEOUT
+graceful_timeout = settings.WORKER_TIMEOUT
+keepalive = 5
+
+# Requests are logged by LoggingMiddleware
+accesslog = None
+
+
+def when_ready(server):
+    # The master serves no requests; drop the live gauges it set while importing the app
+    shutdown_metrics()
+
+
+def post_fork(server, worker):
+    # Pooled connections must not be shared with the master; close=False leaves the parent's sockets alone
+    for engine in [settings.engine, *settings.replica_engines]:
+        engine.dispose(close=False)
+    record_pool_size(settings.engine)
+
+
+def child_exit(server, worker):
+    # Workers recycled by max_requests or killed on timeout never reach the lifespan shutdown
+    if is_multiprocess():
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,217 @@
+"""Drop duplicate indexes and index foreign keys
+
+Revision ID: 582fe6f271a7
+Revises: c7e2a91d4f35
+Create Date: 2026-10-19 13:02:18.125529
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "582fe6f271a7"
+down_revision: Union[str, None] = "c7e2a91d4f35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_abilities_category", table_name="abilities", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_abilities_usage_type", table_name="abilities", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "ix_entity_abilities_ability_id",
+            table_name="entity_abilities",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_entity_abilities_entity_type",
+            table_name="entity_abilities",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index("ix_users_id", table_name="users", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "idx_article_tags_article", table_name="article_tags", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index("ix_articles_article_type", table_name="articles", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_articles_category", table_name="articles", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "ix_articles_created_by_user_id", table_name="articles", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            "ix_characters_created_by_user_id", table_name="characters", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            "ix_characters_player_user_id", table_name="characters", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index("ix_characters_type", table_name="characters", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "idx_entity_ability_entity", table_name="entity_abilities", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            "idx_entity_ability_type", table_name="entity_abilities", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index(
+            "ix_factions_dominant_culture", table_name="factions", postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index("ix_factions_type", table_name="factions", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "ix_locations_current_status", table_name="locations", postgresql_concurrently=True, if_exists=True
+        )
+        op.create_index(
+            "idx_character_game_stats_class_id",
+            "character_game_stats",
+            ["class_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_character_game_stats_subclass_id",
+            "character_game_stats",
+            ["subclass_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_character_game_stats_subclass_id",
+            table_name="character_game_stats",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_character_game_stats_class_id",
+            table_name="character_game_stats",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_locations_current_status",
+            "locations",
+            ["current_status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_factions_type", "factions", ["type"], unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_factions_dominant_culture",
+            "factions",
+            ["dominant_culture"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_entity_ability_type",
+            "entity_abilities",
+            ["entity_type"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_entity_ability_entity",
+            "entity_abilities",
+            ["entity_type", "entity_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_characters_type", "characters", ["type"], unique=False, postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_characters_player_user_id",
+            "characters",
+            ["player_user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_characters_created_by_user_id",
+            "characters",
+            ["created_by_user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_articles_created_by_user_id",
+            "articles",
+            ["created_by_user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_articles_category",
+            "articles",
+            ["category"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_articles_article_type",
+            "articles",
+            ["article_type"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_article_tags_article",
+            "article_tags",
+            ["article_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index("ix_users_id", "users", ["id"], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(
+            "ix_entity_abilities_entity_type",
+            "entity_abilities",
+            ["entity_type"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_entity_abilities_ability_id",
+            "entity_abilities",
+            ["ability_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_abilities_usage_type",
+            "abilities",
+            ["usage_type"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_abilities_category",
+            "abilities",
+            ["category"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
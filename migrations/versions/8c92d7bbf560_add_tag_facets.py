@@ -0,0 +1,132 @@
+"""add tag facets
+
+Revision ID: 8c92d7bbf560
+Revises: 3d6b77010d1b
+Create Date: 2026-10-19 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c92d7bbf560"
+down_revision: Union[str, None] = "3d6b77010d1b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAG_FACET_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION tag_facets_apply(p_tag VARCHAR, p_status VARCHAR, p_category VARCHAR, p_delta INTEGER)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO tag_facets (tag, status, category, article_count)
+    VALUES (p_tag, p_status, p_category, p_delta)
+    ON CONFLICT (tag, status, category) DO UPDATE
+        SET article_count = tag_facets.article_count + EXCLUDED.article_count;
+
+    IF p_delta < 0 THEN
+        DELETE FROM tag_facets
+        WHERE tag = p_tag AND status = p_status
+          AND category IS NOT DISTINCT FROM p_category AND article_count <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION article_tags_facets_trigger() RETURNS trigger AS $$
+DECLARE
+    article_status VARCHAR;
+    article_category VARCHAR;
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        SELECT status, category INTO article_status, article_category FROM articles WHERE id = OLD.article_id;
+        IF FOUND THEN
+            PERFORM tag_facets_apply(OLD.tag, article_status, article_category, -1);
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT status, category INTO article_status, article_category FROM articles WHERE id = NEW.article_id;
+        IF FOUND THEN
+            PERFORM tag_facets_apply(NEW.tag, article_status, article_category, 1);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION articles_facets_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM tag_facets_apply(tag, OLD.status, OLD.category, -1) FROM article_tags WHERE article_id = OLD.id;
+        RETURN OLD;
+    END IF;
+
+    IF NEW.status IS DISTINCT FROM OLD.status OR NEW.category IS DISTINCT FROM OLD.category THEN
+        PERFORM tag_facets_apply(tag, OLD.status, OLD.category, -1) FROM article_tags WHERE article_id = OLD.id;
+        PERFORM tag_facets_apply(tag, NEW.status, NEW.category, 1) FROM article_tags WHERE article_id = NEW.id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TAG_FACET_TRIGGERS = """
+CREATE OR REPLACE TRIGGER trg_article_tags_facets
+    AFTER INSERT OR DELETE OR UPDATE OF tag, article_id ON article_tags
+    FOR EACH ROW EXECUTE FUNCTION article_tags_facets_trigger();
+
+CREATE OR REPLACE TRIGGER trg_articles_facets_delete
+    BEFORE DELETE ON articles
+    FOR EACH ROW EXECUTE FUNCTION articles_facets_trigger();
+
+CREATE OR REPLACE TRIGGER trg_articles_facets_update
+    AFTER UPDATE OF status, category ON articles
+    FOR EACH ROW EXECUTE FUNCTION articles_facets_trigger();
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tag_facets",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tag", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=True),
+        sa.Column("article_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("tag", "status", "category", name="uq_tag_facet", postgresql_nulls_not_distinct=True),
+    )
+    op.create_index(
+        "idx_tag_facet_status_category",
+        "tag_facets",
+        ["status", "category", "article_count"],
+        unique=False,
+    )
+
+    op.execute(TAG_FACET_FUNCTIONS)
+    op.execute(TAG_FACET_TRIGGERS)
+    op.execute(
+        """
+        INSERT INTO tag_facets (tag, status, category, article_count)
+        SELECT t.tag, a.status, a.category, count(*)
+        FROM article_tags t
+        JOIN articles a ON a.id = t.article_id
+        GROUP BY t.tag, a.status, a.category
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_articles_facets_update ON articles;")
+    op.execute("DROP TRIGGER IF EXISTS trg_articles_facets_delete ON articles;")
+    op.execute("DROP TRIGGER IF EXISTS trg_article_tags_facets ON article_tags;")
+    op.execute("DROP FUNCTION IF EXISTS articles_facets_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS article_tags_facets_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS tag_facets_apply(VARCHAR, VARCHAR, VARCHAR, INTEGER);")
+    op.drop_index("idx_tag_facet_status_category", table_name="tag_facets")
+    op.drop_table("tag_facets")
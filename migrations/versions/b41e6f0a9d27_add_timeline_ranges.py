@@ -0,0 +1,63 @@
+"""add timeline ranges
+
+Revision ID: b41e6f0a9d27
+Revises: 8c92d7bbf560
+Create Date: 2026-10-19 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b41e6f0a9d27"
+down_revision: Union[str, None] = "8c92d7bbf560"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "characters",
+        sa.Column(
+            "lifespan",
+            postgresql.INT4RANGE(),
+            sa.Computed(
+                "CASE WHEN birth_year IS NOT NULL THEN int4range(birth_year, death_year, '[]') END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_character_lifespan", "characters", ["lifespan"], unique=False, postgresql_using="gist")
+
+    op.add_column(
+        "factions",
+        sa.Column(
+            "active_years",
+            postgresql.INT4RANGE(),
+            sa.Computed(
+                "CASE WHEN founded_year IS NOT NULL THEN int4range(founded_year, fallen_year, '[]') END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_faction_active_years", "factions", ["active_years"], unique=False, postgresql_using="gist")
+
+    op.add_column("articles", sa.Column("period_years", postgresql.INT4RANGE(), nullable=True))
+    op.create_index("idx_article_period_years", "articles", ["period_years"], unique=False, postgresql_using="gist")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_article_period_years", table_name="articles", postgresql_using="gist")
+    op.drop_column("articles", "period_years")
+    op.drop_index("idx_faction_active_years", table_name="factions", postgresql_using="gist")
+    op.drop_column("factions", "active_years")
+    op.drop_index("idx_character_lifespan", table_name="characters", postgresql_using="gist")
+    op.drop_column("characters", "lifespan")
@@ -0,0 +1,230 @@
+"""add entity relations
+
+Revision ID: c7e2a91d4f35
+Revises: b41e6f0a9d27
+Create Date: 2026-10-19 16:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2a91d4f35"
+down_revision: str | None = "b41e6f0a9d27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+RELATION_ENTITY_TYPES = "'article', 'character', 'location', 'faction', 'race', 'user'"
+
+ENTITY_RELATION_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION entity_relations_link(
+    p_source_type VARCHAR, p_source_id INTEGER, p_target_type VARCHAR, p_target_id INTEGER,
+    p_relation VARCHAR, p_delta INTEGER
+) RETURNS void AS $$
+BEGIN
+    IF p_source_id IS NULL OR p_target_id IS NULL
+       OR (p_source_type = p_target_type AND p_source_id = p_target_id) THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO entity_relations (source_type, source_id, target_type, target_id, relation, weight)
+    VALUES (p_source_type, p_source_id, p_target_type, p_target_id, p_relation, p_delta),
+           (p_target_type, p_target_id, p_source_type, p_source_id, p_relation, p_delta)
+    ON CONFLICT (source_type, source_id, target_type, target_id, relation) DO UPDATE
+        SET weight = entity_relations.weight + EXCLUDED.weight;
+
+    IF p_delta < 0 THEN
+        DELETE FROM entity_relations
+        WHERE relation = p_relation AND weight <= 0
+          AND (source_type, source_id, target_type, target_id) IN (
+              (p_source_type, p_source_id, p_target_type, p_target_id),
+              (p_target_type, p_target_id, p_source_type, p_source_id)
+          );
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entity_relations_replace(
+    p_source_type VARCHAR, p_source_id INTEGER, p_target_type VARCHAR,
+    p_old_target_id INTEGER, p_new_target_id INTEGER, p_relation VARCHAR
+) RETURNS void AS $$
+BEGIN
+    IF p_old_target_id IS DISTINCT FROM p_new_target_id THEN
+        PERFORM entity_relations_link(p_source_type, p_source_id, p_target_type, p_old_target_id, p_relation, -1);
+        PERFORM entity_relations_link(p_source_type, p_source_id, p_target_type, p_new_target_id, p_relation, 1);
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION entity_relations_forget_trigger() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM entity_relations
+    WHERE (source_type = TG_ARGV[0] AND source_id = OLD.id) OR (target_type = TG_ARGV[0] AND target_id = OLD.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION articles_relations_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM entity_relations_replace('article', NEW.id, 'character', NULL, NEW.primary_character_id, 'primary_character');
+        PERFORM entity_relations_replace('article', NEW.id, 'location', NULL, NEW.primary_location_id, 'primary_location');
+        PERFORM entity_relations_replace('article', NEW.id, 'faction', NULL, NEW.primary_faction_id, 'primary_faction');
+        PERFORM entity_relations_replace('article', NEW.id, 'race', NULL, NEW.primary_race_id, 'primary_race');
+    ELSE
+        PERFORM entity_relations_replace(
+            'article', NEW.id, 'character', OLD.primary_character_id, NEW.primary_character_id, 'primary_character'
+        );
+        PERFORM entity_relations_replace(
+            'article', NEW.id, 'location', OLD.primary_location_id, NEW.primary_location_id, 'primary_location'
+        );
+        PERFORM entity_relations_replace(
+            'article', NEW.id, 'faction', OLD.primary_faction_id, NEW.primary_faction_id, 'primary_faction'
+        );
+        PERFORM entity_relations_replace('article', NEW.id, 'race', OLD.primary_race_id, NEW.primary_race_id, 'primary_race');
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION characters_relations_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM entity_relations_replace('character', NEW.id, 'race', NULL, NEW.race_id, 'race');
+        PERFORM entity_relations_replace('character', NEW.id, 'user', NULL, NEW.player_user_id, 'player');
+    ELSE
+        PERFORM entity_relations_replace('character', NEW.id, 'race', OLD.race_id, NEW.race_id, 'race');
+        PERFORM entity_relations_replace('character', NEW.id, 'user', OLD.player_user_id, NEW.player_user_id, 'player');
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION locations_relations_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM entity_relations_replace('location', NEW.id, 'location', NULL, NEW.parent_location_id, 'parent_location');
+    ELSE
+        PERFORM entity_relations_replace(
+            'location', NEW.id, 'location', OLD.parent_location_id, NEW.parent_location_id, 'parent_location'
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- BEFORE row triggers see the rows already processed by the same statement, so a pair of
+-- articles tagged (or untagged) in one statement is counted once
+CREATE OR REPLACE FUNCTION article_tags_relations_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('DELETE', 'UPDATE') THEN
+        PERFORM entity_relations_link('article', OLD.article_id, 'article', other.article_id, 'shared_tags', -1)
+        FROM article_tags other
+        WHERE other.tag = OLD.tag AND other.article_id <> OLD.article_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM entity_relations_link('article', NEW.article_id, 'article', other.article_id, 'shared_tags', 1)
+        FROM article_tags other
+        WHERE other.tag = NEW.tag AND other.article_id <> NEW.article_id;
+        RETURN NEW;
+    END IF;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ENTITY_RELATION_TRIGGERS = """
+CREATE OR REPLACE TRIGGER trg_articles_relations
+    AFTER INSERT OR UPDATE OF primary_character_id, primary_location_id, primary_faction_id, primary_race_id
+    ON articles FOR EACH ROW EXECUTE FUNCTION articles_relations_trigger();
+
+CREATE OR REPLACE TRIGGER trg_characters_relations
+    AFTER INSERT OR UPDATE OF race_id, player_user_id
+    ON characters FOR EACH ROW EXECUTE FUNCTION characters_relations_trigger();
+
+CREATE OR REPLACE TRIGGER trg_locations_relations
+    AFTER INSERT OR UPDATE OF parent_location_id
+    ON locations FOR EACH ROW EXECUTE FUNCTION locations_relations_trigger();
+
+CREATE OR REPLACE TRIGGER trg_article_tags_relations
+    BEFORE INSERT OR DELETE OR UPDATE OF tag, article_id
+    ON article_tags FOR EACH ROW EXECUTE FUNCTION article_tags_relations_trigger();
+
+CREATE OR REPLACE TRIGGER trg_articles_relations_delete
+    AFTER DELETE ON articles FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('article');
+
+CREATE OR REPLACE TRIGGER trg_characters_relations_delete
+    AFTER DELETE ON characters FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('character');
+
+CREATE OR REPLACE TRIGGER trg_locations_relations_delete
+    AFTER DELETE ON locations FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('location');
+
+CREATE OR REPLACE TRIGGER trg_factions_relations_delete
+    AFTER DELETE ON factions FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('faction');
+
+CREATE OR REPLACE TRIGGER trg_races_relations_delete
+    AFTER DELETE ON races FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('race');
+
+CREATE OR REPLACE TRIGGER trg_users_relations_delete
+    AFTER DELETE ON users FOR EACH ROW EXECUTE FUNCTION entity_relations_forget_trigger('user');
+"""
+
+ENTITY_RELATION_BACKFILL = """
+SELECT entity_relations_link('article', id, 'character', primary_character_id, 'primary_character', 1) FROM articles;
+SELECT entity_relations_link('article', id, 'location', primary_location_id, 'primary_location', 1) FROM articles;
+SELECT entity_relations_link('article', id, 'faction', primary_faction_id, 'primary_faction', 1) FROM articles;
+SELECT entity_relations_link('article', id, 'race', primary_race_id, 'primary_race', 1) FROM articles;
+SELECT entity_relations_link('character', id, 'race', race_id, 'race', 1) FROM characters;
+SELECT entity_relations_link('character', id, 'user', player_user_id, 'player', 1) FROM characters;
+SELECT entity_relations_link('location', id, 'location', parent_location_id, 'parent_location', 1) FROM locations;
+SELECT entity_relations_link('article', a.article_id, 'article', b.article_id, 'shared_tags', 1)
+FROM article_tags a JOIN article_tags b ON a.tag = b.tag AND a.article_id < b.article_id;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "entity_relations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source_type", sa.String(length=20), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("target_type", sa.String(length=20), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("relation", sa.String(length=30), nullable=False),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.CheckConstraint(f"source_type IN ({RELATION_ENTITY_TYPES})", name="check_relation_source_type"),
+        sa.CheckConstraint(f"target_type IN ({RELATION_ENTITY_TYPES})", name="check_relation_target_type"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "source_type", "source_id", "target_type", "target_id", "relation", name="uq_entity_relation"
+        ),
+    )
+    op.create_index("idx_entity_relation_target", "entity_relations", ["target_type", "target_id"], unique=False)
+
+    op.execute(ENTITY_RELATION_FUNCTIONS)
+    op.execute(ENTITY_RELATION_TRIGGERS)
+    op.execute(ENTITY_RELATION_BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("users", "races", "factions", "locations", "characters", "articles"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_relations_delete ON {table};")
+    for table in ("article_tags", "locations", "characters", "articles"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_relations ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS article_tags_relations_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS locations_relations_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS characters_relations_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS articles_relations_trigger();")
+    op.execute("DROP FUNCTION IF EXISTS entity_relations_forget_trigger();")
+    op.execute(
+        "DROP FUNCTION IF EXISTS entity_relations_replace(VARCHAR, INTEGER, VARCHAR, INTEGER, INTEGER, VARCHAR);"
+    )
+    op.execute("DROP FUNCTION IF EXISTS entity_relations_link(VARCHAR, INTEGER, VARCHAR, INTEGER, VARCHAR, INTEGER);")
+    op.drop_index("idx_entity_relation_target", table_name="entity_relations")
+    op.drop_table("entity_relations")
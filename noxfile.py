@@ -54,6 +54,14 @@ def test_session(session):
     )
 
 
+@nox.session(name="benchmark")
+def benchmark_session(session):
+    """Run endpoint benchmarks and compare them with the stored baseline."""
+    setup_test_env(session)
+    session.env["RUN_BENCHMARKS"] = "1"
+    session.run("poetry", "run", "pytest", "tests/benchmarks", "-p", "no:cacheprovider", *session.posargs, external=True)
+
+
 @nox.session(name="all")
 def all_session(session):
     """Run all checks for CD/Ci."""
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+import os
+from pathlib import Path
+
+import pyotp
+import pytest
+from sqlalchemy import text
+
+from app.auth.utils.pwd_utils import get_password_hash
+from app.constants import RACE_SIZES
+from app.settings import settings
+from tests.conftest import test_engine
+
+BENCHMARK_DATASETS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+BENCHMARK_PASSWORD = "benchmark-password"  # nosec B105
+BENCHMARK_OTP_SECRET = pyotp.random_base32()
+
+
+@dataclass
+class BenchmarkConfig:
+    dataset: str
+    requests: int
+    concurrency: int
+    threshold: float
+    baseline_path: Path
+    update_baseline: bool
+
+
+@dataclass
+class BenchmarkData:
+    rows: int
+    founder_id: int
+    founder_email: str
+    player_email: str
+
+
+@pytest.fixture(scope="session")
+def benchmark_config() -> BenchmarkConfig:
+    dataset = os.getenv("BENCHMARK_DATASET", "1k").lower()
+    if dataset not in BENCHMARK_DATASETS:
+        raise pytest.UsageError(f"BENCHMARK_DATASET must be one of {', '.join(BENCHMARK_DATASETS)}")
+
+    return BenchmarkConfig(
+        dataset=dataset,
+        requests=int(os.getenv("BENCHMARK_REQUESTS", 300)),
+        concurrency=int(os.getenv("BENCHMARK_CONCURRENCY", 10)),
+        threshold=float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", 20)),
+        baseline_path=Path(os.getenv("BENCHMARK_BASELINE", Path(__file__).parent / "baseline.json")),
+        update_baseline=bool(os.getenv("BENCHMARK_UPDATE_BASELINE")),
+    )
+
+
+def truncate_all() -> None:
+    tables = ", ".join(table.name for table in settings.Base.metadata.sorted_tables)
+    with test_engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))  # nosec B608
+
+
+@pytest.fixture(scope="session")
+def benchmark_data(prepare_database, benchmark_config) -> BenchmarkData:
+    """Seed races and users with ``generate_series`` so even the 1M data set loads in seconds."""
+    rows = BENCHMARK_DATASETS[benchmark_config.dataset]
+    truncate_all()
+
+    with test_engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO races (name, description, size, is_playable, created_at, updated_at)
+                SELECT 'Race ' || g, 'Benchmark race ' || g, (:sizes)[1 + g % :size_count], g % 2 = 0, now(), now()
+                FROM generate_series(1, :rows) AS g
+                """
+            ),
+            {"sizes": RACE_SIZES, "size_count": len(RACE_SIZES), "rows": rows},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO users (username, email, hashed_password, role, is_2fa_enabled, otp_secret, created_at)
+                SELECT 'user' || g, 'user' || g || '@benchmark.test', :password, 'player', true, :otp_secret, now()
+                FROM generate_series(1, :rows) AS g
+                """
+            ),
+            {"password": get_password_hash(BENCHMARK_PASSWORD), "otp_secret": BENCHMARK_OTP_SECRET, "rows": rows},
+        )
+        founder_id = connection.execute(
+            text(
+                """
+                INSERT INTO users (username, email, hashed_password, role, is_2fa_enabled, otp_secret, created_at)
+                VALUES ('founder', 'founder@benchmark.test', :password, 'found_father', true, :otp_secret, now())
+                RETURNING id
+                """
+            ),
+            {"password": get_password_hash(BENCHMARK_PASSWORD), "otp_secret": BENCHMARK_OTP_SECRET},
+        ).scalar_one()
+
+    with test_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE races, users"))
+
+    yield BenchmarkData(
+        rows=rows,
+        founder_id=founder_id,
+        founder_email="founder@benchmark.test",
+        player_email="user1@benchmark.test",
+    )
+
+    truncate_all()
@@ -0,0 +1,98 @@
+"""Helpers for measuring endpoints in-process and comparing runs with a stored baseline."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import time
+
+import httpx
+import numpy as np
+
+RequestSender = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency percentiles in milliseconds and throughput in requests per second."""
+
+    route: str
+    requests: int
+    concurrency: int
+    p50: float
+    p95: float
+    p99: float
+    throughput: float
+
+
+async def run_benchmark(
+    client: httpx.AsyncClient,
+    route: str,
+    send: RequestSender,
+    requests: int,
+    concurrency: int,
+    warmup: int = 5,
+) -> BenchmarkResult:
+    """Send ``requests`` requests through ``concurrency`` workers and collect latencies."""
+    for index in range(warmup):
+        response = await send(client, index)
+        response.raise_for_status()
+
+    latencies: list[float] = []
+    pending = iter(range(requests))
+
+    async def worker() -> None:
+        for index in pending:
+            start_time = time.perf_counter()
+            response = await send(client, index)
+            latencies.append(time.perf_counter() - start_time)
+            response.raise_for_status()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start_time
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return BenchmarkResult(
+        route=route,
+        requests=requests,
+        concurrency=concurrency,
+        p50=round(float(p50), 3),
+        p95=round(float(p95), 3),
+        p99=round(float(p99), 3),
+        throughput=round(requests / elapsed, 2),
+    )
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_result(path: Path, dataset: str, result: BenchmarkResult) -> None:
+    """Store ``result`` as the baseline of its route for ``dataset``."""
+    baseline = load_baseline(path)
+    baseline.setdefault(dataset, {})[result.route] = asdict(result)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True, ensure_ascii=False) + "\n")
+
+
+def find_regressions(result: BenchmarkResult, baseline: dict | None, threshold: float) -> list[str]:
+    """Describe how ``result`` is worse than ``baseline`` by more than ``threshold`` percent.
+
+    Only p95 and throughput are compared; p99 of a few hundred requests is too noisy to gate on.
+    """
+    if not baseline:
+        return []
+
+    regressions = []
+    limit = baseline["p95"] * (1 + threshold / 100)
+    if result.p95 > limit:
+        regressions.append(f"p95 {result.p95}ms > {limit:.3f}ms (baseline {baseline['p95']}ms)")
+
+    floor = baseline["throughput"] * (1 - threshold / 100)
+    if result.throughput < floor:
+        regressions.append(f"throughput {result.throughput}/s < {floor:.2f}/s (baseline {baseline['throughput']}/s)")
+
+    return regressions
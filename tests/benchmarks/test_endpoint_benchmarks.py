@@ -0,0 +1,128 @@
+"""In-process endpoint benchmarks.
+
+Run with ``RUN_BENCHMARKS=1``; ``BENCHMARK_DATASET`` selects 1k, 100k or 1m seeded rows.
+``BENCHMARK_UPDATE_BASELINE=1`` stores results as the new baseline, otherwise a route
+fails when its p95 or throughput is worse than the baseline by more than
+``BENCHMARK_REGRESSION_THRESHOLD`` percent, or when it has no baseline.
+"""
+
+import os
+
+import httpx
+import pyotp
+import pytest
+import pytest_asyncio
+
+from app.main import app
+from tests.benchmarks.conftest import BENCHMARK_OTP_SECRET, BENCHMARK_PASSWORD
+from tests.benchmarks.harness import find_regressions, load_baseline, run_benchmark, save_result
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run benchmarks"),
+]
+
+# Password hashing dominates login, so it gets a fraction of the request count
+LOGIN_REQUEST_SHARE = 0.1
+
+
+@pytest_asyncio.fixture
+async def bench_client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver/api") as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def founder_session(bench_client, benchmark_data):
+    """Access token and refresh cookie of the seeded founder."""
+    login = await bench_client.post(
+        "/auth/login", json={"email": benchmark_data.founder_email, "password": BENCHMARK_PASSWORD}
+    )
+    verify = await bench_client.post(
+        "/auth/2fa/verify",
+        json={"otp_code": pyotp.TOTP(BENCHMARK_OTP_SECRET).now(), "temp_token": login.json()["temp_token"]},
+    )
+    verify.raise_for_status()
+    return verify.json()["access_token"], verify.cookies["refresh_token"]
+
+
+async def check_against_baseline(config, result):
+    if config.update_baseline:
+        save_result(config.baseline_path, config.dataset, result)
+        return
+
+    baseline = load_baseline(config.baseline_path).get(config.dataset, {}).get(result.route)
+    if baseline is None:
+        # Without a baseline nothing could regress, so the gate would always pass
+        pytest.fail(
+            f"No {config.dataset} baseline for {result.route} in {config.baseline_path}; record one on this machine "
+            "with BENCHMARK_UPDATE_BASELINE=1 or point BENCHMARK_BASELINE at one"
+        )
+    regressions = find_regressions(result, baseline, config.threshold)
+    assert not regressions, f"{result.route} regressed on {config.dataset}: " + "; ".join(regressions)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_race_list(bench_client, benchmark_data, benchmark_config):
+    pages = max(1, min(benchmark_data.rows // 10, 1000))
+
+    async def send(client, index):
+        return await client.get("/races/", params={"page": index % pages + 1, "size": 10})
+
+    result = await run_benchmark(
+        bench_client, "GET /races/", send, benchmark_config.requests, benchmark_config.concurrency
+    )
+    await check_against_baseline(benchmark_config, result)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_race_by_id(bench_client, benchmark_data, benchmark_config):
+    async def send(client, index):
+        race_id = index * 7919 % benchmark_data.rows + 1
+        return await client.get(f"/races/{race_id}")
+
+    result = await run_benchmark(
+        bench_client, "GET /races/{race_id}", send, benchmark_config.requests, benchmark_config.concurrency
+    )
+    await check_against_baseline(benchmark_config, result)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_login(bench_client, benchmark_data, benchmark_config):
+    async def send(client, index):
+        return await client.post(
+            "/auth/login", json={"email": benchmark_data.player_email, "password": BENCHMARK_PASSWORD}
+        )
+
+    requests = max(benchmark_config.concurrency, int(benchmark_config.requests * LOGIN_REQUEST_SHARE))
+    result = await run_benchmark(bench_client, "POST /auth/login", send, requests, benchmark_config.concurrency)
+    await check_against_baseline(benchmark_config, result)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_refresh(bench_client, founder_session, benchmark_config):
+    _, refresh_token = founder_session
+
+    async def send(client, index):
+        return await client.post("/auth/refresh", headers={"Cookie": f"refresh_token={refresh_token}"})
+
+    result = await run_benchmark(
+        bench_client, "POST /auth/refresh", send, benchmark_config.requests, benchmark_config.concurrency
+    )
+    await check_against_baseline(benchmark_config, result)
+
+
+@pytest.mark.asyncio
+async def test_benchmark_authenticated_user_read(bench_client, benchmark_data, founder_session, benchmark_config):
+    access_token, _ = founder_session
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    async def send(client, index):
+        user_id = index * 7919 % benchmark_data.rows + 1
+        return await client.get(f"/users/{user_id}", headers=headers)
+
+    result = await run_benchmark(
+        bench_client, "GET /users/{user_id}", send, benchmark_config.requests, benchmark_config.concurrency
+    )
+    await check_against_baseline(benchmark_config, result)
@@ -11,45 +11,115 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from app.auth.utils.pwd_utils import get_password_hash
+from app.core.db_routing import RoutingSession
+from app.core.schema_baseline import create_baseline
 from app.main import app
-from app.models import Race, User
+from app.models import Ability, Article, ArticleTag, Character, CharacterGameStats, EntityAbility, Faction, Race, User
 from app.settings import settings
 
 test_engine = create_engine(settings.DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 
-def install_test_extensions():
-    """Install required PostgreSQL extensions for testing"""
+def execute_maintenance(*statements):
+    """Run statements against the maintenance database, outside a transaction as CREATE/DROP DATABASE require"""
+    maintenance_engine = create_engine(settings.TEST_MAINTENANCE_DATABASE_URL, isolation_level="AUTOCOMMIT")
     try:
-        with test_engine.connect() as conn:
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
-            conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
-            conn.commit()
-            print("PostgreSQL extensions installed successfully")
-    except Exception as e:
-        print(f"Warning: Could not install PostgreSQL extensions: {e}")
+        with maintenance_engine.connect() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    finally:
+        maintenance_engine.dispose()
+
+
+def drop_database(name):
+    execute_maintenance(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+
+
+def recreate_database(name, template=None):
+    """Create a database, dropping any leftover of a previous run, optionally as a copy of a template"""
+    create = f'CREATE DATABASE "{name}"' + (f' TEMPLATE "{template}"' if template else "")
+    execute_maintenance(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)', create)
+
+
+def build_template_database():
+    """Create the template database with the extensions and the schema"""
+    recreate_database(settings.TEST_DATABASE_TEMPLATE)
+    template_engine = create_engine(settings.get_test_database_url(settings.TEST_DATABASE_TEMPLATE))
+    try:
+        with template_engine.begin() as conn:
+            create_baseline(conn, settings.Base.metadata)
+    finally:
+        # A database cannot be copied while anyone is connected to it
+        template_engine.dispose()
+
+
+def pytest_configure(config):
+    # Only in the xdist controller, or the single process without xdist
+    if not hasattr(config, "workerinput"):
+        build_template_database()
+
+
+def pytest_unconfigure(config):
+    if not hasattr(config, "workerinput"):
+        drop_database(settings.TEST_DATABASE_TEMPLATE)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def prepare_database():
-    install_test_extensions()
-
-    settings.Base.metadata.create_all(bind=test_engine)
+    """Clone the template into this worker's database"""
+    recreate_database(settings.TEST_DATABASE_NAME, template=settings.TEST_DATABASE_TEMPLATE)
     yield
-    settings.Base.metadata.drop_all(bind=test_engine)
+    test_engine.dispose()
+    settings.engine.dispose()
+    drop_database(settings.TEST_DATABASE_NAME)
+
+
+def delete_all_rows():
+    with test_engine.begin() as connection:
+        for table in reversed(settings.Base.metadata.sorted_tables):
+            connection.execute(table.delete())
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    session = TestingSessionLocal()
+def db_session(request, monkeypatch):
+    """Session whose changes are rolled back after the test.
+
+    The test holds one connection with an outer transaction. This session and
+    every session the app opens through ``settings.SessionLocal`` (``get_db``,
+    middlewares) share it, and their commits only release SAVEPOINTs. Tests
+    marked ``commits`` need their data visible to other connections, so they
+    commit for real and the tables are emptied before and after them.
+    """
+    if request.node.get_closest_marker("commits"):
+        delete_all_rows()
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+            delete_all_rows()
+        return
+
+    # The app's engine, so its query instrumentation sees the test's statements
+    connection = settings.engine.connect()
+    transaction = connection.begin()
+    session_factory = sessionmaker(
+        class_=RoutingSession,
+        replicas=settings.replica_set,
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
+    monkeypatch.setattr(settings, "SessionLocal", session_factory)
+    session = session_factory()
     try:
-        for table in reversed(settings.Base.metadata.sorted_tables):
-            session.execute(table.delete())
-        session.commit()
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -212,3 +282,82 @@ def create_race(db_session):
 def test_race(create_race):
     """Default test race"""
     return create_race()
+
+
+@pytest.fixture
+def create_character(db_session, test_user):
+    """Factory fixture for creating characters with optional game stats"""
+
+    def _create_character(name="Test character", race_id=None, stats=None, **fields):
+        character = Character(name=name, race_id=race_id, created_by_user_id=test_user.id, **fields)
+        db_session.add(character)
+        db_session.commit()
+        db_session.refresh(character)
+
+        if stats is not None:
+            db_session.add(CharacterGameStats(character_id=character.id, **stats))
+            db_session.commit()
+
+        return character
+
+    return _create_character
+
+
+@pytest.fixture
+def create_ability(db_session):
+    """Factory fixture for creating abilities attached to an entity"""
+
+    def _create_ability(entity_type=None, entity_id=None, name="Test ability", category="racial", **fields):
+        ability = Ability(name=name, category=category, **fields)
+        db_session.add(ability)
+        db_session.commit()
+        db_session.refresh(ability)
+
+        if entity_type is not None:
+            db_session.add(EntityAbility(entity_type=entity_type, entity_id=entity_id, ability_id=ability.id))
+            db_session.commit()
+
+        return ability
+
+    return _create_ability
+
+
+@pytest.fixture
+def create_article(db_session, test_user):
+    """Factory fixture for creating articles with tags"""
+
+    def _create_article(title="Test article", status="published", category="история", tags=(), **fields):
+        article = Article(
+            title=title,
+            content="Test content",
+            article_type="история",
+            status=status,
+            category=category,
+            created_by_user_id=test_user.id,
+            **fields,
+        )
+        db_session.add(article)
+        db_session.commit()
+
+        for tag in tags:
+            db_session.add(ArticleTag(article_id=article.id, tag=tag))
+        db_session.commit()
+        db_session.refresh(article)
+
+        return article
+
+    return _create_article
+
+
+@pytest.fixture
+def create_faction(db_session):
+    """Factory fixture for creating factions"""
+
+    def _create_faction(name="Test faction", faction_type="военный_клан", **fields):
+        faction = Faction(name=name, type=faction_type, **fields)
+        db_session.add(faction)
+        db_session.commit()
+        db_session.refresh(faction)
+        return faction
+
+    return _create_faction
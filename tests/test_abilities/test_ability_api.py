@@ -0,0 +1,62 @@
+def test_ability_damage_stats_success(client, create_ability):
+    """Test damage statistics of an ability"""
+    ability = create_ability(name="Fire bolt", damage_dice="2d6+3", damage_type="fire")
+
+    response = client.get(f"/abilities/{ability.id}/stats?include_distribution=true")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ability_id"] == ability.id
+    assert data["expression"] == "2d6+3"
+    assert data["min"] == 5
+    assert data["max"] == 15
+    assert data["mean"] == 10.0
+    assert data["percentiles"]["p50"] == 10
+    assert data["damage_type"] == "fire"
+    assert len(data["distribution"]) == 11
+
+
+def test_ability_damage_stats_not_found(client):
+    """Test damage statistics of a non-existent ability"""
+    response = client.get("/abilities/999/stats")
+
+    assert response.status_code == 404
+    assert "not found" in response.json()["error"]["message"]
+
+
+def test_ability_damage_stats_without_dice(client, create_ability):
+    """Test damage statistics of an ability without damage dice"""
+    ability = create_ability(name="Darkvision")
+
+    response = client.get(f"/abilities/{ability.id}/stats")
+
+    assert response.status_code == 400
+
+
+def test_dice_stats_success(client):
+    """Test statistics of an arbitrary expression"""
+    response = client.get("/abilities/dice/stats", params={"expression": "1d20 + 5"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["expression"] == "1d20+5"
+    assert data["mean"] == 15.5
+    assert data["distribution"] is None
+
+
+def test_dice_stats_invalid_expression(client):
+    """Test statistics of a malformed expression"""
+    response = client.get("/abilities/dice/stats", params={"expression": "2x6"})
+
+    assert response.status_code == 400
+
+
+def test_dice_roll_success(client):
+    """Test rolling an expression many times"""
+    response = client.post("/abilities/dice/roll", json={"expression": "3d6", "count": 1000})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["expression"] == "3d6"
+    assert len(data["rolls"]) == 1000
+    assert all(3 <= roll <= 18 for roll in data["rolls"])
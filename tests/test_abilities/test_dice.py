@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from app.abilities.dice import (
+    distribution_cache_info,
+    get_distribution,
+    parse_dice_expression,
+    roll_dice,
+)
+from app.exceptions.ability_exceptions import InvalidDiceExpressionException
+
+
+@pytest.mark.parametrize(
+    ("expression", "normalized"),
+    [
+        ("2d6+3", "2d6+3"),
+        ("3 + 2D6", "2d6+3"),
+        ("d20", "1d20"),
+        ("1d6 + 1d8 + 1d6 - 1", "1d8+2d6-1"),
+        ("1d4-1d4", "1d4-1d4"),
+        ("5", "5"),
+    ],
+)
+def test_parse_normalizes_expression(expression, normalized):
+    """Test that equivalent expressions share one normalized form"""
+    assert parse_dice_expression(expression).normalized == normalized
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["", "2d", "d", "2d6++3", "2x6", "0d6", "1d0", "101d6", "1d1001", "100d1000", "1d6+" + "9" * 90, "1000000+1"],
+)
+def test_parse_invalid_expression(expression):
+    """Test that malformed or oversized expressions are rejected"""
+    with pytest.raises(InvalidDiceExpressionException):
+        parse_dice_expression(expression)
+
+
+def test_distribution_2d6_plus_3():
+    """Test the exact distribution of 2d6+3"""
+    distribution = get_distribution("2d6+3")
+
+    assert distribution.min_value == 5
+    assert distribution.max_value == 15
+    assert distribution.mean == pytest.approx(10.0)
+    assert distribution.probabilities[5] == pytest.approx(6 / 36)
+    assert distribution.percentile(50) == 10
+    assert distribution.probability_at_least(15) == pytest.approx(1 / 36)
+
+
+def test_distribution_with_subtracted_dice():
+    """Test that subtracted dice produce a symmetric distribution"""
+    distribution = get_distribution("1d4-1d4")
+
+    assert distribution.min_value == -3
+    assert distribution.max_value == 3
+    assert distribution.mean == pytest.approx(0.0)
+    assert distribution.probabilities.sum() == pytest.approx(1.0)
+
+
+def test_distribution_is_memoized_per_normalized_expression():
+    """Test that equivalent expressions hit the same cache entry"""
+    first = get_distribution("4d8 + 2")
+    hits_before = distribution_cache_info().hits
+
+    second = get_distribution("2+4d8")
+
+    assert second is first
+    assert distribution_cache_info().hits == hits_before + 1
+
+
+def test_roll_dice_within_bounds():
+    """Test that batch rolls stay in range and converge to the mean"""
+    rolls = roll_dice("2d6+3", 50_000, rng=np.random.default_rng(1))
+
+    assert rolls.shape == (50_000,)
+    assert rolls.min() >= 5
+    assert rolls.max() <= 15
+    assert rolls.mean() == pytest.approx(10.0, abs=0.1)
+
+
+def test_roll_dice_count_limits():
+    """Test that roll count is validated"""
+    with pytest.raises(InvalidDiceExpressionException):
+        roll_dice("1d6", 0)
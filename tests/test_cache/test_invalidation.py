@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from app.core.invalidation import InvalidationBus, InvalidationEvent
+from app.races.repository import RaceRepository
+from app.settings import settings
+
+
+class RecordingCache:
+    def __init__(self):
+        self.evicted: list[tuple[str, int]] = []
+        self.clears = 0
+
+    def evict(self, table: str, row_id: int) -> None:
+        self.evicted.append((table, row_id))
+
+    def clear(self) -> None:
+        self.clears += 1
+
+
+@pytest.fixture
+def cache():
+    cache = RecordingCache()
+    settings.invalidation_bus.register(cache)
+    yield cache
+    settings.invalidation_bus.unregister(cache)
+
+
+@pytest.fixture
+def other_worker_bus():
+    return InvalidationBus(settings.REDIS_URL, settings.CACHE_INVALIDATION_CHANNEL, reconnect_delay=0.05)
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_event_encoding():
+    """Test that events survive the compact wire format"""
+    event = InvalidationEvent("races", 42, 7)
+    assert event.encode() == "races:42:7"
+    assert InvalidationEvent.decode(b"races:42:7") == event
+
+
+def test_out_of_order_events_are_ignored():
+    """Test that an event older than the newest applied version of a row does not evict again"""
+    bus = InvalidationBus(settings.REDIS_URL, settings.CACHE_INVALIDATION_CHANNEL)
+    cache = RecordingCache()
+    bus.register(cache)
+
+    assert bus.apply(InvalidationEvent("races", 1, 2))
+    assert not bus.apply(InvalidationEvent("races", 1, 1))
+    assert not bus.apply(InvalidationEvent("races", 1, 2))
+    assert bus.apply(InvalidationEvent("races", 2, 1))
+
+    assert cache.evicted == [("races", 1), ("races", 2)]
+
+
+def test_token_detects_changes():
+    """Test that a value read before a change or a flush is not considered current"""
+    bus = InvalidationBus(settings.REDIS_URL, settings.CACHE_INVALIDATION_CHANNEL)
+    bus.connected = True
+    token = bus.token("races", 1)
+    assert bus.is_current("races", 1, token)
+
+    bus.apply(InvalidationEvent("races", 1, 1))
+    assert not bus.is_current("races", 1, token)
+
+    token = bus.token("races", 1)
+    bus.flush()
+    assert not bus.is_current("races", 1, token)
+
+    bus.connected = False
+    assert not bus.is_current("races", 1, bus.token("races", 1))
+
+
+def test_repository_changes_evict_locally(db_session, redis_test, cache):
+    """Test that create, update and delete evict the row from this worker's caches"""
+    repository = RaceRepository(db_session)
+    race = repository.create({"name": "Bus race", "size": "Средний"})
+    repository.update(race, {"description": "Changed"})
+    race_id = race.id
+    repository.delete(race)
+
+    assert cache.evicted.count(("races", race_id)) >= 3
+
+
+@pytest.mark.asyncio
+async def test_other_workers_evict_published_changes(db_session, redis_test, other_worker_bus):
+    """Test that a change published by one worker evicts the row in another worker"""
+    cache = RecordingCache()
+    other_worker_bus.register(cache)
+    listener = other_worker_bus.start()
+    try:
+        await wait_for(lambda: other_worker_bus.connected)
+
+        race = RaceRepository(db_session).create({"name": "Bus race", "size": "Средний"})
+
+        await wait_for(lambda: ("races", race.id) in cache.evicted)
+        assert (
+            other_worker_bus.token("races", race.id).version
+            == settings.invalidation_bus.token("races", race.id).version
+        )
+    finally:
+        await other_worker_bus.stop(listener)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_flushes_local_caches(redis_test, other_worker_bus):
+    """Test that a worker clears its caches when it resubscribes, as it may have missed events"""
+    cache = RecordingCache()
+    other_worker_bus.register(cache)
+    listener = other_worker_bus.start()
+    try:
+        await wait_for(lambda: other_worker_bus.connected)
+        clears = cache.clears
+
+        await redis_test.client_kill_filter(_type="pubsub")
+
+        await wait_for(lambda: cache.clears > clears and other_worker_bus.connected)
+    finally:
+        await other_worker_bus.stop(listener)
@@ -0,0 +1,158 @@
+import time
+
+from prometheus_client import REGISTRY
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import _NOT_FOUND, LRUCache
+from app.core.db_routing import get_routing_target, route_to
+from app.races.repository import RaceRepository
+from app.settings import settings
+
+
+def cache_requests(tier: str, result: str) -> float:
+    labels = {"repository": "RaceRepository", "tier": tier, "result": result}
+    return REGISTRY.get_sample_value("repository_cache_requests_total", labels) or 0.0
+
+
+@pytest.fixture
+def subscribed(redis_test, monkeypatch):
+    """Caches as in a worker subscribed to invalidation events, starting empty"""
+    settings.invalidation_bus.flush()
+    monkeypatch.setattr(settings.invalidation_bus, "connected", True)
+    yield
+    settings.invalidation_bus.flush()
+
+
+@pytest.fixture
+def selects(db_session):
+    captured: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def test_lru_cache_bounds():
+    """Test that the L1 cache drops the least recently used and expired entries"""
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is _NOT_FOUND
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    cache.set("short", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is _NOT_FOUND
+
+
+def test_get_by_id_is_served_from_l1_then_l2(db_session, subscribed, create_race, selects):
+    """Test that repeated reads skip the database, first from L1 and, after L1 is cleared, from Redis"""
+    race_id = create_race(name="Cached race").id
+    db_session.expunge_all()
+    repository = RaceRepository(db_session)
+    l1_hits, l2_hits = cache_requests("l1", "hit"), cache_requests("l2", "hit")
+    selects.clear()
+
+    assert repository.get_by_id(race_id).name == "Cached race"
+    assert len(selects) == 1
+
+    db_session.expunge_all()
+    race = repository.get_by_id(race_id)
+    assert race.name == "Cached race"
+    assert race in db_session
+    assert cache_requests("l1", "hit") == l1_hits + 1
+
+    repository.cache.clear()
+    db_session.expunge_all()
+    assert repository.get_by_id(race_id).created_at == race.created_at
+    assert cache_requests("l2", "hit") == l2_hits + 1
+    assert len(selects) == 1
+
+
+def test_missing_rows_are_cached(db_session, subscribed, selects):
+    """Test that lookups of ids and names that do not exist are cached as well"""
+    repository = RaceRepository(db_session)
+
+    assert repository.get_by_id(987654) is None
+    assert repository.get_by_id(987654) is None
+    assert repository.get_by_name("Nobody") is None
+    assert repository.get_by_name("Nobody") is None
+
+    assert len(selects) == 2
+
+
+def test_changes_invalidate_cached_reads(db_session, subscribed, create_race):
+    """Test that create, update and delete through the repository are visible to the next cached read"""
+    repository = RaceRepository(db_session)
+    race = create_race(name="Old name", is_playable=True)
+    assert repository.get_by_name("New race") is None
+    assert [playable.name for playable in repository.get_playable_races()] == ["Old name"]
+
+    repository.create({"name": "New race", "size": "Средний", "is_playable": True})
+    assert repository.get_by_name("New race") is not None
+    assert sorted(playable.name for playable in repository.get_playable_races()) == ["New race", "Old name"]
+
+    repository.get_by_id(race.id)
+    db_session.expunge_all()
+    cached = repository.get_by_id(race.id)
+    repository.update(cached, {"name": "Renamed"})
+    db_session.expunge_all()
+    assert repository.get_by_id(race.id).name == "Renamed"
+    assert repository.get_by_name("Old name") is None
+
+    repository.delete(repository.get_by_id(race.id))
+    db_session.expunge_all()
+    assert repository.get_by_id(race.id) is None
+    assert [playable.name for playable in repository.get_playable_races()] == ["New race"]
+
+
+def test_cache_loads_from_the_primary(db_session, subscribed):
+    """Test that cache misses are loaded from the primary, even where reads may use a replica"""
+    repository = RaceRepository(db_session)
+    targets = []
+
+    def loader():
+        targets.append(get_routing_target())
+
+    with route_to("replica"):
+        repository.cached_one("routing", loader=loader)
+
+    assert targets == ["primary"]
+
+
+def test_l2_entry_stored_during_publish_is_deleted(db_session, subscribed, create_race, monkeypatch):
+    """Test that an old row a concurrent reader stores between the L2 delete and the publish does not survive"""
+    repository = RaceRepository(db_session)
+    race = create_race(name="Old name")
+    publish = settings.invalidation_bus.publish
+
+    def publish_after_stale_write(table, row_id):
+        repository.cache.l2_set(("row", row_id), repository.cache.encode(repository.cache.dump(race, False)), 300)
+        publish(table, row_id)
+
+    monkeypatch.setattr(settings.invalidation_bus, "publish", publish_after_stale_write)
+    repository.update(race, {"name": "Renamed"})
+
+    assert repository.cache.l2_get(("row", race.id)) is None
+
+
+def test_l1_is_not_used_without_subscription(db_session, redis_test, create_race, selects):
+    """Test that a worker not receiving invalidation events does not store or serve L1 entries"""
+    settings.invalidation_bus.flush()
+    race_id = create_race(name="Uncached race").id
+    repository = RaceRepository(db_session)
+    selects.clear()
+
+    repository.get_by_id(race_id)
+    repository.get_by_id(race_id)
+
+    assert len(repository.cache.l1) == 0
+    assert len(selects) == 2
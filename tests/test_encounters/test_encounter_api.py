@@ -0,0 +1,109 @@
+import pytest
+
+
+def test_simulate_encounter_success(client, test_user_token, create_character, create_ability):
+    """Test simulating an encounter and serving the repeated request from cache"""
+    hero = create_character(
+        name="Hero",
+        stats={"level": 5, "strength": 16, "armor_class": 16, "hit_points_max": 40},
+    )
+    goblin = create_character(name="Goblin", stats={"level": 1, "armor_class": 13, "hit_points_max": 7})
+    create_ability(
+        entity_type="character",
+        entity_id=hero.id,
+        name="Longsword",
+        category="item",
+        damage_dice="1d8+3",
+        attack_type="melee",
+    )
+    payload = {
+        "party": [{"character_id": hero.id}],
+        "enemies": [{"character_id": goblin.id}, {"character_id": goblin.id}],
+        "encounters": 500,
+        "seed": 1,
+    }
+    headers = {"Authorization": f"Bearer {test_user_token.credentials}"}
+
+    response = client.post("/encounters/simulate", json=payload, headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["encounters"] == 500
+    assert data["party_win_rate"] + data["enemy_win_rate"] + data["draw_rate"] == pytest.approx(1.0)
+    assert data["expected_rounds"] >= 1
+    assert data["cached"] is False
+
+    cached_response = client.post("/encounters/simulate", json=payload, headers=headers)
+
+    assert cached_response.status_code == 200
+    assert cached_response.json()["cached"] is True
+    assert cached_response.json()["fingerprint"] == data["fingerprint"]
+
+
+def test_simulate_encounter_missing_stats(client, test_user_token):
+    """Test simulating an encounter with characters without game stats"""
+    response = client.post(
+        "/encounters/simulate",
+        json={"party": [{"character_id": 998}], "enemies": [{"character_id": 999}]},
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_simulate_encounter_requires_auth(client):
+    """Test that simulations require authentication"""
+    response = client.post(
+        "/encounters/simulate",
+        json={"party": [{"character_id": 1}], "enemies": [{"character_id": 2}]},
+    )
+
+    assert response.status_code == 401
+
+
+def test_simulate_encounter_downed_combatant(client, test_user_token, create_character):
+    """Test that a combatant at 0 current hit points starts down instead of at full health"""
+    hero = create_character(name="Hero", stats={"level": 1, "armor_class": 10, "hit_points_max": 5})
+    ogre = create_character(
+        name="Ogre", stats={"level": 10, "strength": 20, "hit_points_max": 200, "hit_points_current": 0}
+    )
+
+    response = client.post(
+        "/encounters/simulate",
+        json={"party": [{"character_id": hero.id}], "enemies": [{"character_id": ogre.id}], "encounters": 100},
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["party_win_rate"] == 1.0
+
+
+def test_simulate_encounter_rejects_large_budget(client, test_user_token):
+    """Test that encounters times combatants is bounded"""
+    response = client.post(
+        "/encounters/simulate",
+        json={
+            "party": [{"character_id": 1}] * 20,
+            "enemies": [{"character_id": 2}] * 50,
+            "encounters": 10_000,
+        },
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_simulate_encounter_skips_invalid_dice(client, test_user_token, create_character, create_ability):
+    """Test that an attached ability with unparseable damage dice is skipped instead of failing the simulation"""
+    hero = create_character(name="Hero", stats={"level": 5, "strength": 16, "hit_points_max": 40})
+    goblin = create_character(name="Goblin", stats={"level": 1, "hit_points_max": 7})
+    create_ability(entity_type="character", entity_id=hero.id, name="Wild magic", damage_dice="a lot of fire")
+    create_ability(entity_type="character", entity_id=hero.id, name="Club", damage_dice="1d4")
+
+    response = client.post(
+        "/encounters/simulate",
+        json={"party": [{"character_id": hero.id}], "enemies": [{"character_id": goblin.id}], "encounters": 100},
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 200
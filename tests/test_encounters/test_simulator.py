@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from app.encounters.services import encounter_fingerprint
+from app.encounters.simulator import Action, Combatant, run_simulation, shutdown_executor, simulate_encounters
+
+FIGHTER = Combatant(armor_class=16, hit_points=30, save_bonuses=(5, 1, 4, 0, 1, 0), actions=(Action("1d8+3", 5),))
+WIZARD = Combatant(
+    armor_class=12,
+    hit_points=20,
+    save_bonuses=(0, 1, 1, 5, 3, 0),
+    actions=(Action("1d4", 2), Action("8d6", save_dc=14, save_ability=1)),
+)
+GOBLIN = Combatant(armor_class=13, hit_points=7, save_bonuses=(-1, 2, 0, 0, -1, -1), actions=(Action("1d6+2", 4),))
+DRAGON = Combatant(armor_class=19, hit_points=250, save_bonuses=(8, 6, 9, 4, 5, 7), actions=(Action("4d10+8", 14),))
+
+
+def test_simulation_outcomes_sum_to_total():
+    """Test that wins, losses and draws cover every encounter"""
+    result = simulate_encounters([FIGHTER, WIZARD], [GOBLIN] * 4, 2000, seed=1)
+
+    assert result.encounters == 2000
+    assert result.party_wins + result.enemy_wins + result.draws == 2000
+    assert result.rounds.shape == (2000,)
+    assert result.rounds.min() >= 1
+
+
+def test_simulation_favours_stronger_side():
+    """Test that a party beats goblins and loses to a dragon"""
+    easy = simulate_encounters([FIGHTER, FIGHTER, WIZARD], [GOBLIN] * 3, 2000, seed=2)
+    deadly = simulate_encounters([FIGHTER, WIZARD], [DRAGON], 2000, seed=2)
+
+    assert easy.party_wins / easy.encounters > 0.9
+    assert deadly.enemy_wins / deadly.encounters > 0.9
+
+
+def test_best_action_uses_highest_expected_damage():
+    """Test that combatants pick their most damaging action"""
+    assert WIZARD.best_action().damage_dice == "8d6"
+
+
+def test_simulation_is_reproducible_with_seed():
+    """Test that the same seed produces identical results"""
+    first = simulate_encounters([FIGHTER], [GOBLIN, GOBLIN], 500, seed=42)
+    second = simulate_encounters([FIGHTER], [GOBLIN, GOBLIN], 500, seed=42)
+
+    assert first.party_wins == second.party_wins
+    assert (first.rounds == second.rounds).all()
+
+
+def test_process_pool_merges_chunks():
+    """Test that a simulation split across worker processes covers every encounter"""
+    try:
+        result = run_simulation([FIGHTER, WIZARD], [GOBLIN] * 4, 8000, seed=3, workers=2)
+    finally:
+        shutdown_executor()
+
+    assert result.encounters == 8000
+    assert result.party_wins + result.enemy_wins + result.draws == 8000
+
+
+def test_fingerprint_depends_on_input():
+    """Test that fingerprints change with combatants, encounter count and seed"""
+    base = encounter_fingerprint([FIGHTER], [GOBLIN], 1000, 1)
+
+    assert base == encounter_fingerprint([FIGHTER], [GOBLIN], 1000, 1)
+    assert base != encounter_fingerprint([WIZARD], [GOBLIN], 1000, 1)
+    assert base != encounter_fingerprint([FIGHTER], [GOBLIN], 1001, 1)
+    assert base != encounter_fingerprint([FIGHTER], [GOBLIN], 1000, 2)
+
+
+@pytest.mark.slow
+def test_benchmark_10k_encounters():
+    """Benchmark 10k simulated 4 vs 8 encounters"""
+    start = time.perf_counter()
+    result = run_simulation([FIGHTER, FIGHTER, WIZARD, FIGHTER], [GOBLIN] * 8, 10_000, seed=5)
+    elapsed = time.perf_counter() - start
+
+    assert result.encounters == 10_000
+    assert elapsed < 5.0, f"10k encounters: {elapsed:.3f}s, mean rounds {result.rounds.mean():.2f}"
@@ -0,0 +1,167 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.db_routing import route_to
+from app.core.filters import Filter
+from app.core.index_audit import load_metadata_indexes
+from app.exceptions.filter_exceptions import InvalidFilterException, UnindexedFilterException
+from app.races.repository import RaceRepository
+from app.settings import settings
+from app.users.repository import UserRepository
+
+RACE_FILTERS = RaceRepository.filters
+
+
+@pytest.fixture
+def races(create_race):
+    create_race(name="Эльфы", size="Средний", is_playable=True)
+    create_race(name="Эльфы_тёмные", size="Средний", is_playable=False, description=None)
+    create_race(name="Эльфийские полукровки", size="Маленький", is_playable=True)
+    create_race(name="Гномы", size="Маленький", is_playable=True)
+    create_race(name="Великаны", size="Гигантский", is_playable=False)
+
+
+def names(repository, filters=None, sort=None):
+    list_query = repository.filters.parse(filters, sort)
+    return [race.name for race in repository.filter_by_fields(list_query)]
+
+
+def test_parse_filters_and_sort():
+    """Test that filters are parsed into typed values and the sort into fields and directions"""
+    list_query = RACE_FILTERS.parse(
+        ["size:in:Малый,Средний", "id:range:10..", "created_at:range:..2024-06-30", "description:is_null:true"],
+        "-name,id",
+    )
+
+    assert list_query.filters == (
+        Filter("size", "in", ("Малый", "Средний")),
+        Filter("id", "range", (10, None)),
+        Filter("created_at", "range", (None, datetime(2024, 6, 30))),
+        Filter("description", "is_null", True),
+    )
+    assert list_query.sort == (("name", True), ("id", False))
+    assert RACE_FILTERS.parse().sort == (("id", False),)
+
+
+@pytest.mark.parametrize(
+    "filters, sort, received",
+    [
+        (["name"], None, "name"),
+        (["hashed_password:eq:x"], None, "hashed_password"),
+        (["size:prefix:Ма"], None, "prefix"),
+        (["id:eq:one"], None, "id:eq:one"),
+        (["id:range:.."], None, "id:range:.."),
+        (["is_playable:eq:maybe"], None, "is_playable:eq:maybe"),
+        (["name:similar:"], None, "name:similar:"),
+        ([], "-description", "description"),
+        (["id:eq:1"] * 11, None, "11"),
+    ],
+)
+def test_parse_rejects_invalid_filters(filters, sort, received):
+    """Test that fields, operators and values outside the whitelist are rejected"""
+    with pytest.raises(InvalidFilterException) as exc_info:
+        RACE_FILTERS.parse(filters, sort)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail["received"] == received
+
+
+@pytest.mark.parametrize("repository", [RaceRepository, UserRepository])
+def test_filter_fields_map_to_model_indexes(repository):
+    """Test that every index named by a filter set exists on its table, leads with the field and has the right type"""
+    filters = repository.filters
+    indexes = {
+        index.name: index
+        for index in load_metadata_indexes(settings.Base.metadata)
+        if index.table == filters.model.__tablename__
+    }
+
+    for name, spec in filters.fields.items():
+        for index_name, method in ((spec.btree, "btree"), (spec.trigram, "gin")):
+            if index_name is not None:
+                assert (indexes[index_name].columns[0], indexes[index_name].method) == (name, method)
+
+
+def test_filter_operators(db_session, races):
+    """Test each operator against the races table"""
+    repository = RaceRepository(db_session)
+
+    assert names(repository, ["name:eq:Гномы"]) == ["Гномы"]
+    assert names(repository, ["size:in:Маленький,Гигантский"], "name") == ["Великаны", "Гномы", "Эльфийские полукровки"]
+    assert names(repository, ["name:prefix:Эльф"], "name") == ["Эльфийские полукровки", "Эльфы", "Эльфы_тёмные"]
+    assert names(repository, ["name:prefix:Эльфы_"]) == ["Эльфы_тёмные"]
+    assert names(repository, ["name:similar:Эльфы"], "name") == ["Эльфы", "Эльфы_тёмные"]
+    assert names(repository, ["description:is_null:true"]) == ["Эльфы_тёмные"]
+    assert names(repository, ["is_playable:eq:false", "size:eq:Средний"]) == ["Эльфы_тёмные"]
+
+
+def test_sort_and_pagination(db_session, races):
+    """Test that pages follow the sort order and the count ignores the page"""
+    repository = RaceRepository(db_session)
+    list_query = RACE_FILTERS.parse(["is_playable:eq:true"], "-size,name")
+
+    first = repository.filter_by_fields(list_query, limit=2)
+    second = repository.filter_by_fields(list_query, skip=2, limit=2)
+
+    assert [race.name for race in first + second] == ["Эльфы", "Гномы", "Эльфийские полукровки"]
+    assert repository.count_by_fields(list_query) == 3
+
+
+def test_unindexed_filters_rejected_on_large_tables(db_session, races, monkeypatch):
+    """Test that filtering or sorting only by unindexed fields is rejected once the table is large"""
+    repository = RaceRepository(db_session)
+    unindexed = RACE_FILTERS.parse(["description:is_null:true"], "-created_at")
+    narrowed = RACE_FILTERS.parse(["description:is_null:true", "name:prefix:Эльф"], "-created_at")
+
+    assert len(repository.filter_by_fields(unindexed)) == 1
+
+    monkeypatch.setattr(RaceRepository, "estimated_count", lambda self: RACE_FILTERS.max_unindexed_rows + 1)
+    with pytest.raises(UnindexedFilterException) as exc_info:
+        repository.filter_by_fields(unindexed)
+
+    assert exc_info.value.detail["received"] == ["created_at", "description"]
+    assert [race.name for race in repository.filter_by_fields(narrowed)] == ["Эльфы_тёмные"]
+    assert len(repository.filter_by_fields(RACE_FILTERS.parse(sort="-name"))) == 5
+
+
+def test_list_by_fields_estimates_once(db_session, races, monkeypatch):
+    """Test that a page and its count check the table size once"""
+    repository = RaceRepository(db_session)
+    calls = []
+    monkeypatch.setattr(RaceRepository, "estimated_count", lambda self: calls.append(1) or 0)
+
+    items, total = repository.list_by_fields(RACE_FILTERS.parse(["description:is_null:false"], "name"), limit=2)
+
+    assert ([race.name for race in items], total) == (["Великаны", "Гномы"], 4)
+    assert len(calls) == 1
+
+
+def test_estimated_count_is_routed_as_a_read(db_session):
+    """Test that the row estimate does not count as a write, which would pin the client to the primary"""
+    session = settings.SessionLocal()
+    try:
+        with route_to("replica"):
+            assert RaceRepository(session).estimated_count() >= 0
+
+        assert not session.info.get("wrote")
+    finally:
+        session.close()
+
+
+def test_races_endpoint_filters(client, races):
+    """Test filtering and sorting the races list through query parameters"""
+    response = client.get("/races", params={"filter": ["name:prefix:Эльф", "is_playable:eq:true"], "sort": "-name"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [race["name"] for race in data["races"]] == ["Эльфы", "Эльфийские полукровки"]
+    assert data["total"] == 2
+
+
+def test_races_endpoint_rejects_unknown_filter(client):
+    """Test that an unknown filter field is a bad request"""
+    response = client.get("/races", params={"filter": "colour:eq:green"})
+
+    assert response.status_code == 400
+    assert "colour" in response.json()["error"]["message"]
@@ -0,0 +1,102 @@
+from contextlib import asynccontextmanager
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+from app.health.schemas import DatabasePoolStats
+from app.health.services import is_pool_exhausted, reset_readiness_cache
+from app.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_readiness_cache():
+    reset_readiness_cache()
+    yield
+    reset_readiness_cache()
+
+
+@asynccontextmanager
+async def unreachable_redis():
+    raise ConnectionError("Error connecting to redis:6379")
+    yield
+
+
+def test_liveness_reports_pool_usage(client: TestClient):
+    """Test that liveness answers without checks and reports pool usage"""
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "alive"
+    assert set(data["database_pool"]) == {"size", "checked_out", "checked_in", "overflow", "max_overflow"}
+    assert data["redis_pool"]["open_clients"] >= 0
+
+
+def test_readiness_checks_dependencies(client: TestClient):
+    """Test that readiness checks the database and Redis"""
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert {name: check["status"] for name, check in data["checks"].items()} == {"database": "ok", "redis": "ok"}
+    assert data["database_pool"]["size"] == settings.engine.pool.size()
+    assert data["redis_pool"]["connected_clients"] >= 1
+    assert data["cached"] is False
+
+
+def test_readiness_result_is_cached(client: TestClient, monkeypatch):
+    """Test that repeated probes reuse the last result instead of checking again"""
+    first = client.get("/health/ready").json()
+
+    monkeypatch.setattr(settings, "get_redis", unreachable_redis)
+    second = client.get("/health/ready")
+
+    assert second.status_code == 200
+    assert second.json()["cached"] is True
+    assert second.json()["checked_at"] == first["checked_at"]
+
+
+def test_readiness_fails_when_redis_is_down(client: TestClient, monkeypatch, caplog):
+    """Test that an unreachable Redis makes the worker not ready, naming the error only in the log"""
+    monkeypatch.setattr(settings, "get_redis", unreachable_redis)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "not_ready"
+    assert data["checks"]["database"]["status"] == "ok"
+    assert data["checks"]["redis"] == {
+        "status": "fail",
+        "latency_ms": data["checks"]["redis"]["latency_ms"],
+        "error": "ConnectionError",
+    }
+    assert "redis:6379" not in response.text
+    assert "ConnectionError: Error connecting to redis:6379" in caplog.text
+
+
+def test_readiness_fails_when_database_times_out(client: TestClient, monkeypatch):
+    """Test that a hanging database check is cut off by the timeout"""
+    monkeypatch.setattr(settings, "HEALTH_CHECK_TIMEOUT", 0.1)
+    monkeypatch.setattr("app.health.services.HealthService._select_one", staticmethod(lambda: time.sleep(0.5)))
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    database = response.json()["checks"]["database"]
+    assert database["status"] == "fail"
+    assert database["error"] == "Timed out after 0.1s"
+    assert database["latency_ms"] < 500
+
+
+@pytest.mark.parametrize(
+    "checked_out, max_overflow, exhausted",
+    [(4, 2, False), (7, 2, True), (7, -1, False), (5, 0, True)],
+)
+def test_pool_exhaustion(checked_out, max_overflow, exhausted):
+    """Test detection of a pool that cannot hand out more connections"""
+    stats = DatabasePoolStats(size=5, checked_out=checked_out, checked_in=0, overflow=0, max_overflow=max_overflow)
+
+    assert is_pool_exhausted(stats) is exhausted
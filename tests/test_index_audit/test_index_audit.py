@@ -0,0 +1,136 @@
+from sqlalchemy import text
+
+from app.core.index_audit import (
+    ForeignKeyInfo,
+    IndexInfo,
+    audit_indexes,
+    find_duplicate_indexes,
+    find_redundant_indexes,
+    find_unindexed_foreign_keys,
+    find_unused_indexes,
+    load_database_foreign_keys,
+    load_database_indexes,
+    load_metadata_foreign_keys,
+    load_metadata_indexes,
+    render_migration,
+)
+from app.settings import settings
+
+PRIMARY_KEY = IndexInfo("spells", "spells_pkey", ("id",), unique=True, constraint=True)
+
+
+def names(findings):
+    return [(finding.kind, finding.index.name) for finding in findings]
+
+
+def test_duplicates_keep_constraint_and_named_indexes():
+    """Test that the generated ix_ copy of an index is dropped and the constraint index is kept"""
+    indexes = [
+        PRIMARY_KEY,
+        IndexInfo("spells", "ix_spells_id", ("id",)),
+        IndexInfo("spells", "idx_spell_school", ("school",)),
+        IndexInfo("spells", "ix_spells_school", ("school",)),
+        IndexInfo("spells", "idx_spell_school_gin", ("school",), method="gin"),
+        IndexInfo("spells", "idx_spell_school_active", ("school",), predicate="active"),
+    ]
+
+    assert names(find_duplicate_indexes(indexes)) == [("duplicate", "ix_spells_id"), ("duplicate", "ix_spells_school")]
+
+
+def test_redundant_prefix_indexes():
+    """Test that a btree index leading a longer one is redundant, unless it is unique or not plain"""
+    indexes = [
+        IndexInfo("spells", "idx_spell_school", ("school",)),
+        IndexInfo("spells", "idx_spell_school_level", ("school", "level")),
+        IndexInfo("spells", "idx_spell_school_level_name", ("school", "level", "name")),
+        IndexInfo("spells", "uq_spell_level", ("level",), unique=True),
+        IndexInfo("spells", "idx_spell_level_name", ("level", "name")),
+        IndexInfo("spells", "idx_spell_lower_name", (None,)),
+        IndexInfo("spells", "idx_spell_name_fts", ("name",), method="gin"),
+        IndexInfo("spells", "idx_spell_name_school", ("name", "school")),
+    ]
+
+    findings = find_redundant_indexes(indexes)
+
+    assert names(findings) == [("redundant", "idx_spell_school"), ("redundant", "idx_spell_school_level")]
+    assert findings[0].reason == "prefix of idx_spell_school_level_name"
+
+
+def test_unused_indexes_keep_foreign_key_indexes():
+    """Test that never scanned indexes are reported unless they are unique or back a foreign key"""
+    indexes = [
+        IndexInfo("spells", "spells_pkey", ("id",), unique=True, constraint=True, scans=0),
+        IndexInfo("spells", "idx_spell_school", ("school",), scans=0),
+        IndexInfo("spells", "idx_spell_level", ("level",), scans=12),
+        IndexInfo("spells", "idx_spell_author", ("author_id",), scans=0),
+    ]
+    foreign_keys = [ForeignKeyInfo("spells", "spells_author_id_fkey", ("author_id",))]
+
+    assert names(find_unused_indexes(indexes, foreign_keys)) == [("unused", "idx_spell_school")]
+
+
+def test_unindexed_foreign_keys():
+    """Test that foreign keys need an index leading with their columns"""
+    indexes = [
+        PRIMARY_KEY,
+        IndexInfo("spells", "idx_spell_school_author", ("school", "author_id")),
+        IndexInfo("spells", "idx_spell_book_page", ("book_id", "page")),
+    ]
+    foreign_keys = [
+        ForeignKeyInfo("spells", "spells_author_id_fkey", ("author_id",)),
+        ForeignKeyInfo("spells", "spells_book_id_fkey", ("book_id",)),
+    ]
+
+    findings = find_unindexed_foreign_keys(indexes, foreign_keys)
+
+    assert names(findings) == [("missing", "idx_spells_author_id")]
+    assert findings[0].action == "create"
+
+
+def test_render_migration_uses_concurrent_statements():
+    """Test that the generated revision builds and drops indexes concurrently outside a transaction"""
+    findings = audit_indexes(
+        [
+            IndexInfo("spells", "idx_spell_school", ("school",)),
+            IndexInfo("spells", "ix_spells_school", ("school",)),
+            IndexInfo("spells", "idx_spell_active", ("school",), predicate="active"),
+        ],
+        [ForeignKeyInfo("spells", "spells_author_id_fkey", ("author_id",))],
+    )
+
+    source = render_migration(findings, "Tune spell indexes", "abc123", "def456")
+
+    compile(source, "migration.py", "exec")
+    assert 'down_revision: Union[str, None] = "def456"' in source
+    assert "with op.get_context().autocommit_block():" in source
+    assert (
+        'op.drop_index("ix_spells_school", table_name="spells", postgresql_concurrently=True, if_exists=True)' in source
+    )
+    assert 'op.create_index("idx_spells_author_id", "spells", ["author_id"], unique=False' in source
+    assert "idx_spell_active" not in source
+
+
+def test_models_have_no_index_findings():
+    """Test that the models declare no duplicate or redundant indexes and index every foreign key"""
+    metadata = settings.Base.metadata
+
+    assert audit_indexes(load_metadata_indexes(metadata), load_metadata_foreign_keys(metadata)) == []
+
+
+def test_database_audit(db_session):
+    """Test that the catalog audit finds duplicates, unused indexes and unindexed foreign keys"""
+    connection = db_session.connection()
+    connection.execute(text("CREATE TABLE audit_spells (id serial PRIMARY KEY, school text, race_id int)"))
+    connection.execute(text("ALTER TABLE audit_spells ADD FOREIGN KEY (race_id) REFERENCES races (id)"))
+    connection.execute(text("CREATE INDEX idx_audit_school ON audit_spells (school)"))
+    connection.execute(text("CREATE INDEX ix_audit_school ON audit_spells (school)"))
+
+    findings = audit_indexes(load_database_indexes(connection), load_database_foreign_keys(connection))
+    spells = [finding for finding in findings if finding.index.table == "audit_spells"]
+
+    assert names(spells) == [
+        ("duplicate", "ix_audit_school"),
+        ("unused", "idx_audit_school"),
+        ("missing", "idx_audit_spells_race_id"),
+    ]
+    assert [finding for finding in findings if finding.kind != "unused" and finding.index.table != "audit_spells"] == []
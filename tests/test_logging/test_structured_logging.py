@@ -0,0 +1,96 @@
+import json
+import logging
+import queue
+
+from fastapi.testclient import TestClient
+
+from app.core.structured_logging import (
+    DeferredQueueHandler,
+    JsonFormatter,
+    bind_request_context,
+    reset_request_context,
+    setup_logging,
+    shutdown_logging,
+    update_request_context,
+)
+from app.main import app
+from app.settings import settings
+
+
+def json_lines(output):
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+
+def test_json_formatter_includes_context_and_extra():
+    """Test that context fields, extra fields and exceptions are serialized"""
+    try:
+        raise ValueError("boom")
+    except ValueError as exc:
+        record = logging.makeLogRecord(
+            {
+                "name": "test",
+                "levelname": "ERROR",
+                "msg": "Failed %s",
+                "args": ("job",),
+                "request_id": "abc",
+                "user_id": None,
+                "query_count": 3,
+                "exc_info": (type(exc), exc, exc.__traceback__),
+            }
+        )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Failed job"
+    assert payload["request_id"] == "abc"
+    assert "user_id" not in payload
+    assert payload["query_count"] == 3
+    assert "ValueError: boom" in payload["exception"]
+
+
+def test_logs_are_written_by_listener_with_request_context(capsys):
+    """Test that records pass through the queue and carry the bound context"""
+    listener = setup_logging("INFO", "json")
+    token = bind_request_context(request_id="req-1", method="GET")
+    try:
+        update_request_context(user_id=42)
+        logging.getLogger("app.test").info("Hello %s", "world", extra={"answer": 42})
+        logging.getLogger("app.test").debug("Not emitted")
+    finally:
+        reset_request_context(token)
+        shutdown_logging(listener)
+
+    records = [line for line in json_lines(capsys.readouterr().out) if line["logger"] == "app.test"]
+    assert len(records) == 1
+    assert records[0]["message"] == "Hello world"
+    assert (records[0]["request_id"], records[0]["user_id"], records[0]["method"]) == ("req-1", 42, "GET")
+    assert records[0]["answer"] == 42
+
+
+def test_queue_handler_defers_formatting_with_arguments_at_call_time():
+    """Test that records are enqueued unformatted, with a copy of mutable arguments as they were when logged"""
+    items = ["sword"]
+    record = logging.makeLogRecord({"msg": "Items %s x%d", "args": (items, 3)})
+
+    prepared = DeferredQueueHandler(queue.SimpleQueue()).prepare(record)
+    items.append("shield")
+
+    assert (prepared.msg, prepared.args[1]) == ("Items %s x%d", 3)
+    assert prepared.getMessage() == "Items ['sword'] x3"
+
+
+def test_request_logs_carry_route_and_user(capsys, monkeypatch, db_session, redis_test, test_admin_token):
+    """Test that logs written while handling a request include its route template and user"""
+    monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+
+    with TestClient(app, base_url="http://testserver/api") as client:
+        response = client.get(
+            "/users/999999",
+            headers={"Authorization": f"Bearer {test_admin_token.credentials}", "X-Request-ID": "req-404"},
+        )
+
+    assert response.status_code == 404
+    records = [line for line in json_lines(capsys.readouterr().out) if line["message"].startswith("HTTP Exception")]
+    assert records[-1]["request_id"] == "req-404"
+    assert records[-1]["route"] == "/api/users/{user_id}"
+    assert records[-1]["user_id"] is not None
@@ -0,0 +1,82 @@
+from prometheus_client import REGISTRY
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.metrics import instrument_engine, record_pool_size
+from app.settings import settings
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint(client):
+    """Test that metrics are exposed in the Prometheus text format"""
+    client.get("/ping/")
+
+    response = client.get("http://testserver/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="/api/ping/",status="200"}' in response.text
+
+
+def test_metrics_use_route_template(client):
+    """Test that requests are labeled by route template instead of raw path"""
+    before = sample("http_requests_total", method="GET", route="/api/races/{race_id}", status="404")
+
+    client.get("/races/999999")
+    client.get("/races/999998")
+
+    after = sample("http_requests_total", method="GET", route="/api/races/{race_id}", status="404")
+    assert after - before == 2
+    assert sample("http_request_duration_seconds_count", method="GET", route="/api/races/999999") == 0
+
+
+def test_metrics_unmatched_route(client):
+    """Test that unknown paths share a single label value"""
+    before = sample("http_requests_total", method="GET", route="unmatched", status="404")
+
+    client.get("/no-such-endpoint")
+
+    assert sample("http_requests_total", method="GET", route="unmatched", status="404") - before == 1
+
+
+@pytest.mark.commits
+def test_metrics_db_pool_checkouts(client, create_race):
+    """Test that database pool checkouts are counted"""
+    race = create_race()
+    before = sample("db_pool_checkouts_total")
+
+    client.get(f"/races/{race.id}")
+
+    assert sample("db_pool_checkouts_total") > before
+    assert sample("db_pool_checked_out") >= 0
+
+
+def test_metrics_db_pool_follow_disposed_pool():
+    """Test that pool metrics keep tracking the new pool after the engine is disposed, as after a worker fork"""
+    engine = create_engine(settings.DATABASE_URL, pool_size=1, max_overflow=2)
+    try:
+        instrument_engine(engine)
+        engine.dispose(close=False)
+        before = sample("db_pool_checkouts_total")
+
+        with engine.connect(), engine.connect():
+            assert sample("db_pool_checkouts_total") - before == 2
+            assert sample("db_pool_overflow") == 1
+        assert sample("db_pool_size") == 1
+    finally:
+        engine.dispose()
+        record_pool_size(settings.engine)
+
+
+@pytest.mark.asyncio
+async def test_metrics_redis_latency(redis_test):
+    """Test that Redis commands are timed by command name"""
+    before = sample("redis_command_duration_seconds_count", command="SET")
+
+    async with settings.get_redis() as redis:
+        await redis.set("metrics-test", "1")
+
+    assert sample("redis_command_duration_seconds_count", command="SET") - before == 1
@@ -0,0 +1,63 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from app.core.profiling import SamplingProfiler
+from app.middleware.profiling import ProfilingMiddleware
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+def test_sampling_profiler_records_busy_threads():
+    """Test that samples of a busy function are collected"""
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    busy_loop(0.1)
+    profiler.stop()
+
+    assert profiler.duration >= 0.1
+    assert any("busy_loop" in frame for stack in profiler.samples for frame in stack)
+
+
+def test_sampling_profiler_output_formats():
+    """Test collapsed stacks and call tree built from the same samples"""
+    profiler = SamplingProfiler()
+    profiler.samples.update({("main", "handler", "query"): 3, ("main", "handler"): 1, ("main", "render"): 2})
+
+    assert profiler.collapsed().splitlines() == ["main;handler 1", "main;handler;query 3", "main;render 2"]
+
+    tree = profiler.call_tree()
+    assert tree["samples"] == 6
+    main = tree["children"][0]
+    assert (main["name"], main["samples"]) == ("main", 6)
+    assert [(child["name"], child["samples"]) for child in main["children"]] == [("handler", 4), ("render", 2)]
+
+
+@pytest.mark.parametrize("sample_rate, profiled", [(1.0, True), (0.0, False)])
+def test_profiling_middleware_sampling(monkeypatch, sample_rate, profiled):
+    """Test that sampled requests are profiled without the header"""
+    saved = []
+
+    async def save_profile(self, profile_id, profiler, method, path, status_code, trigger):
+        saved.append((method, path, status_code, trigger))
+
+    monkeypatch.setattr("app.profiling.services.ProfilingService.save_profile", save_profile)
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, sample_rate=sample_rate)
+
+    @app.get("/work")
+    def work():
+        busy_loop(0.01)
+        return {"ok": True}
+
+    response = TestClient(app).get("/work")
+
+    assert response.status_code == 200
+    assert ("x-profile-id" in response.headers) is profiled
+    assert saved == ([("GET", "/work", 200, "sampled")] if profiled else [])
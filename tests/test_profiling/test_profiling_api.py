@@ -0,0 +1,69 @@
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token.credentials}"}
+
+
+def test_founder_header_profiles_request(client, test_race, test_admin_token):
+    """Test that a founder can profile a request and download the result"""
+    response = client.get(f"/races/{test_race.id}", headers={"X-Profile": "1", **auth(test_admin_token)})
+
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    profiles = client.get("/profiles/", headers=auth(test_admin_token)).json()["profiles"]
+    assert [(p["id"], p["path"], p["status_code"], p["trigger"]) for p in profiles] == [
+        (profile_id, f"/api/races/{test_race.id}", 200, "header")
+    ]
+
+    profile = client.get(f"/profiles/{profile_id}", headers=auth(test_admin_token))
+    assert profile.status_code == 200
+    assert profile.json()["call_tree"]["name"] == "root"
+
+    flamegraph = client.get(f"/profiles/{profile_id}/flamegraph", headers=auth(test_admin_token))
+    assert flamegraph.status_code == 200
+    assert flamegraph.headers["content-disposition"] == f'attachment; filename="profile-{profile_id}.folded"'
+
+
+def test_profile_header_ignored_for_non_founders(client, test_race, test_user_token):
+    """Test that the profiling header has no effect for other users"""
+    response = client.get(f"/races/{test_race.id}", headers={"X-Profile": "1", **auth(test_user_token)})
+
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+
+
+def test_requests_are_not_profiled_by_default(client, test_race):
+    """Test that requests without the header are not profiled"""
+    response = client.get(f"/races/{test_race.id}")
+
+    assert "x-profile-id" not in response.headers
+
+
+def test_profiles_require_founder(client, test_user_token):
+    """Test that only founders can read profiles"""
+    response = client.get("/profiles/", headers=auth(test_user_token))
+
+    assert response.status_code == 403
+
+
+def test_profile_not_found(client, test_admin_token):
+    """Test reading a missing profile"""
+    response = client.get("/profiles/missing", headers=auth(test_admin_token))
+
+    assert response.status_code == 404
+
+
+def test_profile_header_ignored_when_token_check_fails(client, test_race, test_admin_token, monkeypatch):
+    """Test that an error while checking the token leaves the request unprofiled instead of failing it"""
+
+    async def failing_verify_token(credentials, token_type):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr("app.middleware.profiling.verify_token", failing_verify_token)
+
+    response = client.get(f"/races/{test_race.id}", headers={"X-Profile": "1", **auth(test_admin_token)})
+
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
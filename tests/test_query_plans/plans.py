@@ -0,0 +1,116 @@
+"""Query plans of repository methods, checked against rules and stored snapshots.
+
+``capture_plans`` records the SELECT statements a block runs on a connection and
+explains each one with ``EXPLAIN (FORMAT JSON)`` on the same connection, so the
+planner sees the rows the test seeded. ``assert_plan`` checks properties of a
+plan, and ``assert_matches_snapshot`` compares its shape (node types, tables
+and indexes, without the costs and row estimates that vary between runs) with
+``snapshots/<name>.json``.
+
+Set ``QUERY_PLAN_UPDATE_SNAPSHOTS=1`` to write the snapshots of the current
+plans; review the diff like any other change.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+
+SNAPSHOT_DIR = Path(__file__).parent / "snapshots"
+UPDATE_SNAPSHOTS = os.getenv("QUERY_PLAN_UPDATE_SNAPSHOTS") == "1"
+SHAPE_KEYS = {"Node Type": "node", "Relation Name": "relation", "Index Name": "index", "Join Type": "join"}
+
+
+@dataclass
+class QueryPlan:
+    statement: str
+    plan: dict[str, Any]
+
+    @property
+    def total_cost(self) -> float:
+        return self.plan["Total Cost"]
+
+    def nodes(self) -> Iterator[dict[str, Any]]:
+        stack = [self.plan]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.get("Plans", [])))
+
+    def seq_scans(self) -> set[str]:
+        """Tables read with a sequential scan anywhere in the plan."""
+        return {node["Relation Name"] for node in self.nodes() if node["Node Type"] == "Seq Scan"}
+
+    def shape(self) -> dict[str, Any]:
+        def node_shape(node: dict[str, Any]) -> dict[str, Any]:
+            shape = {label: node[key] for key, label in SHAPE_KEYS.items() if key in node}
+            if node.get("Plans"):
+                shape["children"] = [node_shape(child) for child in node["Plans"]]
+            return shape
+
+        return node_shape(self.plan)
+
+
+@contextmanager
+def capture_plans(connection: Connection) -> Iterator[list[QueryPlan]]:
+    """Plans of the SELECT statements run on ``connection`` inside the block, available after it exits."""
+    statements: list[tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    plans: list[QueryPlan] = []
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        yield plans
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+    for statement, parameters in statements:
+        (explained,) = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar_one()
+        plans.append(QueryPlan(statement, explained["Plan"]))
+
+
+def table_rows(connection: Connection, table: str) -> int:
+    """The planner's row estimate for a table, as of its last ANALYZE."""
+    return int(
+        connection.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"), {"table": table}
+        ).scalar_one()
+    )
+
+
+def assert_plan(
+    connection: Connection,
+    plan: QueryPlan,
+    *,
+    no_seq_scan_on: tuple[str, ...] = (),
+    above_rows: int = 1000,
+    max_cost: float | None = None,
+) -> None:
+    """Fail on a sequential scan of a listed table larger than ``above_rows``, or on a cost above ``max_cost``."""
+    for table in sorted(plan.seq_scans() & set(no_seq_scan_on)):
+        rows = table_rows(connection, table)
+        assert rows <= above_rows, f"Seq Scan on {table} ({rows} rows) in:\n{plan.statement}"
+    if max_cost is not None:
+        assert plan.total_cost <= max_cost, f"Estimated cost {plan.total_cost} exceeds {max_cost} in:\n{plan.statement}"
+
+
+def assert_matches_snapshot(name: str, plans: list[QueryPlan]) -> None:
+    """Compare the plan shapes with the stored snapshot, or store them with ``QUERY_PLAN_UPDATE_SNAPSHOTS=1``."""
+    path = SNAPSHOT_DIR / f"{name}.json"
+    shapes = [plan.shape() for plan in plans]
+    if UPDATE_SNAPSHOTS:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        path.write_text(json.dumps(shapes, indent=2, ensure_ascii=False) + "\n")
+        return
+
+    assert path.exists(), f"No plan snapshot {path.name}, run with QUERY_PLAN_UPDATE_SNAPSHOTS=1 to create it"
+    assert shapes == json.loads(path.read_text()), f"Plan of {name} changed, compare with {path.name}"
@@ -0,0 +1,130 @@
+"""Plans of repository queries on a seeded database.
+
+Each test runs a repository method, checks that it does not scan the seeded
+tables sequentially and stays under a cost ceiling, and compares the plan
+with its snapshot. A failing snapshot after a model or query change means the
+query no longer uses the index it was written for.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.races.repository import RaceRepository
+from app.relations.repository import RelationRepository
+from app.settings import settings
+from app.timeline.repository import TimelineRepository
+from app.users.repository import UserRepository
+from tests.conftest import test_engine
+from tests.test_query_plans.plans import assert_matches_snapshot, assert_plan, capture_plans
+
+SEED_ROWS = 5000
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO users (username, email, hashed_password, role, is_2fa_enabled)
+    SELECT 'user ' || n, 'user' || n || '@example.com', 'hash', 'player', false FROM generate_series(1, :rows) AS n
+    """,
+    """
+    INSERT INTO races (name, size, is_playable, created_at, updated_at)
+    SELECT 'Race ' || n, 'Средний', n % 100 = 0, now(), now() FROM generate_series(1, :rows) AS n
+    """,
+    """
+    INSERT INTO characters (name, type, status, birth_year, death_year, race_id, created_by_user_id, created_at, updated_at)
+    SELECT 'Hero ' || n, 'npc', 'alive', n % 1000 + 1, n % 1000 + 60,
+           (SELECT min(id) FROM races) + n % 50, (SELECT min(id) FROM users), now(), now()
+    FROM generate_series(1, :rows) AS n
+    """,
+)
+
+
+def reset_tables():
+    """Truncate every table and refresh its statistics, so no dead pages of earlier tests skew the planner"""
+    tables = ", ".join(table.name for table in settings.Base.metadata.sorted_tables)
+    with test_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        connection.execute(text(f"VACUUM ANALYZE {tables}"))
+
+
+@pytest.fixture(scope="module")
+def seed_database():
+    """SEED_ROWS users, races and characters committed once for the module, vacuumed and analyzed"""
+    reset_tables()
+    with test_engine.begin() as connection:
+        for statement in SEED_STATEMENTS:
+            connection.execute(text(statement), {"rows": SEED_ROWS})
+    with test_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE"))
+    yield
+    reset_tables()
+
+
+@pytest.fixture
+def seeded(seed_database, db_session, redis_test):
+    """The test transaction's connection, which sees the seeded rows"""
+    return db_session.connection()
+
+
+def test_race_by_name_plan(db_session, seeded):
+    """RaceRepository.get_by_name looks the name up in its unique index"""
+    with capture_plans(seeded) as plans:
+        RaceRepository(db_session).get_by_name("Race 4321")
+
+    (plan,) = plans
+    assert_plan(seeded, plan, no_seq_scan_on=("races",), max_cost=20)
+    assert_matches_snapshot("race_by_name", plans)
+
+
+def test_playable_races_plan(db_session, seeded):
+    """RaceRepository.get_playable_races reads the few playable races through the is_playable index"""
+    with capture_plans(seeded) as plans:
+        RaceRepository(db_session).get_playable_races()
+
+    (plan,) = plans
+    assert_plan(seeded, plan, no_seq_scan_on=("races",), max_cost=30)
+    assert_matches_snapshot("playable_races", plans)
+
+
+def test_filtered_races_plan(db_session, seeded):
+    """RaceRepository.filter_by_fields serves a name prefix filter and its count from indexes"""
+    repository = RaceRepository(db_session)
+    list_query = repository.filters.parse(["name:prefix:Race 43"], "name")
+
+    with capture_plans(seeded) as plans:
+        repository.filter_by_fields(list_query, limit=10)
+        repository.count_by_fields(list_query)
+
+    for plan in plans:
+        assert_plan(seeded, plan, no_seq_scan_on=("races",), max_cost=200)
+    assert_matches_snapshot("filtered_races", plans)
+
+
+def test_user_by_email_plan(db_session, seeded):
+    """UserRepository.get_by_email looks the email up in its unique index"""
+    with capture_plans(seeded) as plans:
+        UserRepository(db_session).get_by_email("user2500@example.com")
+
+    (plan,) = plans
+    assert_plan(seeded, plan, no_seq_scan_on=("users",), max_cost=20)
+    assert_matches_snapshot("user_by_email", plans)
+
+
+def test_related_entities_plan(db_session, seeded):
+    """RelationRepository.get_neighbourhood walks two hops through the adjacency index"""
+    character_id = seeded.execute(text("SELECT min(id) FROM characters")).scalar_one()
+
+    with capture_plans(seeded) as plans:
+        RelationRepository(db_session).get_neighbourhood("character", character_id)
+
+    (plan,) = plans
+    assert_plan(seeded, plan, no_seq_scan_on=("entity_relations", "characters", "races", "users"), max_cost=2000)
+    assert_matches_snapshot("related_entities", plans)
+
+
+def test_timeline_plan(db_session, seeded):
+    """TimelineRepository.get_entries finds the characters alive in a year through the GiST range index"""
+    with capture_plans(seeded) as plans:
+        TimelineRepository(db_session).get_entries(500, ["character"])
+
+    (plan,) = plans
+    assert_plan(seeded, plan, no_seq_scan_on=("characters",), max_cost=200)
+    assert_matches_snapshot("timeline_characters", plans)
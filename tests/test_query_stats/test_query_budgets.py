@@ -0,0 +1,75 @@
+"""Query budgets for endpoints, checked against the Server-Timing header.
+
+Raising a budget should be a deliberate decision made in review, not a way to get a test passing.
+"""
+
+import re
+
+import pytest
+
+QUERY_COUNT_PATTERN = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+def query_count(response) -> int:
+    match = QUERY_COUNT_PATTERN.search(response.headers["server-timing"])
+    assert match, response.headers.get("server-timing")
+    return int(match.group(1))
+
+
+@pytest.fixture
+def admin_headers(test_admin_token):
+    return {"Authorization": f"Bearer {test_admin_token.credentials}"}
+
+
+@pytest.fixture
+def races(create_race):
+    return [create_race(name=f"Race {i}") for i in range(10)]
+
+
+def test_list_races_budget(client, races):
+    """GET /races/: one page query and one count"""
+    response = client.get("/races/", params={"size": 10})
+
+    assert response.status_code == 200
+    assert query_count(response) <= 2
+
+
+def test_get_race_budget(client, races):
+    """GET /races/{race_id}: a single lookup"""
+    response = client.get(f"/races/{races[0].id}")
+
+    assert response.status_code == 200
+    assert query_count(response) <= 1
+
+
+def test_update_race_budget(client, races, admin_headers):
+    """POST /races/{race_id}: user lookup, race lookup, name check, UPDATE and refresh"""
+    response = client.post(f"/races/{races[0].id}", json={"name": "Renamed"}, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert query_count(response) <= 5
+
+
+def test_stats_batch_budget(client, create_character, test_user_token):
+    """POST /stats/batch: query count must not grow with the number of characters"""
+    stats = {"level": 1, "strength": 10, "dexterity": 10, "constitution": 10}
+    ids = [create_character(name=f"Hero {i}", stats=stats).id for i in range(20)]
+    headers = {"Authorization": f"Bearer {test_user_token.credentials}"}
+
+    small = client.post("/stats/batch", json={"character_ids": ids[:2]}, headers=headers)
+    large = client.post("/stats/batch", json={"character_ids": ids}, headers=headers)
+
+    assert small.status_code == large.status_code == 200
+    assert query_count(large) == query_count(small)
+    assert query_count(large) <= 3
+
+
+def test_timeline_budget(client, create_character):
+    """GET /timeline/at: one UNION query regardless of entity types"""
+    for i in range(10):
+        create_character(name=f"Hero {i}", birth_year=1000 + i)
+
+    response = client.get("/timeline/at", params={"year": 1100})
+
+    assert response.status_code == 200
+    assert query_count(response) <= 1
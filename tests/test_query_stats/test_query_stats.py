@@ -0,0 +1,51 @@
+from sqlalchemy import text
+
+from app.core.query_stats import get_query_stats, statement_shape, track_queries
+from app.settings import settings
+
+
+def test_statement_shape_collapses_parameters():
+    """Test that statements differing only in parameters share a shape"""
+    first = statement_shape("SELECT * FROM races WHERE races.id = %(id_1)s LIMIT %(param_1)s")
+    second = statement_shape("SELECT *\n  FROM races WHERE races.id = %(id_2)s  LIMIT %(param_1)s")
+
+    assert first == second == "SELECT * FROM races WHERE races.id = ? LIMIT ?"
+
+
+def test_statement_shape_collapses_in_lists():
+    """Test that IN-lists of any length share a shape"""
+    assert statement_shape("SELECT 1 WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)") == statement_shape(
+        "SELECT 1 WHERE id IN (%(id_1_1)s)"
+    )
+
+
+def test_track_queries_detects_repeats(db_session):
+    """Test counting statements and flagging repeated shapes"""
+    with track_queries() as stats, settings.engine.connect() as connection:
+        assert get_query_stats() is stats
+        for race_id in range(5):
+            connection.execute(text("SELECT :race_id"), {"race_id": race_id})
+        connection.execute(text("SELECT 1"))
+
+    assert get_query_stats() is None
+    assert stats.count == 6
+    assert stats.duration > 0
+    assert stats.repeated(5) == {"SELECT ?": 5}
+    assert stats.repeated(6) == {}
+
+
+def test_queries_outside_requests_are_not_tracked(db_session):
+    """Test that the hooks are inactive without a tracking context"""
+    with settings.engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert get_query_stats() is None
+
+
+def test_server_timing_header(client, test_race):
+    """Test that responses report query count and database time"""
+    response = client.get(f"/races/{test_race.id}")
+
+    assert response.status_code == 200
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+    assert response.headers["server-timing"].startswith("db;dur=")
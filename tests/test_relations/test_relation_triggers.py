@@ -0,0 +1,87 @@
+from app.models import ArticleTag, EntityRelation, Location
+
+
+def edges(db_session, entity_type, entity_id):
+    db_session.expire_all()
+    rows = db_session.query(EntityRelation).filter_by(source_type=entity_type, source_id=entity_id).all()
+    return {(row.target_type, row.target_id, row.relation): row.weight for row in rows}
+
+
+def test_foreign_keys_are_linked_both_ways(db_session, create_article, create_character, create_race):
+    """Test that inserting rows with foreign keys adds links in both directions"""
+    race = create_race(name="Elves")
+    character = create_character(name="Aragorn", race_id=race.id)
+    article = create_article(title="War", primary_character_id=character.id, primary_race_id=race.id)
+
+    assert edges(db_session, "article", article.id) == {
+        ("character", character.id, "primary_character"): 1,
+        ("race", race.id, "primary_race"): 1,
+    }
+    assert edges(db_session, "race", race.id) == {
+        ("article", article.id, "primary_race"): 1,
+        ("character", character.id, "race"): 1,
+    }
+
+
+def test_foreign_key_updates_move_links(db_session, create_character, create_race):
+    """Test that changing or clearing a foreign key replaces or removes its link"""
+    elves, dwarves = create_race(name="Elves"), create_race(name="Dwarves")
+    character = create_character(name="Gimli", race_id=elves.id)
+
+    character.race_id = dwarves.id
+    db_session.commit()
+    assert edges(db_session, "character", character.id) == {("race", dwarves.id, "race"): 1}
+    assert edges(db_session, "race", elves.id) == {}
+
+    character.race_id = None
+    db_session.commit()
+    assert edges(db_session, "character", character.id) == {}
+
+
+def test_location_parents_are_linked(db_session):
+    """Test that a location is linked to its parent"""
+    parent = Location(name="Kingdom")
+    db_session.add(parent)
+    db_session.commit()
+    child = Location(name="City", parent_location_id=parent.id)
+    db_session.add(child)
+    db_session.commit()
+
+    assert edges(db_session, "location", child.id) == {("location", parent.id, "parent_location"): 1}
+
+
+def test_shared_tags_are_counted_once_per_tag(db_session, create_article):
+    """Test that articles sharing tags are linked with the number of shared tags, also when tagged together"""
+    first = create_article(title="First", tags=["war", "magic"])
+    second = create_article(title="Second", tags=["war"])
+    third = create_article(title="Third")
+    db_session.add_all([ArticleTag(article_id=second.id, tag="magic"), ArticleTag(article_id=third.id, tag="magic")])
+    db_session.commit()
+
+    assert edges(db_session, "article", first.id) == {
+        ("article", second.id, "shared_tags"): 2,
+        ("article", third.id, "shared_tags"): 1,
+    }
+    assert edges(db_session, "article", third.id) == {
+        ("article", first.id, "shared_tags"): 1,
+        ("article", second.id, "shared_tags"): 1,
+    }
+
+    db_session.query(ArticleTag).filter_by(tag="magic").delete()
+    db_session.commit()
+    assert edges(db_session, "article", first.id) == {("article", second.id, "shared_tags"): 1}
+    assert edges(db_session, "article", third.id) == {}
+
+
+def test_deleting_an_entity_removes_its_links(db_session, create_article, create_character):
+    """Test that deleting an entity removes the links from and to it"""
+    character = create_character(name="Boromir")
+    article = create_article(title="Fall", primary_character_id=character.id, tags=["war"])
+    other = create_article(title="Other", tags=["war"])
+
+    db_session.delete(article)
+    db_session.commit()
+
+    assert edges(db_session, "character", character.id) == {}
+    assert edges(db_session, "article", other.id) == {}
+    assert db_session.query(EntityRelation).count() == 0
@@ -0,0 +1,62 @@
+def test_get_related_entities(client, create_article, create_character, create_race):
+    """Test ranked one- and two-hop neighbours of an article"""
+    race = create_race(name="Elves")
+    character = create_character(name="Legolas", race_id=race.id)
+    article = create_article(title="Battle", primary_character_id=character.id, tags=["war", "elves"])
+    sibling = create_article(title="Siege", tags=["war", "elves"])
+    create_article(title="Draft", status="draft", primary_character_id=character.id)
+
+    response = client.get(f"/relations/article/{article.id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["entity_type"], data["id"]) == ("article", article.id)
+    items = [(item["entity_type"], item["id"], item["depth"]) for item in data["items"]]
+    assert items == [
+        ("article", sibling.id, 1),
+        ("character", character.id, 1),
+        ("race", race.id, 2),
+    ]
+    assert data["items"][0]["score"] == 2.0
+    assert data["items"][0]["name"] == "Siege"
+    assert data["items"][2] == {
+        "entity_type": "race",
+        "id": race.id,
+        "name": "Elves",
+        "depth": 2,
+        "score": 0.25,
+        "relations": ["race"],
+    }
+
+
+def test_get_related_entities_filters(client, create_article, create_character, create_race):
+    """Test limiting depth and entity types"""
+    race = create_race(name="Elves")
+    character = create_character(name="Legolas", race_id=race.id)
+    article = create_article(title="Battle", primary_character_id=character.id)
+
+    one_hop = client.get(f"/relations/article/{article.id}", params={"depth": 1}).json()["items"]
+    assert [item["entity_type"] for item in one_hop] == ["character"]
+
+    races = client.get(f"/relations/article/{article.id}", params={"types": ["race"]}).json()["items"]
+    assert [(item["entity_type"], item["id"]) for item in races] == [("race", race.id)]
+
+
+def test_get_related_entities_unknown_type(client):
+    """Test relations of an unknown entity type"""
+    response = client.get("/relations/spaceship/1")
+
+    assert response.status_code == 400
+
+
+def test_get_related_entities_hides_users(client, test_user, create_character, create_race):
+    """Test that players are neither returned nor traversed, and can not be looked up"""
+    race = create_race(name="Elves")
+    character = create_character(name="Legolas", race_id=race.id, player_user_id=test_user.id)
+    create_character(name="Gimli", player_user_id=test_user.id)
+
+    items = client.get(f"/relations/character/{character.id}").json()["items"]
+
+    assert [(item["entity_type"], item["id"]) for item in items] == [("race", race.id)]
+    assert client.get(f"/relations/user/{test_user.id}").status_code == 400
+    assert client.get(f"/relations/race/{race.id}", params={"types": ["user"]}).status_code == 400
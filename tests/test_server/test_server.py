@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+import socket
+import subprocess  # nosec B404
+import sys
+import time
+
+import httpx
+import pytest
+
+from app.core.server import get_pool_limits
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.parametrize(
+    "max_connections, workers, limits",
+    [(30, 1, (10, 20)), (90, 1, (30, 60)), (90, 4, (7, 15)), (90, 9, (3, 7)), (3, 8, (1, 0))],
+)
+def test_pool_limits_follow_connection_budget(max_connections, workers, limits):
+    """Test that per-worker pools are derived from the instance-wide connection budget"""
+    assert get_pool_limits(max_connections, workers) == limits
+
+
+def test_pool_limits_stay_within_budget():
+    """Test that the workers never hold more connections than the budget allows"""
+    for workers in range(1, 33):
+        pool_size, max_overflow = get_pool_limits(90, workers)
+        assert (pool_size + max_overflow) * workers <= 90
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.slow
+def test_gunicorn_serves_requests_from_preloaded_workers():
+    """Test that the production runner starts forked workers that can reach the database"""
+    port = get_free_port()
+    env = {**os.environ, "STAGE": "test", "PORT": str(port), "WEB_CONCURRENCY": "2"}
+    server = subprocess.Popen(  # nosec B603
+        [sys.executable, "-m", "gunicorn", "app.main:app"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/api/health/ready")
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise
+                time.sleep(0.2)
+
+        assert response.status_code == 200
+        statuses = {httpx.get(f"http://127.0.0.1:{port}/api/ping/").status_code for _ in range(20)}
+        assert statuses == {200}
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
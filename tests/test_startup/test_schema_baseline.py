@@ -0,0 +1,67 @@
+from alembic import command
+from alembic.config import Config
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.schema_baseline import bootstrap_schema, database_objects, schema_drift, seed_admin
+from app.core.schema_check import MIGRATIONS_DIR, get_database_heads, get_expected_heads
+from app.models import User
+from app.settings import settings
+from tests.conftest import drop_database, recreate_database
+
+
+@pytest.fixture
+def scratch_engine(request):
+    """Engine on an empty database of its own, dropped after the test"""
+    name = f"{settings.TEST_DATABASE_NAME}_{request.node.name}"[:63]
+    recreate_database(name)
+    engine = create_engine(settings.get_test_database_url(name))
+    yield engine
+    engine.dispose()
+    drop_database(name)
+
+
+def test_bootstrap_creates_baseline_at_head(scratch_engine):
+    """Test that an empty database gets the schema, the seed and the head revision in one step"""
+    seed = seed_admin("founder@example.com", "founder-password")
+
+    assert bootstrap_schema(scratch_engine, settings.Base.metadata, seed) is True
+
+    assert get_database_heads(scratch_engine) == get_expected_heads()
+    with scratch_engine.connect() as connection:
+        assert schema_drift(connection, settings.Base.metadata) == []
+        admin = connection.execute(User.__table__.select()).one()
+    assert (admin.email, admin.role) == ("founder@example.com", "found_father")
+
+
+def test_bootstrap_leaves_existing_database_to_migrations(scratch_engine):
+    """Test that a database with tables is not bootstrapped again"""
+    bootstrap_schema(scratch_engine, settings.Base.metadata)
+
+    assert bootstrap_schema(scratch_engine, settings.Base.metadata) is False
+
+
+@pytest.mark.slow
+def test_migration_chain_matches_baseline(request, scratch_engine, monkeypatch):
+    """Test that migrating through the whole chain ends at the same schema as the baseline"""
+    chain_name = f"{settings.TEST_DATABASE_NAME}_chain"
+    recreate_database(chain_name)
+    request.addfinalizer(lambda: drop_database(chain_name))
+    monkeypatch.setattr(settings, "DATABASE_URL", settings.get_test_database_url(chain_name))
+    monkeypatch.setattr(settings, "ADMIN_LOGIN", "founder@example.com")
+    monkeypatch.setattr(settings, "ADMIN_PASSWORD", "founder-password")
+    # Without an ini file, so the migrations do not reconfigure logging
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+
+    command.upgrade(config, "head")
+    bootstrap_schema(scratch_engine, settings.Base.metadata)
+
+    chain_engine = create_engine(settings.DATABASE_URL)
+    try:
+        with chain_engine.connect() as chain, scratch_engine.connect() as baseline:
+            assert schema_drift(chain, settings.Base.metadata) == []
+            assert database_objects(chain) == database_objects(baseline)
+            assert chain.execute(text("SELECT count(*) FROM users")).scalar() == 1
+    finally:
+        chain_engine.dispose()
@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+from app.core.query_stats import track_queries
+from app.core.schema_check import (
+    SchemaRevisionMismatchError,
+    get_expected_heads,
+    prepare_schema,
+    reset_schema_verification,
+    verify_schema_revision,
+)
+from app.settings import settings
+
+IMPORT_TIME_BUDGET = float(os.getenv("STARTUP_IMPORT_BUDGET", 3.0))
+LAZY_MODULES = ("uvicorn", "alembic", "multiprocessing")
+
+COLD_IMPORT_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import app.main
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "loaded": [name for name in {LAZY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_schema_verification():
+    reset_schema_verification()
+    yield
+    reset_schema_verification()
+
+
+@pytest.fixture(scope="module")
+def cold_import():
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", COLD_IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "STAGE": "test"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_within_budget(cold_import):
+    """Test that importing the application in a fresh interpreter stays within the cold-start budget"""
+    assert cold_import["seconds"] < IMPORT_TIME_BUDGET
+
+
+def test_optional_modules_are_imported_lazily(cold_import):
+    """Test that modules only needed by rare code paths are not loaded at import"""
+    assert cold_import["loaded"] == []
+
+
+def test_migrations_have_single_head():
+    """Test that the migration history has not diverged"""
+    assert len(get_expected_heads()) == 1
+
+
+def test_verify_rejects_unmigrated_database():
+    """Test that startup fails when the database is not at the expected revision"""
+    with pytest.raises(SchemaRevisionMismatchError) as exc_info:
+        verify_schema_revision(settings.engine)
+
+    assert exc_info.value.current == ()
+    assert exc_info.value.expected == get_expected_heads()
+
+
+def test_verify_mode_checks_revision_once(monkeypatch):
+    """Test that verify mode skips create_all and checks the revision only on the first startup"""
+    calls = []
+
+    def database_heads(engine):
+        calls.append(engine)
+        return get_expected_heads()
+
+    monkeypatch.setattr("app.core.schema_check.get_database_heads", database_heads)
+
+    with track_queries() as stats:
+        prepare_schema(settings.engine, settings.Base.metadata, "verify")
+        prepare_schema(settings.engine, settings.Base.metadata, "verify")
+
+    assert len(calls) == 1
+    assert stats.count == 0
+
+
+def test_unknown_startup_mode():
+    """Test that a misspelled mode is rejected instead of silently skipping the schema"""
+    with pytest.raises(ValueError):
+        prepare_schema(settings.engine, settings.Base.metadata, "create")
@@ -0,0 +1,48 @@
+def test_batch_stats_success(client, test_user_token, create_race, create_character, create_ability):
+    """Test computing stats with character and racial ability modifiers"""
+    race = create_race(name="Stats Race")
+    character = create_character(
+        name="Hero",
+        race_id=race.id,
+        stats={"level": 5, "strength": 14, "dexterity": 12, "wisdom": 13},
+    )
+    create_ability(entity_type="race", entity_id=race.id, name="Racial might", strength_modifier=2)
+    create_ability(entity_type="character", entity_id=character.id, name="Keen eye", wisdom_modifier=1)
+
+    response = client.post(
+        "/stats/batch",
+        json={"character_ids": [character.id, 999]},
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["missing_ids"] == [999]
+    assert len(data["characters"]) == 1
+
+    stats = data["characters"][0]
+    assert stats["character_id"] == character.id
+    assert stats["scores"]["strength"] == 16
+    assert stats["modifiers"]["strength"] == 3
+    assert stats["scores"]["wisdom"] == 14
+    assert stats["proficiency_bonus"] == 3
+    assert stats["initiative"] == 1
+    assert stats["passive_perception"] == 12
+
+
+def test_batch_stats_requires_auth(client):
+    """Test that batch stats require authentication"""
+    response = client.post("/stats/batch", json={"character_ids": [1]})
+
+    assert response.status_code == 401
+
+
+def test_batch_stats_empty_request(client, test_user_token):
+    """Test that an empty ID list is rejected"""
+    response = client.post(
+        "/stats/batch",
+        json={"character_ids": []},
+        headers={"Authorization": f"Bearer {test_user_token.credentials}"},
+    )
+
+    assert response.status_code == 422
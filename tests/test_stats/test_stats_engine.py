@@ -0,0 +1,113 @@
+import time
+
+import numpy as np
+import pytest
+
+from app.stats.engine import (
+    compute_character_stats,
+    compute_party_stats,
+    gather_by_id,
+    resolve_ability_index,
+)
+
+
+def test_modifiers_follow_dnd_table():
+    """Test that modifiers are floor((score - 10) / 2), including odd and low scores"""
+    base = np.array([[1, 8, 9, 10, 11, 30]])
+    result = compute_party_stats(base, np.zeros_like(base), np.array([1]), np.zeros(base.shape, dtype=bool))
+
+    assert result["modifiers"].tolist() == [[-5, -1, -1, 0, 0, 10]]
+
+
+def test_bonuses_are_clamped_to_score_range():
+    """Test that effective scores stay within 1..30"""
+    base = np.array([[28, 2, 10, 10, 10, 10]])
+    bonuses = np.array([[5, -5, 0, 0, 0, 0]])
+    result = compute_party_stats(base, bonuses, np.array([1]), np.zeros(base.shape, dtype=bool))
+
+    assert result["scores"].tolist() == [[30, 1, 10, 10, 10, 10]]
+
+
+def test_proficiency_bonus_by_level():
+    """Test proficiency bonus progression and proficient saving throws"""
+    levels = np.array([1, 4, 5, 9, 13, 17, 20])
+    base = np.full((len(levels), 6), 10)
+    proficient = np.zeros(base.shape, dtype=bool)
+    proficient[:, 0] = True
+
+    result = compute_party_stats(base, np.zeros_like(base), levels, proficient)
+
+    assert result["proficiency_bonus"].tolist() == [2, 2, 3, 4, 5, 6, 6]
+    assert result["saving_throws"][:, 0].tolist() == [2, 2, 3, 4, 5, 6, 6]
+    assert result["saving_throws"][:, 1].tolist() == [0] * len(levels)
+
+
+def test_vectorized_matches_per_character_loop():
+    """Test that the vectorized engine matches the reference implementation"""
+    rng = np.random.default_rng(42)
+    size = 500
+    base = rng.integers(1, 21, size=(size, 6))
+    bonuses = rng.integers(-3, 4, size=(size, 6))
+    levels = rng.integers(1, 21, size=size)
+    proficient = rng.random((size, 6)) > 0.7
+
+    result = compute_party_stats(base, bonuses, levels, proficient)
+
+    for i in range(size):
+        expected = compute_character_stats(
+            base[i].tolist(), bonuses[i].tolist(), int(levels[i]), proficient[i].tolist()
+        )
+        assert result["scores"][i].tolist() == expected["scores"]
+        assert result["saving_throws"][i].tolist() == expected["saving_throws"]
+        assert int(result["proficiency_bonus"][i]) == expected["proficiency_bonus"]
+        assert int(result["passive_perception"][i]) == expected["passive_perception"]
+
+
+def test_gather_by_id_aligns_rows():
+    """Test aligning per-entity totals onto owners, with zeros for unknown IDs"""
+    owners = np.array([3, -1, 1, 3])
+    source_ids = np.array([1, 3])
+    source_values = np.array([[1, 0], [0, 2]])
+
+    result = gather_by_id(owners, source_ids, source_values)
+
+    assert result.tolist() == [[0, 2], [0, 0], [1, 0], [0, 2]]
+
+
+def test_resolve_ability_index_aliases():
+    """Test resolving class primary ability names"""
+    assert resolve_ability_index("Strength") == 0
+    assert resolve_ability_index("wis") == 4
+    assert resolve_ability_index("Харизма") == 5
+    assert resolve_ability_index("unknown") is None
+    assert resolve_ability_index(None) is None
+
+
+@pytest.mark.slow
+def test_benchmark_vectorized_vs_loop_10k():
+    """Benchmark the vectorized engine against a per-character loop at 10k characters"""
+    rng = np.random.default_rng(7)
+    size = 10_000
+    base = rng.integers(1, 21, size=(size, 6))
+    bonuses = rng.integers(-3, 4, size=(size, 6))
+    levels = rng.integers(1, 21, size=size)
+    proficient = rng.random((size, 6)) > 0.7
+
+    start = time.perf_counter()
+    compute_party_stats(base, bonuses, levels, proficient)
+    vectorized_time = time.perf_counter() - start
+
+    base_rows, bonus_rows, level_rows, proficient_rows = (
+        base.tolist(),
+        bonuses.tolist(),
+        levels.tolist(),
+        proficient.tolist(),
+    )
+    start = time.perf_counter()
+    for i in range(size):
+        compute_character_stats(base_rows[i], bonus_rows[i], level_rows[i], proficient_rows[i])
+    loop_time = time.perf_counter() - start
+
+    assert vectorized_time * 5 < loop_time, (
+        f"10k characters: vectorized {vectorized_time * 1000:.2f}ms, loop {loop_time * 1000:.2f}ms"
+    )
@@ -0,0 +1,41 @@
+def test_get_tag_facets(client, create_article):
+    """Test tag facet counts filtered by status"""
+    create_article(title="First", tags=["war", "magic"])
+    create_article(title="Second", tags=["war"])
+    create_article(title="Draft", status="draft", tags=["magic"])
+
+    response = client.get("/tags/facets", params={"status": "published"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "published"
+    assert data["facets"] == [{"tag": "war", "count": 2}, {"tag": "magic", "count": 1}]
+
+
+def test_get_tag_facets_invalid_status(client):
+    """Test tag facets with an unknown status"""
+    response = client.get("/tags/facets", params={"status": "unknown"})
+
+    assert response.status_code == 400
+
+
+def test_get_tag_cloud(client, create_article):
+    """Test tag cloud weights for published articles"""
+    for i in range(4):
+        create_article(title=f"Article {i}", tags=["war"])
+    create_article(title="Rare", tags=["magic"])
+
+    response = client.get("/tags/cloud")
+
+    assert response.status_code == 200
+    tags = response.json()["tags"]
+    assert tags[0] == {"tag": "war", "count": 4, "weight": 5}
+    assert tags[1] == {"tag": "magic", "count": 1, "weight": 1}
+
+
+def test_get_tag_cloud_empty(client):
+    """Test tag cloud without articles"""
+    response = client.get("/tags/cloud")
+
+    assert response.status_code == 200
+    assert response.json()["tags"] == []
@@ -0,0 +1,67 @@
+from app.models import ArticleTag
+from app.tags.repository import TagFacetRepository
+
+
+def counts(db_session, **filters):
+    return {row.tag: row.article_count for row in TagFacetRepository(db_session).get_tag_counts(**filters)}
+
+
+def test_tag_insert_updates_facets(db_session, create_article):
+    """Test that adding tags increments the aggregate"""
+    create_article(title="First", tags=["war", "magic"])
+    create_article(title="Second", tags=["war"])
+
+    assert counts(db_session) == {"war": 2, "magic": 1}
+    assert counts(db_session, status="published", category="история") == {"war": 2, "magic": 1}
+
+
+def test_tag_delete_updates_facets(db_session, create_article):
+    """Test that removing a tag decrements the aggregate and drops empty rows"""
+    article = create_article(tags=["war", "magic"])
+
+    db_session.query(ArticleTag).filter_by(article_id=article.id, tag="magic").delete()
+    db_session.commit()
+
+    assert counts(db_session) == {"war": 1}
+
+
+def test_article_status_change_moves_facets(db_session, create_article):
+    """Test that publishing or archiving an article moves its tags between statuses"""
+    article = create_article(status="draft", tags=["war"])
+    assert counts(db_session, status="published") == {}
+
+    article.status = "published"
+    db_session.commit()
+
+    assert counts(db_session, status="published") == {"war": 1}
+    assert counts(db_session, status="draft") == {}
+
+
+def test_article_category_change_moves_facets(db_session, create_article):
+    """Test that changing an article category moves its tags between categories"""
+    article = create_article(tags=["war"])
+
+    article.category = "магия"
+    db_session.commit()
+
+    assert counts(db_session, category="история") == {}
+    assert counts(db_session, category="магия") == {"war": 1}
+
+
+def test_article_delete_removes_facets(db_session, create_article):
+    """Test that deleting an article (cascading to tags) decrements the aggregate"""
+    article = create_article(tags=["war"])
+    create_article(title="Other", tags=["war"])
+
+    db_session.delete(article)
+    db_session.commit()
+
+    assert counts(db_session) == {"war": 1}
+
+
+def test_facets_without_category(db_session, create_article):
+    """Test that articles without a category are counted under a NULL category"""
+    create_article(category=None, tags=["misc"])
+    create_article(title="Other", category=None, tags=["misc"])
+
+    assert counts(db_session) == {"misc": 2}
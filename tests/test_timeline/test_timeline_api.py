@@ -0,0 +1,81 @@
+from sqlalchemy import text
+
+
+def test_timeline_at_year(client, create_character, create_faction, create_article):
+    """Test entities alive or active in a given year across entity types"""
+    create_character(name="Старец", birth_year=1150, death_year=1210)
+    create_character(name="Живой", birth_year=1190)
+    create_character(name="Потомок", birth_year=1250)
+    create_faction(name="Орден", founded_year=1100, fallen_year=1199)
+    create_faction(name="Дружина", founded_year=1180)
+    create_article(title="Летопись", period_years="[1200,1300]")
+    create_article(title="Черновик", status="draft", period_years="[1200,1300]")
+
+    response = client.get("/timeline/at", params={"year": 1200})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [(item["entity_type"], item["name"]) for item in data["items"]] == [
+        ("character", "Старец"),
+        ("faction", "Дружина"),
+        ("character", "Живой"),
+        ("article", "Летопись"),
+    ]
+    assert data["items"][0]["start_year"] == 1150
+    assert data["items"][0]["end_year"] == 1210
+    assert data["items"][1]["end_year"] is None
+    assert data["next_cursor"] is None
+
+
+def test_timeline_at_inclusive_bounds(client, create_character):
+    """Test that birth and death years are both part of a lifespan"""
+    create_character(name="Краткий", birth_year=1000, death_year=1001)
+
+    assert len(client.get("/timeline/at", params={"year": 1001}).json()["items"]) == 1
+    assert client.get("/timeline/at", params={"year": 1002}).json()["items"] == []
+
+
+def test_timeline_overlapping_with_types(client, create_character, create_faction):
+    """Test interval overlap restricted to selected entity types"""
+    create_character(name="Ранний", birth_year=900, death_year=950)
+    create_character(name="Поздний", birth_year=1040, death_year=1090)
+    create_faction(name="Орден", founded_year=1000)
+
+    response = client.get("/timeline/overlapping", params={"start_year": 950, "end_year": 1040, "types": ["character"]})
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Ранний", "Поздний"]
+
+
+def test_timeline_keyset_pagination(client, create_character):
+    """Test walking all pages with the cursor"""
+    for i in range(5):
+        create_character(name=f"Герой {i}", birth_year=1100 + i // 2)
+
+    names, cursor = [], None
+    while True:
+        params = {"year": 1200, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/timeline/at", params=params).json()
+        names.extend(item["name"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == [f"Герой {i}" for i in range(5)]
+
+
+def test_timeline_invalid_queries(client):
+    """Test validation of interval bounds, entity types and cursors"""
+    assert client.get("/timeline/overlapping", params={"start_year": 10, "end_year": 5}).status_code == 400
+    assert client.get("/timeline/at", params={"year": 10, "types": ["dragon"]}).status_code == 400
+    assert client.get("/timeline/at", params={"year": 10, "cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_timeline_uses_gist_index(db_session):
+    """Test that range predicates are served by the GiST indexes"""
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = db_session.execute(text("EXPLAIN SELECT id FROM characters WHERE lifespan @> 1200")).scalars().all()
+
+    assert any("idx_character_lifespan" in line for line in plan)
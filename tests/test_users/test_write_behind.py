@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from app.core.write_behind import flush_all
+from app.main import app
+from app.models import User
+from app.settings import settings
+from app.users.repository import last_login_buffer
+
+# Flushes write through their own connection, which only sees committed rows
+pytestmark = pytest.mark.commits
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer():
+    last_login_buffer.discard()
+    yield
+    last_login_buffer.discard()
+
+
+@pytest.fixture
+def statements():
+    captured: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(settings.engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(settings.engine, "before_cursor_execute", capture)
+
+
+def stored_last_login(db_session, user: User) -> datetime | None:
+    db_session.expire_all()
+    return db_session.get(User, user.id).last_login
+
+
+def test_login_does_not_write_last_login(client, db_session, test_admin, get_auth_token, statements):
+    """Test that logging in records last_login for the next flush instead of writing it"""
+    get_auth_token(test_admin, "default_password")
+    client.cookies.clear()
+    db_session.refresh(test_admin)
+    last_login_buffer.discard()
+    statements.clear()
+
+    get_auth_token(test_admin, "default_password")
+
+    assert not [statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]
+    assert stored_last_login(db_session, test_admin) is None
+    assert last_login_buffer.pending() == 1
+
+    assert flush_all(settings.engine) == 1
+    assert stored_last_login(db_session, test_admin) is not None
+    assert last_login_buffer.pending() == 0
+
+
+def test_flush_writes_all_rows_in_one_statement(db_session, create_user, statements):
+    """Test that pending values of many rows are written with a single UPDATE"""
+    users = [create_user(username=f"user{i}", email=f"user{i}@example.com") for i in range(3)]
+    login_time = datetime(2025, 1, 1, 12, 0)
+    for offset, user in enumerate(users):
+        last_login_buffer.record(user.id, login_time + timedelta(minutes=offset))
+    statements.clear()
+
+    assert last_login_buffer.flush(settings.engine) == 3
+
+    assert len([statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]) == 1
+    for offset, user in enumerate(users):
+        assert stored_last_login(db_session, user) == login_time + timedelta(minutes=offset)
+
+
+def test_flush_keeps_newest_value(db_session, test_user):
+    """Test that the latest recorded value wins and a flush never moves last_login backwards"""
+    newest = datetime(2025, 1, 1, 12, 0)
+    last_login_buffer.record(test_user.id, newest - timedelta(hours=2))
+    last_login_buffer.record(test_user.id, newest)
+    last_login_buffer.flush(settings.engine)
+    assert stored_last_login(db_session, test_user) == newest
+
+    last_login_buffer.record(test_user.id, newest - timedelta(hours=1))
+    last_login_buffer.flush(settings.engine)
+    assert stored_last_login(db_session, test_user) == newest
+
+
+def test_failed_flush_keeps_pending_values(db_session, test_user, monkeypatch):
+    """Test that values are kept for the next flush when writing them fails"""
+    login_time = datetime(2025, 1, 1, 12, 0)
+    last_login_buffer.record(test_user.id, login_time)
+
+    def fail(*args, **kwargs):
+        raise OperationalError("UPDATE", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(last_login_buffer, "_build_update", fail)
+    with pytest.raises(OperationalError):
+        last_login_buffer.flush(settings.engine)
+    assert last_login_buffer.pending() == 1
+
+    monkeypatch.undo()
+    assert flush_all(settings.engine) == 1
+    assert stored_last_login(db_session, test_user) == login_time
+
+
+def test_shutdown_flushes_pending_values(db_session, redis_test, test_user):
+    """Test that values still pending when the application stops are written on shutdown"""
+    login_time = datetime(2025, 1, 1, 12, 0)
+    with TestClient(app, base_url="http://testserver/api"):
+        last_login_buffer.record(test_user.id, login_time)
+
+    assert last_login_buffer.pending() == 0
+    assert stored_last_login(db_session, test_user) == login_time